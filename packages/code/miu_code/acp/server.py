@@ -1,12 +1,66 @@
 """ACP server for editor integration."""
 
 import asyncio
-import json
 import sys
+from collections import deque
 from typing import Any
 
+import orjson
+
 from miu_code.agent.coding import CodingAgent
 
+MAX_WORKERS = 4
+MAX_PENDING_REQUESTS = 64
+
+
+class _LineReader(asyncio.Protocol):
+    """Read pipe protocol that splits incoming bytes into lines.
+
+    Chunks are kept as-is in a deque and only joined once a newline
+    arrives, avoiding the intermediate buffer copies of StreamReader.
+    """
+
+    def __init__(self) -> None:
+        self._partial: deque[bytes] = deque()
+        self._lines: deque[bytes] = deque()
+        self._ready = asyncio.Event()
+        self._eof = False
+
+    def data_received(self, data: bytes) -> None:
+        start = 0
+        while (end := data.find(b"\n", start)) != -1:
+            self._partial.append(data[start : end + 1])
+            self._lines.append(b"".join(self._partial))
+            self._partial.clear()
+            start = end + 1
+        if start < len(data):
+            self._partial.append(data[start:] if start else data)
+        if self._lines:
+            self._ready.set()
+
+    def eof_received(self) -> bool | None:
+        self._finish()
+        return None
+
+    def connection_lost(self, exc: Exception | None) -> None:
+        self._finish()
+
+    def _finish(self) -> None:
+        if self._partial:
+            self._lines.append(b"".join(self._partial))
+            self._partial.clear()
+        self._eof = True
+        self._ready.set()
+
+    async def readline(self) -> bytes:
+        """Return the next line, or b"" once stdin is closed."""
+        while not self._lines:
+            if self._eof:
+                return b""
+            self._ready.clear()
+            await self._ready.wait()
+        return self._lines.popleft()
+
 
 class ACPServer:
     """Agent Communication Protocol server for editor integration.
@@ -23,6 +77,11 @@ class ACPServer:
         """
         self.model = model
         self._agent: CodingAgent | None = None
+        self._out_buf = bytearray()
+        self._pending_flush: asyncio.Handle | None = None
+        self._inbox: asyncio.Queue[dict[str, Any]] = asyncio.Queue(maxsize=MAX_PENDING_REQUESTS)
+        self._agent_lock = asyncio.Lock()
+        self._tools_cache: dict[str, Any] | None = None
 
     async def run(self) -> None:
         """Run ACP server on stdio."""
@@ -35,25 +94,46 @@ class ACPServer:
         )
 
         # Set up stdin reader
-        loop = asyncio.get_event_loop()
-        reader = asyncio.StreamReader()
-        protocol = asyncio.StreamReaderProtocol(reader)
-        await loop.connect_read_pipe(lambda: protocol, sys.stdin)
+        loop = asyncio.get_running_loop()
+        reader = _LineReader()
+        await loop.connect_read_pipe(lambda: reader, sys.stdin.buffer)
 
-        # Process requests
+        # Dispatch requests to workers so reads are never blocked by a handler
+        workers = [asyncio.create_task(self._worker()) for _ in range(MAX_WORKERS)]
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+
+                try:
+                    request = orjson.loads(line)
+                except orjson.JSONDecodeError:
+                    self._send_error("Invalid JSON", None)
+                    continue
+                if not isinstance(request, dict):
+                    self._send_error("Invalid request", None)
+                    continue
+                await self._inbox.put(request)
+
+            await self._inbox.join()
+        finally:
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            self._flush()
+
+    async def _worker(self) -> None:
+        """Handle queued requests until cancelled."""
         while True:
-            line = await reader.readline()
-            if not line:
-                break
-
+            request = await self._inbox.get()
             try:
-                request = json.loads(line.decode())
                 response = await self._handle(request)
                 self._send_response(response, request.get("id"))
-            except json.JSONDecodeError:
-                self._send_error("Invalid JSON", None)
             except Exception as e:
-                self._send_error(str(e), None)
+                self._send_error(str(e), request.get("id"))
+            finally:
+                self._inbox.task_done()
 
     async def _handle(self, request: dict[str, Any]) -> dict[str, Any]:
         """Handle incoming request.
@@ -102,7 +182,9 @@ class ACPServer:
             return {"error": {"code": -32602, "message": "Missing message parameter"}}
 
         try:
-            response = await self._agent.run(message)
+            # CodingAgent keeps conversation state, so chats run one at a time
+            async with self._agent_lock:
+                response = await self._agent.run(message)
             return {"content": response.get_text()}
         except Exception as e:
             return {"error": {"code": -32603, "message": str(e)}}
@@ -112,8 +194,11 @@ class ACPServer:
         if not self._agent:
             return {"tools": []}
 
-        tools = self._agent.get_tools()
-        return {"tools": [t.to_schema() for t in tools]}
+        # Tools are registered once when the agent is created
+        if self._tools_cache is None:
+            tools = self._agent.get_tools()
+            self._tools_cache = {"tools": [t.to_schema() for t in tools]}
+        return self._tools_cache
 
     def _send_response(self, result: dict[str, Any], request_id: Any) -> None:
         """Send JSON-RPC response."""
@@ -122,7 +207,7 @@ class ACPServer:
             "id": request_id,
             "result": result,
         }
-        print(json.dumps(response), flush=True)
+        self._write(response)
 
     def _send_error(self, message: str, request_id: Any) -> None:
         """Send JSON-RPC error response."""
@@ -131,7 +216,30 @@ class ACPServer:
             "id": request_id,
             "error": {"code": -32603, "message": message},
         }
-        print(json.dumps(response), flush=True)
+        self._write(response)
+
+    def _write(self, message: dict[str, Any]) -> None:
+        """Queue message for stdout.
+
+        Messages produced within the same event loop iteration are
+        coalesced into a single write and flush.
+        """
+        self._out_buf += orjson.dumps(message)
+        self._out_buf += b"\n"
+        if self._pending_flush is None:
+            self._pending_flush = asyncio.get_running_loop().call_soon(self._flush)
+
+    def _flush(self) -> None:
+        """Write buffered messages to stdout."""
+        if self._pending_flush is not None:
+            self._pending_flush.cancel()
+            self._pending_flush = None
+        if not self._out_buf:
+            return
+        out = sys.stdout.buffer
+        out.write(self._out_buf)
+        out.flush()
+        self._out_buf.clear()
 
 
 async def run_acp_server(model: str = "zai:glm-4.7") -> None:
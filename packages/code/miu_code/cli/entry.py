@@ -1,14 +1,16 @@
 """CLI entry point."""
 
-import asyncio
 import os
+from collections.abc import Callable
 
 import asyncclick as click
 from rich.console import Console
 from rich.markdown import Markdown
 
+from miu_code import eventloop
 from miu_code.agent.coding import CodingAgent
 from miu_code.commands import get_default_commands
+from miu_code.session.storage import SessionStorage
 from miu_code.tui.widgets.help_modal import generate_help_markdown
 from miu_core.commands import CommandExecutor, CommandType
 
@@ -58,7 +60,20 @@ async def cli(
         return
 
     working_dir = os.getcwd()
-    agent = CodingAgent(model=model, working_dir=working_dir, session_id=session)
+    agent: CodingAgent | None = None
+
+    def get_agent() -> CodingAgent:
+        """Create the agent on first use so slash-only sessions skip provider setup."""
+        nonlocal agent
+        if agent is None:
+            agent = CodingAgent(model=model, working_dir=working_dir, session_id=session)
+        return agent
+
+    def clear_history() -> None:
+        if agent is not None:
+            agent.clear_history()
+        elif session:
+            SessionStorage(session_id=session).clear()
 
     # Load commands for slash command support
     registry = get_default_commands()
@@ -69,11 +84,33 @@ async def cli(
         expanded = executor.execute(query)
         actual_query = expanded if expanded else query
 
-        response = await agent.run(actual_query)
+        response = await get_agent().run(actual_query)
         text = response.get_text()
         if text:
             console.print(Markdown(text))
     else:
+        help_text: str | None = None
+
+        def show_help() -> None:
+            # Registry is fixed for the session, so render the help text once
+            nonlocal help_text
+            if help_text is None:
+                help_text = generate_help_markdown(registry)
+            console.print(Markdown(help_text))
+
+        def show_model_selector() -> None:
+            console.print("[yellow]/model command - coming soon[/]")
+
+        def clear_conversation() -> None:
+            clear_history()
+            console.print("[dim]Conversation cleared[/]")
+
+        builtin_handlers: dict[str, Callable[[], None]] = {
+            "_show_help": show_help,
+            "_show_model_selector": show_model_selector,
+            "_clear_history": clear_conversation,
+        }
+
         console.print("[bold blue]miu[/] - AI coding agent")
         console.print("Commands: /help, /cook, /commit, /plan, /exit\n")
 
@@ -95,16 +132,11 @@ async def cli(
 
                         if result.command_type == CommandType.BUILTIN:
                             # Handle built-in commands
-                            if result.handler == "_show_help":
-                                help_text = generate_help_markdown(registry)
-                                console.print(Markdown(help_text))
-                            elif result.handler == "_show_model_selector":
-                                console.print("[yellow]/model command - coming soon[/]")
-                            elif result.handler == "_clear_history":
-                                agent.clear_history()
-                                console.print("[dim]Conversation cleared[/]")
-                            elif result.handler == "_exit_app":
+                            if result.handler == "_exit_app":
                                 break
+                            handler = builtin_handlers.get(result.handler or "")
+                            if handler:
+                                handler()
                             continue
                         elif result.command_type == CommandType.TEMPLATE:
                             # Template commands expand to prompts
@@ -115,7 +147,7 @@ async def cli(
                         console.print(f"[red]{e}[/]")
                         continue
 
-                response = await agent.run(user_input)
+                response = await get_agent().run(user_input)
                 text = response.get_text()
                 if text:
                     console.print(Markdown(text))
@@ -141,4 +173,4 @@ async def code(ctx: click.Context) -> None:
 
 def main() -> None:
     """Main entry point."""
-    asyncio.run(cli())
+    eventloop.run(cli())
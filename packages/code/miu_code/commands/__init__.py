@@ -1,5 +1,6 @@
 """Default commands for miu-code."""
 
+from functools import cache
 from pathlib import Path
 
 from miu_core.commands import CommandRegistry
@@ -8,15 +9,21 @@ from miu_core.commands import CommandRegistry
 COMMANDS_DIR = Path(__file__).parent
 
 
+@cache
+def _load_default_commands() -> CommandRegistry:
+    """Parse the default command files once per process."""
+    registry = CommandRegistry()
+    registry.load_from_directory(COMMANDS_DIR)
+    return registry
+
+
 def get_default_commands() -> CommandRegistry:
     """Get registry with default commands loaded.
 
     Returns:
-        CommandRegistry with default commands
+        CommandRegistry with default commands; a fresh copy on each call
     """
-    registry = CommandRegistry()
-    registry.load_from_directory(COMMANDS_DIR)
-    return registry
+    return _load_default_commands().copy()
 
 
 __all__ = ["COMMANDS_DIR", "get_default_commands"]
@@ -0,0 +1,28 @@
+"""Event loop selection for miu-code entry points."""
+
+import asyncio
+import os
+from collections.abc import Callable, Coroutine
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+
+def get_loop_factory() -> Callable[[], asyncio.AbstractEventLoop] | None:
+    """Return uvloop's loop factory if installed, else None for the default loop.
+
+    Set MIU_NO_UVLOOP=1 to force the default asyncio loop, e.g. for debugging.
+    """
+    if os.environ.get("MIU_NO_UVLOOP"):
+        return None
+    try:
+        import uvloop
+    except ImportError:
+        return None
+    return uvloop.new_event_loop
+
+
+def run(main: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine to completion, preferring uvloop when available."""
+    with asyncio.Runner(loop_factory=get_loop_factory()) as runner:
+        return runner.run(main)
@@ -10,13 +10,47 @@ Security Note:
 """
 
 import asyncio
+import contextlib
 import os
+import signal
+import sys
 from pathlib import Path
 
 from pydantic import BaseModel, Field
 
 from miu_core.tools import Tool, ToolContext, ToolResult
 
+# Output beyond this many bytes is dropped and the command is killed
+MAX_OUTPUT_BYTES = 2 * 1024 * 1024
+READ_SIZE = 65536
+
+
+def kill_process_tree(process: asyncio.subprocess.Process) -> None:
+    """Kill the shell along with any commands it spawned."""
+    if sys.platform == "win32":
+        process.kill()
+        return
+    with contextlib.suppress(ProcessLookupError):
+        os.killpg(process.pid, signal.SIGKILL)
+
+
+async def _read_output(process: asyncio.subprocess.Process) -> tuple[bytes, bool]:
+    """Read process output up to MAX_OUTPUT_BYTES.
+
+    Returns:
+        Tuple of (output bytes, whether output was truncated)
+    """
+    assert process.stdout is not None
+    chunks: list[bytes] = []
+    size = 0
+    while chunk := await process.stdout.read(READ_SIZE):
+        chunks.append(chunk)
+        size += len(chunk)
+        if size > MAX_OUTPUT_BYTES:
+            kill_process_tree(process)
+            return b"".join(chunks)[:MAX_OUTPUT_BYTES], True
+    return b"".join(chunks), False
+
 
 class BashInput(BaseModel):
     """Input for bash tool."""
@@ -55,24 +89,22 @@ class BashTool(Tool):
         if not working_dir.exists():
             working_dir = Path.cwd()
 
-        env = os.environ.copy()
-
         try:
             process = await asyncio.create_subprocess_shell(
                 command,
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.STDOUT,
                 cwd=str(working_dir),
-                env=env,
+                # Own process group so children can be killed with the shell
+                start_new_session=sys.platform != "win32",
             )
 
             try:
-                stdout, _ = await asyncio.wait_for(
-                    process.communicate(),
-                    timeout=timeout,
-                )
+                async with asyncio.timeout(timeout):
+                    stdout, truncated = await _read_output(process)
+                    await process.wait()
             except TimeoutError:
-                process.kill()
+                kill_process_tree(process)
                 return ToolResult(
                     output=f"Command timed out after {timeout}s",
                     success=False,
@@ -82,6 +114,13 @@ class BashTool(Tool):
             output = stdout.decode("utf-8", errors="replace")
             exit_code = process.returncode
 
+            if truncated:
+                return ToolResult(
+                    output=f"{output}\n... (output exceeded {MAX_OUTPUT_BYTES} bytes, command killed)",
+                    success=False,
+                    error="Output limit exceeded",
+                )
+
             if exit_code == 0:
                 return ToolResult(output=output or "(no output)")
             else:
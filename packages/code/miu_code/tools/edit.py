@@ -1,11 +1,67 @@
 """Edit file tool."""
 
+import shutil
+import stat
+import tempfile
+from pathlib import Path
+
 from pydantic import BaseModel, Field
 
 from miu_core.tools import Tool, ToolContext, ToolResult
 
+from .fs import stat_or_none
 from .security import PathTraversalError, validate_path
 
+# Leading bytes checked for NUL to detect binary files
+BINARY_SNIFF_BYTES = 4096
+# Single replacements in files larger than this are streamed instead of loaded
+STREAM_THRESHOLD = 4 * 1024 * 1024
+CHUNK_SIZE = 1 << 20
+
+
+def _scan(path: Path, needle: bytes) -> tuple[int, int]:
+    """Count non-overlapping occurrences of needle, reading path in chunks.
+
+    Returns:
+        Tuple of (offset of first occurrence or -1, occurrence count)
+    """
+    first = -1
+    count = 0
+    keep = len(needle) - 1
+    with path.open("rb") as f:
+        buf = b""
+        base = 0  # file offset of buf[0]
+        while chunk := f.read(CHUNK_SIZE):
+            buf += chunk
+            pos = 0
+            while (i := buf.find(needle, pos)) != -1:
+                if first < 0:
+                    first = base + i
+                count += 1
+                pos = i + len(needle)
+            # Carry over a tail that may hold the start of a match
+            cut = max(pos, len(buf) - keep)
+            base += cut
+            buf = buf[cut:]
+    return first, count
+
+
+def _replace_at(path: Path, offset: int, old_len: int, new_b: bytes) -> None:
+    """Replace old_len bytes at offset with new_b, rewriting the file in place.
+
+    The bytes after the match are spooled to an anonymous temp file and
+    written back behind new_b, so the file keeps its inode (and with it
+    hardlinks, ownership, xattrs and ACLs) like the small-file path.
+    """
+    with path.open("r+b") as f, tempfile.TemporaryFile() as tail:
+        f.seek(offset + old_len)
+        shutil.copyfileobj(f, tail, CHUNK_SIZE)
+        tail.seek(0)
+        f.seek(offset)
+        f.write(new_b)
+        shutil.copyfileobj(tail, f, CHUNK_SIZE)
+        f.truncate()
+
 
 class EditInput(BaseModel):
     """Input for edit tool."""
@@ -58,46 +114,66 @@ class EditTool(Tool):
                 error=str(e),
             )
 
-        if not path.exists():
+        st = stat_or_none(path)
+        if st is None:
             return ToolResult(
                 output=f"File not found: {file_path}",
                 success=False,
                 error=f"File does not exist: {file_path}",
             )
 
-        try:
-            content = path.read_text(encoding="utf-8")
-        except UnicodeDecodeError:
+        if not stat.S_ISREG(st.st_mode):
+            return ToolResult(
+                output=f"Not a file: {file_path}",
+                success=False,
+                error=f"Path is not a file: {file_path}",
+            )
+
+        old_b = old_string.encode("utf-8")
+        new_b = new_string.encode("utf-8")
+        if not replace_all and st.st_size > STREAM_THRESHOLD:
+            return self._replace_once_streaming(path, file_path, old_b, new_b)
+
+        raw = path.read_bytes()
+
+        if b"\x00" in raw[:BINARY_SNIFF_BYTES]:
             return ToolResult(
                 output=f"Cannot edit binary file: {file_path}",
                 success=False,
                 error="Binary file",
             )
 
-        if old_string not in content:
+        first = raw.find(old_b)
+        if first == -1 and b"\n" in old_b and b"\r\n" in raw:
+            # Match CRLF files against LF input and keep their line endings
+            old_b = old_b.replace(b"\n", b"\r\n")
+            new_b = new_b.replace(b"\n", b"\r\n")
+            first = raw.find(old_b)
+
+        if first == -1:
             return ToolResult(
                 output=f"String not found in {file_path}",
                 success=False,
                 error="old_string not found in file",
             )
 
-        count = content.count(old_string)
-        if count > 1 and not replace_all:
+        end = first + len(old_b)
+        if replace_all:
+            replaced = raw.count(old_b, first)
+            new_raw = raw.replace(old_b, new_b)
+        elif raw.find(old_b, end) != -1:
+            count = raw.count(old_b, first)
             return ToolResult(
                 output=f"Found {count} occurrences. Set replace_all=True to replace all.",
                 success=False,
                 error=f"Multiple occurrences ({count}) found",
             )
-
-        if replace_all:
-            new_content = content.replace(old_string, new_string)
-            replaced = count
         else:
-            new_content = content.replace(old_string, new_string, 1)
             replaced = 1
+            new_raw = raw[:first] + new_b + raw[end:]
 
         try:
-            path.write_text(new_content, encoding="utf-8")
+            path.write_bytes(new_raw)
             return ToolResult(output=f"Replaced {replaced} occurrence(s) in {file_path}")
         except PermissionError:
             return ToolResult(
@@ -105,3 +181,51 @@ class EditTool(Tool):
                 success=False,
                 error="Permission denied",
             )
+
+    def _replace_once_streaming(
+        self,
+        path: Path,
+        file_path: str,
+        old_b: bytes,
+        new_b: bytes,
+    ) -> ToolResult:
+        """Replace a single occurrence without loading the whole file."""
+        with path.open("rb") as f:
+            head = f.read(BINARY_SNIFF_BYTES)
+        if b"\x00" in head:
+            return ToolResult(
+                output=f"Cannot edit binary file: {file_path}",
+                success=False,
+                error="Binary file",
+            )
+
+        offset, count = _scan(path, old_b)
+        if count == 0 and b"\n" in old_b:
+            # Match CRLF files against LF input and keep their line endings
+            old_b = old_b.replace(b"\n", b"\r\n")
+            new_b = new_b.replace(b"\n", b"\r\n")
+            offset, count = _scan(path, old_b)
+
+        if count == 0:
+            return ToolResult(
+                output=f"String not found in {file_path}",
+                success=False,
+                error="old_string not found in file",
+            )
+
+        if count > 1:
+            return ToolResult(
+                output=f"Found {count} occurrences. Set replace_all=True to replace all.",
+                success=False,
+                error=f"Multiple occurrences ({count}) found",
+            )
+
+        try:
+            _replace_at(path, offset, len(old_b), new_b)
+            return ToolResult(output=f"Replaced 1 occurrence(s) in {file_path}")
+        except PermissionError:
+            return ToolResult(
+                output=f"Permission denied: {file_path}",
+                success=False,
+                error="Permission denied",
+            )
@@ -0,0 +1,19 @@
+"""Filesystem helpers shared by file tools."""
+
+import os
+from pathlib import Path
+
+
+def stat_or_none(path: Path) -> os.stat_result | None:
+    """Stat path with a single syscall.
+
+    Args:
+        path: Path to stat
+
+    Returns:
+        Stat result, or None if the path does not exist
+    """
+    try:
+        return path.stat()
+    except (FileNotFoundError, NotADirectoryError):
+        return None
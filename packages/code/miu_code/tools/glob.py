@@ -1,11 +1,29 @@
 """Glob file pattern tool."""
 
+import asyncio
+import itertools
+from pathlib import Path
+
 from pydantic import BaseModel, Field
 
 from miu_core.tools import Tool, ToolContext, ToolResult
 
+from .fs import stat_or_none
 from .security import PathTraversalError, validate_path
 
+# Stop walking once we have more files than we can show
+MAX_FILES = 100
+
+
+def _find_files(base: Path, pattern: str) -> list[Path]:
+    """Walk base for files matching pattern, stopping past MAX_FILES.
+
+    When more than MAX_FILES match, the result holds whichever files the walk
+    reached first (sorted for display), not the first ones in sorted order.
+    """
+    files = (m for m in base.glob(pattern) if m.is_file())
+    return sorted(itertools.islice(files, MAX_FILES + 1))
+
 
 class GlobInput(BaseModel):
     """Input for glob tool."""
@@ -19,6 +37,7 @@ class GlobTool(Tool):
 
     name = "Glob"
     description = "Find files matching a glob pattern. Use for discovering files by name/extension."
+    read_only = True
 
     def get_input_schema(self) -> type[BaseModel]:
         return GlobInput
@@ -49,7 +68,7 @@ class GlobTool(Tool):
                 error=str(e),
             )
 
-        if not base.exists():
+        if stat_or_none(base) is None:
             return ToolResult(
                 output=f"Directory not found: {base}",
                 success=False,
@@ -57,19 +76,18 @@ class GlobTool(Tool):
             )
 
         try:
-            matches = sorted(base.glob(pattern))
-            matches = [m for m in matches if m.is_file()]
+            # The walk blocks on disk I/O, so keep it off the event loop
+            matches = await asyncio.to_thread(_find_files, base, pattern)
 
             if not matches:
                 return ToolResult(output=f"No files match pattern: {pattern}")
 
-            # Limit output to prevent overwhelming results
-            max_files = 100
-            if len(matches) > max_files:
-                output_lines = [str(m) for m in matches[:max_files]]
-                output_lines.append(f"... and {len(matches) - max_files} more files")
-            else:
-                output_lines = [str(m) for m in matches]
+            output_lines = [str(m) for m in matches[:MAX_FILES]]
+            if len(matches) > MAX_FILES:
+                output_lines.append(
+                    f"... (limited to {MAX_FILES} files: a partial, unordered sample;"
+                    " more files match, narrow the pattern to see them)"
+                )
 
             return ToolResult(output="\n".join(output_lines))
 
@@ -1,13 +1,154 @@
 """Grep search tool."""
 
+import asyncio
 import re
+import stat
+import threading
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Protocol
 
 from pydantic import BaseModel, Field
 
 from miu_core.tools import Tool, ToolContext, ToolResult
 
+from .fs import stat_or_none
 from .security import PathTraversalError, validate_path
 
+try:
+    import re2
+except ImportError:
+    re2 = None
+
+# Leading characters checked for NUL to detect binary files
+BINARY_SNIFF_CHARS = 4096
+# Files larger than this are skipped when searching a directory
+MAX_FILE_SIZE = 5 * 1024 * 1024
+# Files searched per worker thread
+BATCH_SIZE = 64
+
+
+class _Match(Protocol):
+    def start(self) -> int: ...
+    def end(self) -> int: ...
+
+
+class _Regex(Protocol):
+    def search(self, string: str, pos: int = ..., endpos: int = ...) -> _Match | None: ...
+
+
+def _compile(pattern: str) -> _Regex:
+    """Compile pattern in multiline mode with RE2 when available, else re.
+
+    RE2 matches in linear time but lacks backreferences and lookaround,
+    so patterns it rejects are compiled with the stdlib engine instead.
+    """
+    if re2 is not None:
+        options = re2.Options()
+        options.log_errors = False
+        try:
+            compiled: _Regex = re2.compile(f"(?m){pattern}", options=options)
+            return compiled
+        except re2.error:
+            pass
+    return re.compile(pattern, re.MULTILINE)
+
+
+def _search_text(content: str, regex: _Regex) -> Iterator[tuple[int, str]]:
+    """Yield (line number, line) for each line of content with a match.
+
+    The regex runs over the whole buffer; line numbers are derived by
+    counting newlines between successive matching lines. A match spanning
+    a newline is re-checked against its own line, so results stay per line.
+    CRLF and lone CR line endings are treated as newlines.
+    """
+    if "\r" in content:
+        content = content.replace("\r\n", "\n").replace("\r", "\n")
+    pos = 0
+    line_num = 1
+    counted = 0
+    while (m := regex.search(content, pos)) is not None:
+        start = m.start()
+        # A match at the very end belongs to no line (splitlines semantics)
+        if start == len(content) and content[-1:] in ("", "\n"):
+            return
+        line_start = content.rfind("\n", 0, start) + 1
+        line_end = content.find("\n", start)
+        if line_end == -1:
+            line_end = len(content)
+        # A match running past the newline counts only if the line matches alone
+        if m.end() <= line_end or regex.search(content, line_start, line_end) is not None:
+            line_num += content.count("\n", counted, line_start)
+            counted = line_start
+            yield line_num, content[line_start:line_end]
+        # Report each line once: resume at the next line
+        pos = line_end + 1
+        if pos > len(content):
+            return
+
+
+class _MatchLimit:
+    """Per-batch match counts shared by concurrently searched batches.
+
+    A batch may stop once it and the batches before it hold enough matches;
+    later batches never use up the budget, so results stay the first
+    matches in file order.
+    """
+
+    def __init__(self, limit: int, batches: int) -> None:
+        self.limit = limit
+        self._counts = [0] * batches
+        self._lock = threading.Lock()
+
+    def record(self, batch: int) -> None:
+        with self._lock:
+            self._counts[batch] += 1
+
+    def reached(self, batch: int) -> bool:
+        with self._lock:
+            return sum(self._counts[: batch + 1]) >= self.limit
+
+
+def _search_files(
+    files: list[Path],
+    regex: _Regex,
+    max_size: int | None,
+    limit: _MatchLimit,
+    batch: int,
+) -> tuple[list[str], int]:
+    """Search a batch of files, stopping once earlier batches and this one fill the limit.
+
+    Returns:
+        Tuple of (matching lines, number of files skipped for exceeding max_size)
+    """
+    results: list[str] = []
+    skipped = 0
+    for file_path in files:
+        if limit.reached(batch):
+            break
+
+        try:
+            st = file_path.stat()
+            if not stat.S_ISREG(st.st_mode):
+                continue
+            if max_size is not None and st.st_size > max_size:
+                skipped += 1
+                continue
+            with file_path.open(encoding="utf-8", errors="ignore") as f:
+                head = f.read(BINARY_SNIFF_CHARS)
+                if "\x00" in head:
+                    continue
+                content = head + f.read()
+        except (PermissionError, OSError):
+            continue
+
+        for line_num, line in _search_text(content, regex):
+            results.append(f"{file_path}:{line_num}: {line.strip()}")
+            limit.record(batch)
+            if limit.reached(batch):
+                break
+    return results, skipped
+
 
 class GrepInput(BaseModel):
     """Input for grep tool."""
@@ -22,6 +163,7 @@ class GrepTool(Tool):
 
     name = "Grep"
     description = "Search for pattern in files. Use for finding code, strings, etc."
+    read_only = True
 
     def get_input_schema(self) -> type[BaseModel]:
         return GrepInput
@@ -54,7 +196,8 @@ class GrepTool(Tool):
                 error=str(e),
             )
 
-        if not base.exists():
+        base_st = stat_or_none(base)
+        if base_st is None:
             return ToolResult(
                 output=f"Path not found: {base}",
                 success=False,
@@ -62,7 +205,7 @@ class GrepTool(Tool):
             )
 
         try:
-            regex = re.compile(pattern)
+            regex = _compile(pattern)
         except re.error as e:
             return ToolResult(
                 output=f"Invalid regex: {e}",
@@ -70,35 +213,35 @@ class GrepTool(Tool):
                 error=str(e),
             )
 
-        results: list[str] = []
         max_results = 100
 
-        if base.is_file():
+        if stat.S_ISREG(base_st.st_mode):
             files = [base]
+            max_size = None
         else:
+            # Non-files are filtered by the per-file stat in _search_files
             file_pattern = glob or "**/*"
-            files = [f for f in base.glob(file_pattern) if f.is_file()]
-
-        for file_path in files:
-            if len(results) >= max_results:
-                break
-
-            try:
-                content = file_path.read_text(encoding="utf-8", errors="ignore")
-            except (PermissionError, OSError):
-                continue
-
-            for line_num, line in enumerate(content.splitlines(), 1):
-                if regex.search(line):
-                    results.append(f"{file_path}:{line_num}: {line.strip()}")
-                    if len(results) >= max_results:
-                        break
-
-        if not results:
-            return ToolResult(output=f"No matches for pattern: {pattern}")
+            files = await asyncio.to_thread(list, base.glob(file_pattern))
+            max_size = MAX_FILE_SIZE
+
+        # Search batches in worker threads; results keep file order
+        starts = range(0, len(files), BATCH_SIZE)
+        limit = _MatchLimit(max_results, len(starts))
+        batches = await asyncio.gather(
+            *(
+                asyncio.to_thread(
+                    _search_files, files[start : start + BATCH_SIZE], regex, max_size, limit, i
+                )
+                for i, start in enumerate(starts)
+            )
+        )
+        results = [line for lines, _ in batches for line in lines][:max_results]
+        skipped = sum(count for _, count in batches)
 
-        output = "\n".join(results)
+        output = "\n".join(results) if results else f"No matches for pattern: {pattern}"
         if len(results) >= max_results:
             output += f"\n... (limited to {max_results} results)"
+        if skipped:
+            output += f"\n... (skipped {skipped} files over {MAX_FILE_SIZE >> 20} MiB)"
 
         return ToolResult(output=output)
@@ -1,9 +1,13 @@
 """Read file tool."""
 
+import itertools
+import stat
+
 from pydantic import BaseModel, Field
 
 from miu_core.tools import Tool, ToolContext, ToolResult
 
+from .fs import stat_or_none
 from .security import PathTraversalError, validate_path
 
 
@@ -20,6 +24,7 @@ class ReadTool(Tool):
 
     name = "Read"
     description = "Read file contents with line numbers. Use for viewing files."
+    read_only = True
 
     def get_input_schema(self) -> type[BaseModel]:
         return ReadInput
@@ -52,22 +57,29 @@ class ReadTool(Tool):
                 error=str(e),
             )
 
-        if not path.exists():
+        st = stat_or_none(path)
+        if st is None:
             return ToolResult(
                 output=f"File not found: {file_path}",
                 success=False,
                 error=f"File does not exist: {file_path}",
             )
 
-        if not path.is_file():
+        if not stat.S_ISREG(st.st_mode):
             return ToolResult(
                 output=f"Not a file: {file_path}",
                 success=False,
                 error=f"Path is not a file: {file_path}",
             )
 
+        start = (offset - 1) if offset and offset > 0 else 0
+        end = (start + limit) if limit else None
+
+        # Stream only the selected lines instead of splitting the whole file
         try:
-            content = path.read_text(encoding="utf-8")
+            with path.open(encoding="utf-8") as f:
+                lines = (line.removesuffix("\n") for line in itertools.islice(f, start, end))
+                output = "\n".join(f"{i:4d}│{line}" for i, line in enumerate(lines, start + 1))
         except UnicodeDecodeError:
             return ToolResult(
                 output=f"Cannot read binary file: {file_path}",
@@ -75,13 +87,4 @@ class ReadTool(Tool):
                 error="Binary file",
             )
 
-        lines = content.splitlines()
-
-        # Apply offset and limit
-        start = (offset - 1) if offset and offset > 0 else 0
-        end = (start + limit) if limit else len(lines)
-        selected = lines[start:end]
-
-        # Format with line numbers
-        numbered = [f"{i + start + 1:4d}│{line}" for i, line in enumerate(selected)]
-        return ToolResult(output="\n".join(numbered))
+        return ToolResult(output=output)
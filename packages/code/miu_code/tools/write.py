@@ -37,7 +37,7 @@ class WriteTool(Tool):
                 success=False,
                 error="file_path is required",
             )
-        content = str(kwargs.get("content", ""))
+        data = str(kwargs.get("content", "")).encode("utf-8")
 
         try:
             path = validate_path(file_path, ctx.working_dir)
@@ -50,7 +50,7 @@ class WriteTool(Tool):
 
         try:
             path.parent.mkdir(parents=True, exist_ok=True)
-            path.write_text(content, encoding="utf-8")
+            path.write_bytes(data)
             return ToolResult(output=f"Successfully wrote to {file_path}")
         except PermissionError:
             return ToolResult(
@@ -1,21 +1,26 @@
 """Miu Code TUI Application - Vibe Inspired."""
 
 import asyncio
+import contextlib
 import os
+import sys
+from collections.abc import Awaitable, Callable
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, ClassVar
+from typing import TYPE_CHECKING, Any, ClassVar
 
 from textual.app import App, ComposeResult
 from textual.binding import Binding, BindingType
 from textual.containers import Horizontal, VerticalScroll
 from textual.widgets import Static
 
-from miu_code.agent.coding import CodingAgent
+from miu_code import eventloop
 from miu_code.commands import get_default_commands
+from miu_code.tools.bash import kill_process_tree
 from miu_code.tui.widgets.approval import ApprovalApp
 from miu_code.tui.widgets.banner import WelcomeBanner
 from miu_code.tui.widgets.chat import ChatLog
-from miu_code.tui.widgets.chat_input import ChatInputContainer
+from miu_code.tui.widgets.chat_input import ChatInputContainer, InputMode
 from miu_code.tui.widgets.help_modal import HelpModal
 from miu_code.tui.widgets.loading import LoadingSpinner
 from miu_code.tui.widgets.messages import BashOutputMessage
@@ -31,9 +36,33 @@ from miu_core.modes import ModeManager
 from miu_core.paths import MiuPaths
 from miu_core.usage import UsageTracker
 
+if TYPE_CHECKING:
+    from miu_code.agent.coding import CodingAgent
+
 # Version for display
 __version__ = "0.2.0"
 
+# Lines from the end of the chat still treated as scrolled to bottom
+SCROLL_BOTTOM_THRESHOLD = 3
+
+# Timeout in seconds for ! shell commands
+BASH_COMMAND_TIMEOUT = 30
+# Seconds to wait for a killed shell command to exit
+KILL_WAIT_TIMEOUT = 2.0
+
+
+@lru_cache(maxsize=16)
+def _format_path(path: str, home: str) -> str:
+    """Format path for display (shorten home dir)."""
+    if path.startswith(home):
+        return "~" + path[len(home) :]
+    return path
+
+
+def _short_model_name(model: str) -> str:
+    """Extract model name after provider prefix."""
+    return model.split(":")[-1] if ":" in model else model
+
 
 class MiuCodeApp(App[None]):
     """Miu Code Terminal User Interface with Vibe-inspired design."""
@@ -52,6 +81,9 @@ class MiuCodeApp(App[None]):
         Binding("shift+down", "scroll_chat_down", "Scroll Down", show=False, priority=True),
     ]
 
+    # Tools that need approval even in NORMAL mode (lowercase)
+    _DANGEROUS: ClassVar[frozenset[str]] = frozenset({"bash", "write", "edit", "delete"})
+
     def __init__(
         self,
         model: str = "zai:glm-4.7",
@@ -72,120 +104,176 @@ class MiuCodeApp(App[None]):
         self._mode_manager = ModeManager()
         self._usage_tracker = UsageTracker()
         self._working_dir = os.getcwd()
+        self._home = os.path.expanduser("~")
+        self._model_short = _short_model_name(model)
+
+        # Status bar path/model entries never change; only tokens are refreshed
+        self._static_status_elements, self._tokens_index = self._precompute_status_elements()
 
         # Auto-scroll state
         self._auto_scroll = True
+        self._anchor_pending = False
+
+        # Scroll actions coalesced into one scroll per frame
+        self._pending_scroll_delta = 0
+        self._scroll_flush_scheduled = False
+
+        # Last text written to the status widgets, to skip no-op updates
+        self._last_tokens_str: str | None = None
+        self._last_mode_str: str | None = None
 
         # Approval state
         self._pending_approval: asyncio.Future[tuple[bool, str | None]] | None = None
         self._current_bottom_app: str = "input"  # "input", "approval", or "help"
-        self._tools_always_approved: set[str] = set()
+        self._tools_always_approved: set[str] = set()  # lowercase tool names
+
+        # Input history file, resolved on first use
+        self._history_file: Path | None = None
 
         # Command system
         self._command_registry = get_default_commands()
         self._command_executor = CommandExecutor(self._command_registry)
 
+        # Stream event handlers keyed by exact event type
+        self._stream_handlers: dict[type[Any], Callable[[Any], Awaitable[None]]] = {
+            TextDeltaEvent: self._on_text_delta,
+            ToolExecutingEvent: self._on_tool_executing,
+            ToolResultEvent: self._on_tool_result,
+            MessageStopEvent: self._on_message_stop,
+        }
+
+        # Widget references, bound once in on_mount
+        self._chat_scroll: VerticalScroll
+        self._chat_log: ChatLog
+        self._loading: LoadingSpinner
+        self._mode_indicator: Static
+        self._tokens_display: Static | None = None
+        self._input_container: ChatInputContainer
+        self._approval_app: ApprovalApp
+        self._help_modal: HelpModal
+
     def _format_path(self, path: str) -> str:
         """Format path for display (shorten home dir)."""
-        home = os.path.expanduser("~")
-        if path.startswith(home):
-            return "~" + path[len(home) :]
-        return path
+        return _format_path(path, self._home)
 
     def _format_model(self) -> str:
         """Format model name based on config."""
         if self._config.statusbar.model_format == "full":
             return self.model
-        # Short format: extract model name after provider prefix
-        return self.model.split(":")[-1] if ":" in self.model else self.model
+        return self._model_short
 
-    def _build_status_bar_content(self) -> list[tuple[str, str]]:
-        """Build status bar content based on config.
+    def _precompute_status_elements(self) -> tuple[tuple[tuple[str, str], ...], int | None]:
+        """Build the static status bar elements from config.
 
         Returns:
-            List of (element_id, content) tuples in display order.
+            Tuple of ((element_id, content) pairs in display order, position
+            of the tokens element or None if hidden).
         """
         sb = self._config.statusbar
-        elements: list[tuple[str, str]] = []
+        static_content = {
+            "path": self._format_path(self._working_dir),
+            "model": self._format_model(),
+        }
+        shown = {"path": sb.show_path, "model": sb.show_model, "tokens": sb.show_tokens}
 
+        elements: list[tuple[str, str]] = []
+        tokens_index: int | None = None
         for elem in sb.elements:
-            if elem == "path" and sb.show_path:
-                elements.append(("path", self._format_path(self._working_dir)))
-            elif elem == "model" and sb.show_model:
-                elements.append(("model", self._format_model()))
-            elif elem == "tokens" and sb.show_tokens:
-                elements.append(("tokens", self._usage_tracker.format_usage()))
+            if not shown.get(elem, False):
+                continue
+            if elem == "tokens":
+                if tokens_index is None:
+                    tokens_index = len(elements)
+            else:
+                elements.append((elem, static_content[elem]))
+
+        return tuple(elements), tokens_index
 
+    def _build_status_bar_content(self) -> list[tuple[str, str]]:
+        """Build status bar content based on config.
+
+        Returns:
+            List of (element_id, content) tuples in display order.
+        """
+        elements = list(self._static_status_elements)
+        if self._tokens_index is not None:
+            elements.insert(self._tokens_index, ("tokens", self._usage_tracker.format_usage()))
         return elements
 
-    def _is_scrolled_to_bottom(self, scroll_view: VerticalScroll) -> bool:
-        """Check if scroll view is at bottom (with threshold)."""
-        try:
-            threshold = 3
-            return scroll_view.scroll_y >= (scroll_view.max_scroll_y - threshold)
-        except Exception:
-            return True
+    def _is_scrolled_to_bottom(self) -> bool:
+        """Check if chat is at bottom (with threshold)."""
+        chat = self._chat_scroll
+        return chat.scroll_y >= chat.max_scroll_y - SCROLL_BOTTOM_THRESHOLD
 
     def _scroll_to_bottom(self) -> None:
-        """Scroll chat to bottom."""
-        try:
-            chat = self.query_one("#chat", VerticalScroll)
-            chat.scroll_end(animate=False)
-        except Exception:
-            pass
-
-    def _scroll_to_bottom_deferred(self) -> None:
-        """Schedule scroll to bottom after refresh."""
-        self.call_after_refresh(self._scroll_to_bottom)
+        """Re-enable auto-scroll and anchor chat to bottom after refresh."""
+        self._auto_scroll = True
+        self._schedule_anchor()
 
     def _anchor_if_scrollable(self) -> None:
         """Anchor chat to bottom if auto-scroll is enabled."""
         if not self._auto_scroll:
             return
-        try:
-            chat = self.query_one("#chat", VerticalScroll)
-            if chat.max_scroll_y == 0:
-                return
-            chat.anchor()
-        except Exception:
-            pass
+        if self._chat_scroll.max_scroll_y == 0:
+            return
+        self._chat_scroll.anchor()
+
+    def _schedule_anchor(self) -> None:
+        """Schedule at most one pending anchor callback after refresh."""
+        if self._anchor_pending:
+            return
+        self._anchor_pending = True
+        self.call_after_refresh(self._run_scheduled_anchor)
+
+    def _run_scheduled_anchor(self) -> None:
+        """Run the pending anchor callback and allow the next one."""
+        self._anchor_pending = False
+        self._anchor_if_scrollable()
+
+    def _queue_scroll(self, delta: int) -> None:
+        """Accumulate a scroll delta and flush it once after the next refresh."""
+        self._pending_scroll_delta += delta
+        if not self._scroll_flush_scheduled:
+            self._scroll_flush_scheduled = True
+            self.call_after_refresh(self._flush_scroll)
+
+    def _flush_scroll(self) -> None:
+        """Apply the accumulated scroll delta in a single scroll."""
+        delta = self._pending_scroll_delta
+        self._pending_scroll_delta = 0
+        self._scroll_flush_scheduled = False
+        if delta == 0:
+            return
+        self._chat_scroll.scroll_relative(y=delta, animate=False)
+        # Scrolling up disables auto-scroll; reaching the bottom re-enables it
+        if delta < 0:
+            self._auto_scroll = False
+        elif self._is_scrolled_to_bottom():
+            self._auto_scroll = True
 
     def action_scroll_chat_up(self) -> None:
         """Scroll chat up and disable auto-scroll."""
-        try:
-            chat = self.query_one("#chat", VerticalScroll)
-            chat.scroll_relative(y=-5, animate=False)
-            self._auto_scroll = False
-        except Exception:
-            pass
+        self._queue_scroll(-5)
 
     def action_scroll_chat_down(self) -> None:
         """Scroll chat down, re-enable auto-scroll if at bottom."""
-        try:
-            chat = self.query_one("#chat", VerticalScroll)
-            chat.scroll_relative(y=5, animate=False)
-            if self._is_scrolled_to_bottom(chat):
-                self._auto_scroll = True
-        except Exception:
-            pass
+        self._queue_scroll(5)
 
     def compose(self) -> ComposeResult:
         """Create child widgets - Vibe-inspired layout."""
-        # Get short model name for display
-        model_short = self.model.split(":")[-1] if ":" in self.model else self.model
-
         # Chat area (scrollable) - contains banner and messages
         with VerticalScroll(id="chat"):
             # Banner at top (scrolls with content)
             yield WelcomeBanner(
                 version=__version__,
-                model=model_short,
+                model=self._model_short,
                 mcp_count=0,
                 working_dir=self._working_dir,
                 compact=True,
                 id="banner",
             )
-            yield ChatLog(id="messages", scroll_callback=self._scroll_to_bottom_deferred)
+            # ChatLog coalesces its notifications to one per refresh
+            yield ChatLog(id="messages", scroll_callback=self._anchor_if_scrollable)
 
         # Loading area: loading content (left) + mode indicator (right)
         with Horizontal(id="loading-area"):
@@ -193,12 +281,19 @@ class MiuCodeApp(App[None]):
             mode_text = f"{self._mode_manager.label} (shift+tab to cycle)"
             yield Static(mode_text, id="mode-indicator")
 
-        # Bottom app container (for input/approval switching)
+        # Bottom app container: input, approval and help are mounted once and
+        # switched by toggling display
         with Static(id="bottom-app-container"):
             yield ChatInputContainer(
                 history_file=self._get_history_file(),
                 id="input-container",
             )
+            approval_app = ApprovalApp(workdir=self._working_dir)
+            approval_app.display = False
+            yield approval_app
+            help_modal = HelpModal(registry=self._command_registry)
+            help_modal.display = False
+            yield help_modal
 
         # Bottom bar: configurable elements with separator
         with Horizontal(id="bottom-bar"):
@@ -212,18 +307,34 @@ class MiuCodeApp(App[None]):
                 yield Static(content, id=f"{elem_id}-display")
 
     def on_mount(self) -> None:
-        """Initialize agent on mount."""
+        """Bind widget references and initialize agent on mount."""
+        self._chat_scroll = self.query_one("#chat", VerticalScroll)
+        self._chat_log = self.query_one("#messages", ChatLog)
+        self._loading = self.query_one("#loading-area-content", LoadingSpinner)
+        self._mode_indicator = self.query_one("#mode-indicator", Static)
+        tokens = self.query("#tokens-display")
+        # Token display might not exist if hidden in config
+        self._tokens_display = tokens.first(Static) if tokens else None
+        self._input_container = self.query_one("#input-container", ChatInputContainer)
+        self._approval_app = self.query_one("#approval-app", ApprovalApp)
+        self._help_modal = self.query_one("#help-modal", HelpModal)
+
         self._init_agent()
-        self.query_one("#input-container", ChatInputContainer).focus_input()
+        self._input_container.focus_input()
 
     def _get_history_file(self) -> Path:
-        """Get history file path."""
-        paths = MiuPaths.get()
-        paths.ensure_dir(paths.code)
-        return paths.history
+        """Get history file path, creating its directory on first use."""
+        if self._history_file is None:
+            paths = MiuPaths.get()
+            paths.ensure_dir(paths.code)
+            self._history_file = paths.history
+        return self._history_file
 
     def _init_agent(self) -> None:
         """Initialize the coding agent."""
+        # Deferred: the agent pulls in providers and tools
+        from miu_code.agent.coding import CodingAgent
+
         self._agent = CodingAgent(
             model=self.model,
             working_dir=self._working_dir,
@@ -235,31 +346,28 @@ class MiuCodeApp(App[None]):
 
     def _update_status_usage(self) -> None:
         """Update token display in bottom bar."""
-        try:
-            token_display = self.query_one("#tokens-display", Static)
-            token_display.update(self._usage_tracker.format_usage())
-        except Exception:
-            pass  # Element might not exist if hidden in config
+        usage = self._usage_tracker.format_usage()
+        if usage == self._last_tokens_str or self._tokens_display is None:
+            return
+        self._tokens_display.update(usage)
+        self._last_tokens_str = usage
 
     def _update_mode_indicator(self) -> None:
         """Update mode indicator and input border in bottom bar."""
-        mode_indicator = self.query_one("#mode-indicator", Static)
         mode_text = f"{self._mode_manager.label} (shift+tab to cycle)"
-        mode_indicator.update(mode_text)
+        if mode_text == self._last_mode_str:
+            return
+        self._mode_indicator.update(mode_text)
+        self._last_mode_str = mode_text
 
         # Update input border color based on mode
-        try:
-            input_container = self.query_one("#input-container", ChatInputContainer)
-            mode = self._mode_manager.mode
-
-            if mode.name == "ASK":
-                input_container.set_border_style("border-safe")
-            elif mode.name == "NORMAL":
-                input_container.set_border_style("")
-            elif mode.name == "PLAN":
-                input_container.set_border_style("border-warning")
-        except Exception:
-            pass  # Container might not exist during approval
+        mode = self._mode_manager.mode
+        if mode.name == "ASK":
+            self._input_container.set_border_style("border-safe")
+        elif mode.name == "NORMAL":
+            self._input_container.set_border_style("")
+        elif mode.name == "PLAN":
+            self._input_container.set_border_style("border-warning")
 
     async def _show_approval_dialog(
         self,
@@ -268,14 +376,15 @@ class MiuCodeApp(App[None]):
     ) -> tuple[bool, str | None]:
         """Show approval dialog and wait for response."""
         # Check if always approved
-        if tool_name in self._tools_always_approved:
+        if tool_name.lower() in self._tools_always_approved:
             return (True, None)
 
         # Create future for response
-        self._pending_approval = asyncio.get_event_loop().create_future()
+        self._pending_approval = asyncio.get_running_loop().create_future()
 
         # Switch to approval app
-        await self._switch_to_approval_app(tool_name, tool_args)
+        self._approval_app.set_tool(tool_name, tool_args)
+        self._activate_bottom("approval")
 
         # Wait for response
         try:
@@ -284,46 +393,30 @@ class MiuCodeApp(App[None]):
         finally:
             self._pending_approval = None
 
-    async def _switch_to_approval_app(self, tool_name: str, tool_args: dict[str, Any]) -> None:
-        """Switch bottom area to approval dialog."""
-        bottom_container = self.query_one("#bottom-app-container", Static)
-
-        # Remove existing widgets
-        for child in list(bottom_container.children):
-            await child.remove()
+    def _activate_bottom(self, name: str) -> None:
+        """Show one bottom widget ("input", "approval" or "help") and focus it."""
+        self._input_container.display = name == "input"
+        self._approval_app.display = name == "approval"
+        self._help_modal.display = name == "help"
+        self._current_bottom_app = name
 
-        # Mount approval app
-        approval_app = ApprovalApp(
-            tool_name=tool_name,
-            tool_args=tool_args,
-            workdir=self._working_dir,
-        )
-        await bottom_container.mount(approval_app)
-        self._current_bottom_app = "approval"
-        self.call_after_refresh(approval_app.focus)
+        if name == "input":
+            self._input_container.focus_input()
+            return
+        if name == "approval":
+            self.call_after_refresh(self._approval_app.focus)
+        else:
+            self._help_modal.refresh_help()
+            self._help_modal.scroll_to_top()
+            self.call_after_refresh(self._help_modal.focus)
         self._scroll_to_bottom()
 
-    async def _switch_to_input_app(self) -> None:
-        """Switch bottom area back to input."""
-        bottom_container = self.query_one("#bottom-app-container", Static)
-
-        # Remove existing widgets
-        for child in list(bottom_container.children):
-            await child.remove()
-
-        # Mount input container
-        input_container = ChatInputContainer(
-            history_file=self._get_history_file(),
-            id="input-container",
-        )
-        await bottom_container.mount(input_container)
-        self._current_bottom_app = "input"
-        input_container.focus_input()
-
     def _needs_approval(self, tool_name: str) -> bool:
         """Check if tool needs approval based on current mode."""
+        name = tool_name.lower()
+
         # If already approved for session, skip
-        if tool_name in self._tools_always_approved:
+        if name in self._tools_always_approved:
             return False
 
         # In ASK mode, all tools need approval
@@ -331,29 +424,28 @@ class MiuCodeApp(App[None]):
             return True
 
         # Some tools always need approval in NORMAL mode
-        dangerous_tools = {"bash", "write", "edit", "delete"}
-        return tool_name.lower() in dangerous_tools
+        return name in self._DANGEROUS
 
     async def on_approval_app_approval_granted(self, event: ApprovalApp.ApprovalGranted) -> None:
         """Handle approval granted."""
         if self._pending_approval and not self._pending_approval.done():
             self._pending_approval.set_result((True, None))
-        await self._switch_to_input_app()
+        self._activate_bottom("input")
 
     async def on_approval_app_approval_granted_always(
         self, event: ApprovalApp.ApprovalGrantedAlways
     ) -> None:
         """Handle approval with always allow."""
-        self._tools_always_approved.add(event.tool_name)
+        self._tools_always_approved.add(event.tool_name.lower())
         if self._pending_approval and not self._pending_approval.done():
             self._pending_approval.set_result((True, None))
-        await self._switch_to_input_app()
+        self._activate_bottom("input")
 
     async def on_approval_app_approval_rejected(self, event: ApprovalApp.ApprovalRejected) -> None:
         """Handle approval rejected."""
         if self._pending_approval and not self._pending_approval.done():
             self._pending_approval.set_result((False, "User rejected tool execution"))
-        await self._switch_to_input_app()
+        self._activate_bottom("input")
 
     async def on_chat_input_container_submitted(self, event: ChatInputContainer.Submitted) -> None:
         """Handle input submission."""
@@ -362,20 +454,22 @@ class MiuCodeApp(App[None]):
             return
 
         # Clear input immediately (like mistral-vibe)
-        input_container = self.query_one("#input-container", ChatInputContainer)
-        input_container.clear_input()
+        self._input_container.clear_input()
 
         # If agent is running, interrupt it first
         if self._is_processing:
             await self._interrupt_agent()
 
+        # Classify by the leading mode character once
+        mode = InputMode.from_text(value)
+
         # Handle ! prefix for bash
-        if value.startswith("!"):
+        if mode == InputMode.SHELL:
             await self._handle_bash_command(value[1:])
             return
 
         # Handle / prefix for commands (future)
-        if value.startswith("/"):
+        if mode == InputMode.COMMAND:
             await self._handle_command(value)
             return
 
@@ -384,43 +478,49 @@ class MiuCodeApp(App[None]):
 
     async def _handle_bash_command(self, command: str) -> None:
         """Execute bash command and display result."""
-        import subprocess
-
         if not command:
             return
 
-        chat = self.query_one("#messages", ChatLog)
+        chat = self._chat_log
 
         try:
-            result = subprocess.run(
+            process = await asyncio.create_subprocess_shell(
                 command,
-                shell=True,
-                capture_output=True,
-                text=False,
-                timeout=30,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
                 cwd=self._working_dir,
+                # Own process group so children can be killed with the shell
+                start_new_session=sys.platform != "win32",
             )
-            stdout = result.stdout.decode("utf-8", errors="replace") if result.stdout else ""
-            stderr = result.stderr.decode("utf-8", errors="replace") if result.stderr else ""
-            output = stdout or stderr or "(no output)"
+            try:
+                async with asyncio.timeout(BASH_COMMAND_TIMEOUT):
+                    stdout_bytes, stderr_bytes = await process.communicate()
+            except TimeoutError:
+                kill_process_tree(process)
+                with contextlib.suppress(TimeoutError):
+                    await asyncio.wait_for(process.wait(), KILL_WAIT_TIMEOUT)
+                chat.add_error(f"Command timed out: {command}")
+                return
+
+            # Only one stream is shown, so strip and decode just that one
+            raw = stdout_bytes or stderr_bytes
+            output = raw.strip().decode("utf-8", errors="replace") if raw else "(no output)"
 
             bash_msg = BashOutputMessage(
                 command=command,
                 cwd=self._working_dir,
-                output=output.strip(),
-                exit_code=result.returncode,
+                output=output,
+                exit_code=process.returncode or 0,
             )
             chat.mount(bash_msg)
-            self._scroll_to_bottom_deferred()
+            self._schedule_anchor()
 
-        except subprocess.TimeoutExpired:
-            chat.add_error(f"Command timed out: {command}")
         except Exception as e:
             chat.add_error(f"Command failed: {e}")
 
     async def _handle_command(self, command: str) -> None:
         """Handle slash commands."""
-        chat = self.query_one("#messages", ChatLog)
+        chat = self._chat_log
 
         try:
             result = self._command_executor.resolve(command)
@@ -450,56 +550,35 @@ class MiuCodeApp(App[None]):
 
     async def _show_help(self) -> None:
         """Show help modal overlay."""
-        await self._switch_to_help_modal()
+        self._activate_bottom("help")
 
     def _clear_history(self) -> None:
         """Clear conversation history."""
-        chat = self.query_one("#messages", ChatLog)
+        chat = self._chat_log
         chat.clear()
         if self._agent:
             self._agent.clear_history()
         chat.add_system_message("Conversation cleared")
 
-    async def _switch_to_help_modal(self) -> None:
-        """Switch bottom area to help modal."""
-        bottom_container = self.query_one("#bottom-app-container", Static)
-
-        # Remove existing widgets
-        for child in list(bottom_container.children):
-            await child.remove()
-
-        # Mount help modal
-        help_modal = HelpModal(registry=self._command_registry)
-        await bottom_container.mount(help_modal)
-        self._current_bottom_app = "help"
-        self.call_after_refresh(help_modal.focus)
-        self._scroll_to_bottom()
-
     async def on_help_modal_closed(self, event: HelpModal.Closed) -> None:
         """Handle help modal close."""
-        await self._switch_to_input_app()
+        self._activate_bottom("input")
 
     async def _handle_user_message(self, query: str) -> None:
         """Handle regular user message with streaming."""
-        chat = self.query_one("#messages", ChatLog)
-
-        # Check if at bottom before adding message
-        chat_scroll = self.query_one("#chat", VerticalScroll)
-        if self._is_scrolled_to_bottom(chat_scroll):
-            self._auto_scroll = True
+        chat = self._chat_log
 
         chat.add_user_message(query)
 
-        # Scroll after user message
-        self._scroll_to_bottom_deferred()
-        self.call_after_refresh(self._anchor_if_scrollable)
+        # Sending a message follows the chat to the bottom again
+        self._scroll_to_bottom()
 
         if not self._agent:
             chat.add_error("Agent not initialized")
             return
 
         # Start loading animation
-        loading = self.query_one("#loading-area-content", LoadingSpinner)
+        loading = self._loading
         loading.start()
         self._is_processing = True
         self._interrupt_requested = False
@@ -507,45 +586,35 @@ class MiuCodeApp(App[None]):
         try:
             # Use streaming for real-time response
             await chat.start_streaming()
-            chat_scroll = self.query_one("#chat", VerticalScroll)
 
             # Check if at bottom before streaming starts - enable auto-scroll
-            if self._is_scrolled_to_bottom(chat_scroll):
+            if self._is_scrolled_to_bottom():
                 self._auto_scroll = True
 
+            handlers = self._stream_handlers
+
             async for stream_event in self._agent.run_stream(query):
                 # Check for interrupt
                 if self._interrupt_requested:
                     break
 
-                if isinstance(stream_event, TextDeltaEvent):
-                    await chat.append_streaming(stream_event.text)
-                elif isinstance(stream_event, ToolExecutingEvent):
-                    chat.add_tool_call(stream_event.tool_name)
-                elif isinstance(stream_event, ToolResultEvent):
-                    chat.add_tool_result(stream_event.output, stream_event.success)
-                elif isinstance(stream_event, MessageStopEvent):
-                    # Update usage from stop event
-                    if stream_event.usage:
-                        self._usage_tracker.add_usage(
-                            input_tokens=stream_event.usage.get("input_tokens", 0),
-                            output_tokens=stream_event.usage.get("output_tokens", 0),
-                        )
-                        self._update_status_usage()
-
-                # Schedule scroll after layout refresh (like mistral-vibe)
-                if self._auto_scroll:
-                    self.call_after_refresh(self._anchor_if_scrollable)
+                handler = handlers.get(type(stream_event))
+                # ChatLog anchors after the refresh whenever content is added
+                if handler is not None:
+                    await handler(stream_event)
 
+            await self._flush_text()
             await chat.end_streaming()
 
             if self._interrupt_requested:
                 chat.add_system_message("Interrupted")
 
         except asyncio.CancelledError:
+            await self._flush_text()
             await chat.end_streaming()
             chat.add_system_message("Interrupted")
         except Exception as e:
+            await self._flush_text()
             await chat.end_streaming()
             chat.add_error(str(e))
         finally:
@@ -554,12 +623,37 @@ class MiuCodeApp(App[None]):
             self._is_processing = False
             self._interrupt_requested = False
             self._agent_task = None
-            # Focus input after completion
-            try:
-                input_container = self.query_one("#input-container", ChatInputContainer)
-                input_container.focus_input()
-            except Exception:
-                pass
+            # Focus input after completion unless a dialog is shown
+            if self._current_bottom_app == "input":
+                self._input_container.focus_input()
+
+    async def _flush_text(self) -> None:
+        """Write streamed text still batched in the chat log."""
+        await self._chat_log.flush_streaming()
+
+    async def _on_text_delta(self, event: TextDeltaEvent) -> None:
+        """Stream text; ChatLog batches chunks to one write per frame."""
+        await self._chat_log.append_streaming(event.text)
+
+    async def _on_tool_executing(self, event: ToolExecutingEvent) -> None:
+        """Show a tool call after any text streamed before it."""
+        await self._flush_text()
+        self._chat_log.add_tool_call(event.tool_name, tool_id=event.tool_id)
+
+    async def _on_tool_result(self, event: ToolResultEvent) -> None:
+        """Show a tool result below the call it belongs to."""
+        await self._flush_text()
+        self._chat_log.add_tool_result(event.output, event.success, tool_id=event.tool_id)
+
+    async def _on_message_stop(self, event: MessageStopEvent) -> None:
+        """Update usage from stop event."""
+        await self._flush_text()
+        if event.usage:
+            self._usage_tracker.add_usage(
+                input_tokens=event.usage.get("input_tokens", 0),
+                output_tokens=event.usage.get("output_tokens", 0),
+            )
+            self._update_status_usage()
 
     async def _interrupt_agent(self) -> None:
         """Interrupt the running agent."""
@@ -582,38 +676,35 @@ class MiuCodeApp(App[None]):
             self.run_worker(self._interrupt_agent(), exclusive=False)
         else:
             # Focus input if not processing
-            try:
-                input_container = self.query_one("#input-container", ChatInputContainer)
-                input_container.focus_input()
-            except Exception:
-                pass
+            if self._current_bottom_app == "input":
+                self._input_container.focus_input()
         self._scroll_to_bottom()
 
     def action_cycle_mode(self) -> None:
         """Cycle through agent modes."""
         self._mode_manager.cycle()
         self._update_mode_indicator()
-        chat = self.query_one("#messages", ChatLog)
+        chat = self._chat_log
         chat.add_system_message(f"Switched to {self._mode_manager.label}")
 
     def action_new_session(self) -> None:
         """Start a new session."""
         self.session_id = None
         self._init_agent()
-        chat = self.query_one("#messages", ChatLog)
+        chat = self._chat_log
         chat.clear()
         chat.add_system_message("Started new session")
 
     def action_clear_chat(self) -> None:
         """Clear the chat log."""
-        chat = self.query_one("#messages", ChatLog)
+        chat = self._chat_log
         chat.clear()
 
 
 def run(model: str = "zai:glm-4.7") -> None:
-    """Run the TUI application."""
+    """Run the TUI application, on uvloop when installed."""
     app = MiuCodeApp(model=model)
-    app.run()
+    eventloop.run(app.run_async())
 
 
 if __name__ == "__main__":
@@ -1,5 +1,7 @@
 """Miu brand theme colors and utilities."""
 
+from functools import lru_cache
+
 # Miu brand palette (muted forest green - dark mode friendly)
 MIU_COLORS = {
     "primary": "#1B7B42",  # muted forest green (main brand color)
@@ -38,10 +40,11 @@ VIBE_COLORS = {
 }
 
 
+@lru_cache(maxsize=64)
 def hex_to_rgb(hex_color: str) -> tuple[int, int, int]:
     """Convert hex color to RGB tuple."""
-    hex_color = hex_color.lstrip("#")
-    return tuple(int(hex_color[i : i + 2], 16) for i in (0, 2, 4))  # type: ignore
+    r, g, b = bytes.fromhex(hex_color.lstrip("#"))
+    return r, g, b
 
 
 def rgb_to_hex(r: int, g: int, b: int) -> str:
@@ -61,8 +64,15 @@ def interpolate_color(color1: str, color2: str, t: float) -> str:
     return rgb_to_hex(r, g, b)
 
 
-def get_gradient_color(progress: float) -> str:
-    """Get color from gradient based on progress (0.0 to 1.0)."""
+def _interpolate_rgb(rgb1: tuple[int, int, int], rgb2: tuple[int, int, int], t: float) -> str:
+    """Interpolate between two RGB tuples. t: 0.0 to 1.0."""
+    r1, g1, b1 = rgb1
+    r2, g2, b2 = rgb2
+    return rgb_to_hex(int(r1 + (r2 - r1) * t), int(g1 + (g2 - g1) * t), int(b1 + (b2 - b1) * t))
+
+
+def _compute_gradient_color(progress: float) -> str:
+    """Compute color from gradient based on progress (0.0 to 1.0)."""
     if progress <= 0:
         return GRADIENT_SEQUENCE[0]
     if progress >= 1:
@@ -75,6 +85,20 @@ def get_gradient_color(progress: float) -> str:
 
     local_progress = (progress * segment_count) - segment
 
-    return interpolate_color(
-        GRADIENT_SEQUENCE[segment], GRADIENT_SEQUENCE[segment + 1], local_progress
-    )
+    return _interpolate_rgb(_GRADIENT_RGB[segment], _GRADIENT_RGB[segment + 1], local_progress)
+
+
+# Gradient stops decoded once
+_GRADIENT_RGB = [hex_to_rgb(color) for color in GRADIENT_SEQUENCE]
+
+# Number of precomputed gradient steps
+GRADIENT_STEPS = 256
+
+# Gradient colors precomputed at import so animation frames only index a list
+_GRADIENT_LUT = [_compute_gradient_color(i / (GRADIENT_STEPS - 1)) for i in range(GRADIENT_STEPS)]
+
+
+def get_gradient_color(progress: float) -> str:
+    """Get color from gradient based on progress (0.0 to 1.0)."""
+    index = int(progress * (GRADIENT_STEPS - 1))
+    return _GRADIENT_LUT[max(0, min(GRADIENT_STEPS - 1, index))]
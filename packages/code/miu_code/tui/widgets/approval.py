@@ -1,14 +1,38 @@
 """Tool approval dialog widget."""
 
+import reprlib
+from collections.abc import Iterable
 from typing import Any, ClassVar
 
 from textual import events
 from textual.app import ComposeResult
 from textual.binding import Binding, BindingType
-from textual.containers import Container, Vertical, VerticalScroll
+from textual.containers import Container, VerticalScroll
 from textual.message import Message
 from textual.widgets import Static
 
+# Max characters shown per tool argument
+ARG_PREVIEW_LIMIT = 100
+
+# Bounded repr for non-string arguments, so large values are never fully stringified
+_arg_repr = reprlib.Repr()
+_arg_repr.maxstring = ARG_PREVIEW_LIMIT
+_arg_repr.maxother = ARG_PREVIEW_LIMIT
+_arg_repr.maxlevel = 3
+
+
+def _preview_value(value: Any) -> str:
+    """Format a tool argument value, truncated to ARG_PREVIEW_LIMIT characters."""
+    if isinstance(value, str):
+        text = value
+    elif isinstance(value, bytes | bytearray):
+        text = repr(value[: ARG_PREVIEW_LIMIT + 1])
+    else:
+        text = _arg_repr.repr(value)
+    if len(text) > ARG_PREVIEW_LIMIT:
+        return text[:ARG_PREVIEW_LIMIT] + "..."
+    return text
+
 
 class ApprovalApp(Container):
     """Tool approval dialog with yes/no/always options."""
@@ -27,6 +51,9 @@ class ApprovalApp(Container):
         Binding("n", "select_no", "No", show=False),
     ]
 
+    # Option kind for styling the selected option
+    _OPTION_TYPES: ClassVar[tuple[str, ...]] = ("yes", "yes", "no")
+
     class ApprovalGranted(Message):
         """User approved tool execution."""
 
@@ -67,10 +94,6 @@ class ApprovalApp(Container):
         padding: 0 1;
         margin: 0 0 1 0;
     }
-    ApprovalApp #approval-content {
-        width: 100%;
-        height: auto;
-    }
     ApprovalApp .approval-title {
         height: auto;
         text-style: bold;
@@ -106,94 +129,117 @@ class ApprovalApp(Container):
 
     def __init__(
         self,
-        tool_name: str,
-        tool_args: dict[str, Any],
-        workdir: str,
+        tool_name: str = "",
+        tool_args: dict[str, Any] | None = None,
+        workdir: str = "",
     ) -> None:
         super().__init__(id="approval-app")
         self.tool_name = tool_name
-        self.tool_args = tool_args
+        self.tool_args = tool_args or {}
         self.workdir = workdir
         self.selected_option = 0
+        self._previous_option: int | None = None
         self.option_widgets: list[Static] = []
         self.title_widget: Static | None = None
+        self.info_widget: Static | None = None
         self.help_widget: Static | None = None
+        # Display texts depend only on the tool, so build them per request
+        self._info_text = self._tool_info_text()
+        self._option_base_texts = self._option_texts()
 
     def compose(self) -> ComposeResult:
-        with Vertical(id="approval-content"):
-            # Title
-            self.title_widget = Static(
-                f"⚠ {self.tool_name} requires approval", classes="approval-title"
-            )
-            yield self.title_widget
-
-            # Tool info
-            with VerticalScroll(classes="approval-tool-scroll"):
-                yield self._create_tool_info()
-
-            yield Static("")
-
-            # Options
-            options_text = [
-                "1. Yes",
-                f"2. Yes and always allow {self.tool_name} for this session",
-                "3. No and tell the agent what to do instead",
-            ]
-            for text in options_text:
-                widget = Static(text, classes="approval-option")
-                self.option_widgets.append(widget)
-                yield widget
-
-            yield Static("")
-
-            # Help
-            self.help_widget = Static(
-                "↑↓ navigate  Enter select  ESC reject", classes="approval-help"
-            )
-            yield self.help_widget
-
-    def _create_tool_info(self) -> Static:
-        """Create tool info display."""
+        # Title
+        self.title_widget = Static(self._title_text(), classes="approval-title")
+        yield self.title_widget
+
+        # Tool info
+        with VerticalScroll(classes="approval-tool-scroll"):
+            self.info_widget = Static(self._info_text, classes="approval-tool-info")
+            yield self.info_widget
+
+        yield Static("")
+
+        # Options
+        for text in self._option_base_texts:
+            widget = Static(text, classes="approval-option")
+            self.option_widgets.append(widget)
+            yield widget
+
+        yield Static("")
+
+        # Help
+        self.help_widget = Static("↑↓ navigate  Enter select  ESC reject", classes="approval-help")
+        yield self.help_widget
+
+    def _option_texts(self) -> list[str]:
+        """Build option labels without the cursor."""
+        return [
+            "1. Yes",
+            f"2. Yes and always allow {self.tool_name} for this session",
+            "3. No and tell the agent what to do instead",
+        ]
+
+    def _title_text(self) -> str:
+        """Build the dialog title."""
+        return f"⚠ {self.tool_name} requires approval"
+
+    def _tool_info_text(self) -> str:
+        """Build tool info display text."""
         info_parts = []
         for key, value in self.tool_args.items():
-            value_str = str(value)
-            if len(value_str) > 100:
-                value_str = value_str[:100] + "..."
-            info_parts.append(f"  {key}: {value_str}")
+            info_parts.append(f"  {key}: {_preview_value(value)}")
+
+        return "\n".join(info_parts) if info_parts else "  (no arguments)"
 
-        info_text = "\n".join(info_parts) if info_parts else "  (no arguments)"
-        return Static(info_text, classes="approval-tool-info")
+    def set_tool(self, tool_name: str, tool_args: dict[str, Any]) -> None:
+        """Show a new tool request, reusing the mounted widgets."""
+        self.tool_name = tool_name
+        self.tool_args = tool_args
+        self._info_text = self._tool_info_text()
+        self._option_base_texts = self._option_texts()
+        self.selected_option = 0
+        # Tool name is part of an option label, so redraw all options
+        self._previous_option = None
+        if self.title_widget:
+            self.title_widget.update(self._title_text())
+        if self.info_widget:
+            self.info_widget.update(self._info_text)
+        self._update_options()
 
     async def on_mount(self) -> None:
         self._update_options()
-        self.focus()
+        if self.display:
+            self.focus()
 
     def _update_options(self) -> None:
         """Update option display based on selection."""
-        option_types = ["yes", "yes", "no"]
+        base_texts = self._option_base_texts
 
-        for idx, widget in enumerate(self.option_widgets):
-            is_selected = idx == self.selected_option
-            option_type = option_types[idx]
+        # After the first full pass only the old and new selection change
+        indices: Iterable[int] = range(len(self.option_widgets))
+        if self._previous_option is not None:
+            indices = {self._previous_option, self.selected_option}
 
-            # Update classes
-            widget.remove_class("approval-cursor-selected")
-            widget.remove_class("option-yes")
-            widget.remove_class("option-no")
+        for idx in indices:
+            widget = self.option_widgets[idx]
+            is_selected = idx == self.selected_option
+            option_type = self._OPTION_TYPES[idx]
 
-            if is_selected:
-                widget.add_class("approval-cursor-selected")
-                widget.add_class(f"option-{option_type}")
+            # Update classes, restyling the widget once if any changed
+            classes = widget.classes
+            widget.set_class(is_selected, "approval-cursor-selected", update=False)
+            widget.set_class(is_selected and option_type == "yes", "option-yes", update=False)
+            widget.set_class(is_selected and option_type == "no", "option-no", update=False)
+            if widget.classes != classes:
+                widget.update_node_styles()
 
             # Update text with cursor
-            base_texts = [
-                "1. Yes",
-                f"2. Yes and always allow {self.tool_name} for this session",
-                "3. No and tell the agent what to do instead",
-            ]
             cursor = "> " if is_selected else "  "
             widget.update(f"{cursor}{base_texts[idx]}")
 
+        if self.option_widgets:
+            self._previous_option = self.selected_option
+
     def action_move_up(self) -> None:
         """Move selection up."""
         self.selected_option = (self.selected_option - 1) % 3
@@ -249,5 +295,10 @@ class ApprovalApp(Container):
             )
 
     def on_blur(self, event: events.Blur) -> None:
-        """Keep focus on approval dialog."""
-        self.call_after_refresh(self.focus)
+        """Keep focus on approval dialog while it is shown."""
+        self.call_after_refresh(self._refocus)
+
+    def _refocus(self) -> None:
+        """Take focus back unless the dialog has been hidden."""
+        if self.display:
+            self.focus()
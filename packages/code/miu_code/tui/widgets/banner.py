@@ -23,6 +23,21 @@ MIU_LOGO_COMPACT = [
     " ▀██████████████▀ ",
 ]
 
+# Logo as one block, for layouts without the info column
+MIU_LOGO_COMPACT_STR = "\n".join(MIU_LOGO_COMPACT) + "\n"
+
+# Render styles and fixed strings, built once instead of per render
+LOGO_STYLE = f"bold {MIU_COLORS['primary']}"
+INFO_STYLE = f"dim {VIBE_COLORS['orange_gold']}"
+HINT_STYLE = "dim white"
+HINT_LINE = "\n  Type /help for commands  |  /model to switch"
+INFO_GAP = "    "
+SEPARATOR_LINE = "\n  " + "─" * 60
+
+# Home directory, resolved once per process
+_HOME = os.path.expanduser("~")
+_HOME_LEN = len(_HOME)
+
 
 class WelcomeBanner(Widget):
     """Welcome banner with logo and metadata."""
@@ -57,64 +72,62 @@ class WelcomeBanner(Widget):
         self.mcp_count = mcp_count
         self.working_dir = working_dir or os.getcwd()
         self._compact = compact
-        self._lines = MIU_LOGO_COMPACT
+        self._text_cache: Text | None = None
+        self._text_key: tuple[Any, ...] | None = None
 
     def _format_path(self, path: str) -> str:
         """Shorten path with ~ for home dir."""
-        home = os.path.expanduser("~")
-        if path.startswith(home):
-            return "~" + path[len(home) :]
-        return path
+        return "~" + path[_HOME_LEN:] if path.startswith(_HOME) else path
 
     def on_resize(self) -> None:
         """Refresh on resize to ensure proper layout."""
         self.refresh()
 
     def render(self) -> RenderableType:
-        """Render the banner as a single Text object."""
-        # Build info lines for side panel
-        info_lines: list[str] = []
-        if self.version:
-            info_lines.append(f"Miu Code v{self.version}")
-        if self.model:
-            mcp_str = f" | {self.mcp_count} MCP" if self.mcp_count > 0 else ""
-            info_lines.append(f"{self.model}{mcp_str}")
-        if self.working_dir:
-            info_lines.append(self._format_path(self.working_dir))
-
-        # Build full text
-        result = Text()
-        primary = MIU_COLORS["primary"]
-        info_color = VIBE_COLORS["orange_gold"]
+        """Render the banner, reusing the last Text while its inputs are unchanged."""
+        key = (self.version, self.model, self.mcp_count, self.working_dir, self._compact)
+        if self._text_cache is None or key != self._text_key:
+            self._text_cache = self._build_text()
+            self._text_key = key
+        return self._text_cache
+
+    def _build_text(self) -> Text:
+        """Build the banner as a single Text object."""
+        # Build info lines for side panel, skipping unset fields
+        mcp_str = f" | {self.mcp_count} MCP" if self.mcp_count > 0 else ""
+        info_lines = [
+            line
+            for line in (
+                self.version and f"Miu Code v{self.version}",
+                self.model and f"{self.model}{mcp_str}",
+                self.working_dir and self._format_path(self.working_dir),
+            )
+            if line
+        ]
 
         # Calculate max info width for consistent padding
         max_info_width = max((len(info) for info in info_lines), default=0)
-        separator = "    "
-
-        # Logo lines with side info (all lines padded to same width)
-        for line_idx, logo_line in enumerate(self._lines):
-            if line_idx > 0:
-                result.append("\n")
-            result.append(logo_line, style=f"bold {primary}")
-
-            # Add info or padding to maintain alignment
-            if self._compact:
-                result.append(separator, style="")
+        blank_info = INFO_GAP + " " * max_info_width + "\n"
+
+        # Logo lines with side info (all lines padded to same width), one
+        # (text, style) segment per styled run; newlines carry no visible style
+        segments: list[tuple[str, str]] = []
+        if not self._compact:
+            segments.append((MIU_LOGO_COMPACT_STR, LOGO_STYLE))
+        else:
+            for line_idx, logo_line in enumerate(self._lines):
+                segments.append((logo_line, LOGO_STYLE))
+
+                # Add info or padding to maintain alignment
                 if line_idx < len(info_lines):
-                    info_text = info_lines[line_idx].ljust(max_info_width)
-                    result.append(info_text, style=f"dim {info_color}")
+                    segments.append((INFO_GAP, ""))
+                    info = info_lines[line_idx].ljust(max_info_width) + "\n"
+                    segments.append((info, INFO_STYLE))
                 else:
-                    result.append(" " * max_info_width, style="")
-
-        # Empty line
-        result.append("\n")
-
-        # Help hint
-        result.append("\n  Type /help for commands", style="dim white")
-        result.append("  |  ", style="dim white")
-        result.append("/model to switch", style="dim white")
+                    segments.append((blank_info, ""))
 
-        # Separator
-        result.append("\n  " + "─" * 60, style=f"dim {info_color}")
+        # Help hint after an empty line, then separator
+        segments.append((HINT_LINE, HINT_STYLE))
+        segments.append((SEPARATOR_LINE, INFO_STYLE))
 
-        return result
+        return Text.assemble(*segments)
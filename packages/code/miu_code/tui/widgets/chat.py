@@ -1,14 +1,42 @@
 """Chat log widget with Vibe-inspired styling and streaming support."""
 
 from collections.abc import Callable
+from functools import lru_cache
 from typing import Any
 
 from rich.text import Text
+from textual.timer import Timer
 from textual.widgets import Static
 
 from miu_code.tui.theme import SEMANTIC_COLORS, VIBE_COLORS
 from miu_code.tui.widgets.messages import AssistantMessage, UserMessage
 
+# Seconds to collect streamed chunks before writing them (~one frame)
+STREAM_FLUSH_INTERVAL = 0.016
+
+# Message styles, built once instead of per message
+SYSTEM_ARROW_STYLE = f"dim {VIBE_COLORS['orange_gold']}"
+SYSTEM_TEXT_STYLE = f"dim {SEMANTIC_COLORS['system']}"
+ERROR_ICON_STYLE = f"bold {SEMANTIC_COLORS['error']}"
+ERROR_TEXT_STYLE = SEMANTIC_COLORS["error"]
+THINKING_ICON_STYLE = f"italic {SEMANTIC_COLORS['thinking']}"
+THINKING_TEXT_STYLE = f"italic dim {SEMANTIC_COLORS['thinking']}"
+TOOL_ICON_STYLE = f"bold {VIBE_COLORS['orange']}"
+TOOL_NAME_STYLE = f"bold {VIBE_COLORS['orange_gold']}"
+RESULT_OK_ICON_STYLE = f"bold {SEMANTIC_COLORS['assistant']}"
+RESULT_OK_TEXT_STYLE = f"dim {SEMANTIC_COLORS['assistant']}"
+RESULT_ERROR_TEXT_STYLE = f"dim {SEMANTIC_COLORS['error']}"
+
+
+@lru_cache(maxsize=32)
+def _tool_header(tool_name: str) -> Text:
+    """Build the "⚡ Calling: name" header; callers must copy before appending."""
+    return Text.assemble(
+        ("⚡ ", TOOL_ICON_STYLE),
+        ("Calling: ", "dim"),
+        (tool_name, TOOL_NAME_STYLE),
+    )
+
 
 class ChatLog(Static):
     """Chat log container with streaming support (like mistral-vibe's #messages)."""
@@ -36,19 +64,33 @@ class ChatLog(Static):
         super().__init__(**kwargs)
         self._streaming_msg: AssistantMessage | None = None
         self._streaming_mounted: bool = False
+        self._pending_chunks: list[str] = []
+        self._flush_timer: Timer | None = None
         self._scroll_callback = scroll_callback
+        self._scroll_pending = False
+        # Call indicators awaiting their result, by tool_id
+        self._pending_tools: dict[str, Static] = {}
 
     def on_resize(self) -> None:
         """Refresh on resize to ensure proper layout."""
         self.refresh()
 
     def _notify_scroll(self) -> None:
-        """Notify parent to scroll."""
+        """Notify parent to scroll, at most once per refresh."""
+        if self._scroll_callback is None or self._scroll_pending:
+            return
+        self._scroll_pending = True
+        self.call_after_refresh(self._run_scroll_callback)
+
+    def _run_scroll_callback(self) -> None:
+        """Deliver the coalesced scroll notification."""
+        self._scroll_pending = False
         if self._scroll_callback:
             self._scroll_callback()
 
     def clear(self) -> None:
         """Clear all messages from the chat log."""
+        self._pending_tools.clear()
         self.remove_children()
 
     def add_user_message(self, text: str) -> None:
@@ -68,9 +110,14 @@ class ChatLog(Static):
         # Don't mount yet - wait for actual content
         self._streaming_msg = None
         self._streaming_mounted = False
+        self._pending_chunks.clear()
 
     async def append_streaming(self, chunk: str) -> None:
-        """Append text to streaming message, mounting on first chunk."""
+        """Append text to streaming message, mounting on first chunk.
+
+        Later chunks are collected and written together once per
+        STREAM_FLUSH_INTERVAL, so a token stream causes one relayout per frame.
+        """
         if not chunk:
             return
 
@@ -79,13 +126,29 @@ class ChatLog(Static):
             self._streaming_msg = AssistantMessage(chunk)
             self.mount(self._streaming_msg)
             self._streaming_mounted = True
-        elif self._streaming_msg:
-            await self._streaming_msg.append_content(chunk)
+            self._notify_scroll()
+            return
 
-        self._notify_scroll()
+        self._pending_chunks.append(chunk)
+        if self._flush_timer is None:
+            self._flush_timer = self.set_timer(STREAM_FLUSH_INTERVAL, self.flush_streaming)
+
+    async def flush_streaming(self) -> None:
+        """Write collected chunks to the streaming message now."""
+        if self._flush_timer is not None:
+            self._flush_timer.stop()
+            self._flush_timer = None
+        if not self._pending_chunks:
+            return
+        text = "".join(self._pending_chunks)
+        self._pending_chunks.clear()
+        if self._streaming_msg:
+            await self._streaming_msg.append_content(text)
+            self._notify_scroll()
 
     async def end_streaming(self) -> None:
         """Finalize streaming message."""
+        await self.flush_streaming()
         if self._streaming_msg:
             await self._streaming_msg.stop_stream()
         self._streaming_msg = None
@@ -95,8 +158,8 @@ class ChatLog(Static):
     def add_system_message(self, text: str) -> None:
         """Add a system message to the log."""
         sys_text = Text()
-        sys_text.append("→ ", style=f"dim {VIBE_COLORS['orange_gold']}")
-        sys_text.append(text, style=f"dim {SEMANTIC_COLORS['system']}")
+        sys_text.append("→ ", style=SYSTEM_ARROW_STYLE)
+        sys_text.append(text, style=SYSTEM_TEXT_STYLE)
         msg = Static(sys_text, classes="message-text")
         self.mount(msg)
         self._notify_scroll()
@@ -104,8 +167,8 @@ class ChatLog(Static):
     def add_error(self, text: str) -> None:
         """Add an error message to the log."""
         err_text = Text()
-        err_text.append("✗ ", style=f"bold {SEMANTIC_COLORS['error']}")
-        err_text.append(text, style=SEMANTIC_COLORS["error"])
+        err_text.append("✗ ", style=ERROR_ICON_STYLE)
+        err_text.append(text, style=ERROR_TEXT_STYLE)
         msg = Static(err_text, classes="message-text")
         self.mount(msg)
         self._notify_scroll()
@@ -113,33 +176,52 @@ class ChatLog(Static):
     def add_thinking_message(self, text: str) -> None:
         """Add a thinking/reasoning message to the log."""
         think_text = Text()
-        think_text.append("◌ ", style=f"italic {SEMANTIC_COLORS['thinking']}")
-        think_text.append(text, style=f"italic dim {SEMANTIC_COLORS['thinking']}")
+        think_text.append("◌ ", style=THINKING_ICON_STYLE)
+        think_text.append(text, style=THINKING_TEXT_STYLE)
         msg = Static(think_text, classes="message-text")
         self.mount(msg)
         self._notify_scroll()
 
-    def add_tool_call(self, tool_name: str, args: str = "") -> None:
-        """Add a tool call indicator to the log."""
-        tool_text = Text()
-        tool_text.append("⚡ ", style=f"bold {VIBE_COLORS['orange']}")
-        tool_text.append("Calling: ", style="dim")
-        tool_text.append(tool_name, style=f"bold {VIBE_COLORS['orange_gold']}")
+    def add_tool_call(self, tool_name: str, args: str = "", tool_id: str | None = None) -> None:
+        """Add a tool call indicator to the log.
+
+        Args:
+            tool_name: Name of the tool being called
+            args: Optional argument summary shown after the name
+            tool_id: Id used to place this call's result directly below it
+        """
+        tool_text = _tool_header(tool_name).copy()
         if args:
             tool_text.append(f" {args}", style="dim")
         msg = Static(tool_text, classes="tool-info")
+        if tool_id is not None:
+            self._pending_tools[tool_id] = msg
         self.mount(msg)
         self._notify_scroll()
 
-    def add_tool_result(self, result: str, success: bool = True) -> None:
-        """Add a tool result to the log."""
-        color = SEMANTIC_COLORS["assistant"] if success else SEMANTIC_COLORS["error"]
-        icon = "✓" if success else "✗"
+    def add_tool_result(
+        self, result: str, success: bool = True, tool_id: str | None = None
+    ) -> None:
+        """Add a tool result to the log, below its call when tool_id is known.
+
+        Args:
+            result: Tool output to show (truncated)
+            success: Whether the tool succeeded
+            tool_id: Id of the call this result belongs to
+        """
+        if success:
+            icon, icon_style, text_style = "  ✓ ", RESULT_OK_ICON_STYLE, RESULT_OK_TEXT_STYLE
+        else:
+            icon, icon_style, text_style = "  ✗ ", ERROR_ICON_STYLE, RESULT_ERROR_TEXT_STYLE
         result_text = Text()
-        result_text.append(f"  {icon} ", style=f"bold {color}")
+        result_text.append(icon, style=icon_style)
         # Truncate long results
         display_result = result[:100] + "..." if len(result) > 100 else result
-        result_text.append(display_result, style=f"dim {color}")
+        result_text.append(display_result, style=text_style)
         msg = Static(result_text, classes="tool-info")
-        self.mount(msg)
+        call = self._pending_tools.pop(tool_id, None) if tool_id is not None else None
+        if call is not None and call.parent is self:
+            self.mount(msg, after=call)
+        else:
+            self.mount(msg)
         self._notify_scroll()
@@ -4,7 +4,7 @@ from miu_code.tui.widgets.chat_input.body import ChatInputBody
 from miu_code.tui.widgets.chat_input.completion_popup import CompletionPopup
 from miu_code.tui.widgets.chat_input.container import ChatInputContainer
 from miu_code.tui.widgets.chat_input.history import HistoryManager
-from miu_code.tui.widgets.chat_input.text_area import ChatTextArea
+from miu_code.tui.widgets.chat_input.text_area import ChatTextArea, InputMode
 
 __all__ = [
     "ChatInputBody",
@@ -12,4 +12,5 @@ __all__ = [
     "ChatTextArea",
     "CompletionPopup",
     "HistoryManager",
+    "InputMode",
 ]
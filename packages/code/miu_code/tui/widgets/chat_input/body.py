@@ -11,7 +11,7 @@ from textual.widget import Widget
 from textual.widgets import Static
 
 from miu_code.tui.widgets.chat_input.history import HistoryManager
-from miu_code.tui.widgets.chat_input.text_area import ChatTextArea
+from miu_code.tui.widgets.chat_input.text_area import ChatTextArea, InputMode
 
 
 class ChatInputBody(Widget):
@@ -59,18 +59,7 @@ class ChatInputBody(Widget):
     @value.setter
     def value(self, text: str) -> None:
         """Set input value."""
-        if self.input_widget:
-            # Parse mode from text
-            if text.startswith("!"):
-                self.input_widget.set_mode("!")
-                self.input_widget.load_text(text[1:])
-            elif text.startswith("/"):
-                self.input_widget.set_mode("/")
-                self.input_widget.load_text(text[1:])
-            else:
-                self.input_widget.set_mode(">")
-                self.input_widget.load_text(text)
-            self._update_prompt()
+        self._load_with_mode(text)
 
     def focus_input(self) -> None:
         """Focus the input widget."""
@@ -80,12 +69,12 @@ class ChatInputBody(Widget):
     def _update_prompt(self) -> None:
         """Update prompt based on current mode."""
         if self.input_widget and self.prompt_widget:
-            self.prompt_widget.update(self.input_widget.input_mode)
+            self.prompt_widget.update(self.input_widget.mode_char)
 
     def on_chat_text_area_mode_changed(self, event: ChatTextArea.ModeChanged) -> None:
         """Handle mode change."""
         if self.prompt_widget:
-            self.prompt_widget.update(event.mode)
+            self.prompt_widget.update(event.mode.prompt)
 
     def on_chat_text_area_submitted(self, event: ChatTextArea.Submitted) -> None:
         """Handle submission."""
@@ -132,16 +121,15 @@ class ChatInputBody(Widget):
         if not self.input_widget:
             return
         self.input_widget._navigating_history = True
-        # Parse mode
-        if text.startswith("!"):
-            self.input_widget.set_mode("!")
-            self.input_widget.load_text(text[1:])
-        elif text.startswith("/"):
-            self.input_widget.set_mode("/")
-            self.input_widget.load_text(text[1:])
-        else:
-            self.input_widget.set_mode(">")
-            self.input_widget.load_text(text)
+        self._load_with_mode(text)
+
+    def _load_with_mode(self, text: str) -> None:
+        """Load text, moving a leading mode character into the input mode."""
+        if not self.input_widget:
+            return
+        mode = InputMode.from_text(text)
+        self.input_widget.set_mode(mode)
+        self.input_widget.load_text(text[len(mode.prefix) :])
         self._update_prompt()
 
     def set_completion_reset_callback(self, callback: Callable[[], None]) -> None:
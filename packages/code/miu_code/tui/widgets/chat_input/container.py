@@ -1,7 +1,7 @@
 """Chat input container with completion support."""
 
 from pathlib import Path
-from typing import Any
+from typing import Any, ClassVar
 
 from textual.app import ComposeResult
 from textual.containers import Vertical
@@ -22,6 +22,9 @@ class ChatInputContainer(Vertical):
             self.value = value
             super().__init__()
 
+    # Border classes set_border_style switches between
+    _BORDER_STYLES: ClassVar[tuple[str, ...]] = ("border-safe", "border-warning", "border-error")
+
     DEFAULT_CSS = """
     ChatInputContainer {
         height: auto;
@@ -38,8 +41,10 @@ class ChatInputContainer(Vertical):
         super().__init__(**kwargs)
         self._history_file = history_file
         self._border_class = border_class
+        self._current_border_style = border_class
         self._completion_popup: CompletionPopup | None = None
         self._body: ChatInputBody | None = None
+        self._input_box: Vertical | None = None
 
     def compose(self) -> ComposeResult:
         self._completion_popup = CompletionPopup(id="completion-popup")
@@ -49,7 +54,8 @@ class ChatInputContainer(Vertical):
         if self._border_class:
             classes += f" {self._border_class}"
 
-        with Vertical(id="input-box", classes=classes):
+        self._input_box = Vertical(id="input-box", classes=classes)
+        with self._input_box:
             self._body = ChatInputBody(history_file=self._history_file, id="input-body")
             yield self._body
 
@@ -106,9 +112,13 @@ class ChatInputContainer(Vertical):
 
     def set_border_style(self, style: str) -> None:
         """Set border style class."""
-        input_box = self.query_one("#input-box")
-        # Remove existing border classes
-        for cls in ["border-safe", "border-warning", "border-error"]:
-            input_box.remove_class(cls)
-        if style:
-            input_box.add_class(style)
+        input_box = self._input_box
+        if input_box is None or style == self._current_border_style:
+            return
+        self._current_border_style = style
+        # Swap border classes, restyling the box once
+        for cls in self._BORDER_STYLES:
+            input_box.set_class(cls == style, cls, update=False)
+        if style and style not in self._BORDER_STYLES:
+            input_box.set_class(True, style, update=False)
+        input_box.update_node_styles()
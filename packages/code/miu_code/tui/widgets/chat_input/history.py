@@ -1,15 +1,29 @@
 """Command history management."""
 
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
 from pathlib import Path
 
 
 class HistoryManager:
-    """Manages command history with file persistence."""
+    """Manages command history with file persistence.
+
+    New entries are appended to the history file. Re-entered commands leave
+    their older line in place; loading keeps only the last occurrence, and the
+    file is rewritten once it grows past twice ``max_entries`` lines.
+    """
 
     def __init__(self, history_file: Path | None = None, max_entries: int = 1000) -> None:
         self._history_file = history_file
         self._max_entries = max_entries
-        self._entries: list[str] = []
+        # Insertion-ordered set: dedup and move-to-end are O(1)
+        self._entries: OrderedDict[str, None] = OrderedDict()
+        # Index-addressable snapshot for navigation, rebuilt after changes
+        self._snapshot: list[str] | None = None
+        # Snapshot indices of entries starting with each navigated prefix
+        self._prefix_matches: dict[str, list[int]] = {}
+        self._file_lines = 0
+        self._compact_pending = False
         self._current_index = -1
         self._load_history()
 
@@ -18,19 +32,45 @@ class HistoryManager:
         if not self._history_file or not self._history_file.exists():
             return
         try:
-            content = self._history_file.read_text("utf-8")
-            self._entries = [line for line in content.strip().split("\n") if line]
+            data = self._history_file.read_bytes()
+            # Unlike str.splitlines, bytes.splitlines only breaks on \n, \r\n and \r
+            lines = [line.decode("utf-8") for line in data.splitlines() if line]
         except Exception:
-            self._entries = []
+            self._entries = OrderedDict()
+            return
+        self._file_lines = len(lines)
+        # A file not ending in a newline cannot be appended to safely
+        self._compact_pending = bool(data) and not data.endswith(b"\n")
+        # Keep the last occurrence of each entry, in order of last use
+        latest = list(dict.fromkeys(reversed(lines)))[::-1]
+        self._entries = OrderedDict.fromkeys(latest[-self._max_entries :])
 
     def _save_history(self) -> None:
-        """Save history to file."""
+        """Rewrite the history file with the latest entries (compaction)."""
         if not self._history_file:
             return
         try:
             self._history_file.parent.mkdir(parents=True, exist_ok=True)
-            content = "\n".join(self._entries[-self._max_entries :])
-            self._history_file.write_text(content + "\n", "utf-8")
+            entries = list(self._entries)
+            self._history_file.write_text("\n".join(entries) + "\n", "utf-8")
+            self._file_lines = len(entries)
+            self._compact_pending = False
+        except Exception:
+            pass
+
+    def _append_history(self, entry: str) -> None:
+        """Append one entry to the history file, compacting when it grows too large."""
+        if not self._history_file:
+            return
+        if self._compact_pending or self._file_lines >= 2 * self._max_entries:
+            self._save_history()
+            return
+        try:
+            if not self._file_lines:
+                self._history_file.parent.mkdir(parents=True, exist_ok=True)
+            with self._history_file.open("a", encoding="utf-8") as f:
+                f.write(entry + "\n")
+            self._file_lines += 1
         except Exception:
             pass
 
@@ -39,41 +79,68 @@ class HistoryManager:
         entry = entry.strip()
         if not entry:
             return
-        # Remove duplicate if exists
-        if entry in self._entries:
-            self._entries.remove(entry)
-        self._entries.append(entry)
-        self._save_history()
+        # Move duplicate to the end, dropping the oldest entry past the limit
+        self._entries.pop(entry, None)
+        self._entries[entry] = None
+        if len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+        self._snapshot = None
+        self._prefix_matches.clear()
+        self._append_history(entry)
+
+    def _ordered(self) -> list[str]:
+        """Get entries as a list, oldest first."""
+        if self._snapshot is None:
+            self._snapshot = list(self._entries)
+        return self._snapshot
+
+    def _matches(self, prefix: str) -> list[int]:
+        """Get ascending snapshot indices of entries starting with prefix."""
+        matches = self._prefix_matches.get(prefix)
+        if matches is None:
+            matches = [i for i, e in enumerate(self._ordered()) if e.startswith(prefix)]
+            self._prefix_matches[prefix] = matches
+        return matches
 
     def get_previous(self, current: str = "", prefix: str = "") -> str | None:
         """Get previous history entry matching prefix."""
         if not self._entries:
             return None
 
+        entries = self._ordered()
         start = self._current_index
         if start == -1:
-            start = len(self._entries)
+            start = len(entries)
 
-        for i in range(start - 1, -1, -1):
-            entry = self._entries[i]
-            if prefix and not entry.startswith(prefix):
-                continue
-            self._current_index = i
-            return entry
+        if not prefix:
+            if start == 0:
+                return None
+            self._current_index = start - 1
+            return entries[start - 1]
 
-        return None
+        matches = self._matches(prefix)
+        pos = bisect_left(matches, start)
+        if pos == 0:
+            return None
+        self._current_index = matches[pos - 1]
+        return entries[self._current_index]
 
     def get_next(self, prefix: str = "") -> str | None:
         """Get next history entry matching prefix."""
         if self._current_index == -1:
             return None
 
-        for i in range(self._current_index + 1, len(self._entries)):
-            entry = self._entries[i]
-            if prefix and not entry.startswith(prefix):
-                continue
-            self._current_index = i
-            return entry
+        entries = self._ordered()
+        if not prefix:
+            if self._current_index + 1 < len(entries):
+                self._current_index += 1
+                return entries[self._current_index]
+        else:
+            matches = self._matches(prefix)
+            pos = bisect_right(matches, self._current_index)
+            if pos < len(matches):
+                self._current_index = matches[pos]
+                return entries[self._current_index]
 
         # Reached end, reset
         self._current_index = -1
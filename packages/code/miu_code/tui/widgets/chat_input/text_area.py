@@ -1,11 +1,49 @@
 """Custom TextArea for chat input with history support."""
 
+from bisect import bisect_right
+from enum import IntEnum
+from itertools import accumulate
 from typing import Any
 
 from textual.message import Message
 from textual.widgets import TextArea
+from textual.widgets.text_area import Edit, EditResult
 
-InputMode = str  # ">", "!", "/"
+
+class InputMode(IntEnum):
+    """Input mode, selected by the first character typed."""
+
+    NORMAL = 0  # Chat message
+    SHELL = 1  # ! shell command
+    COMMAND = 2  # / slash command
+
+    @property
+    def prompt(self) -> str:
+        """Prompt character shown before the input."""
+        return MODE_PROMPTS[self]
+
+    @property
+    def prefix(self) -> str:
+        """Prefix added to the text in get_full_text."""
+        return MODE_PREFIXES[self]
+
+    @classmethod
+    def from_text(cls, text: str) -> "InputMode":
+        """Detect the mode from the first character of text."""
+        return MODE_BY_PREFIX.get(text[:1], cls.NORMAL)
+
+
+# Per-mode strings, indexed by InputMode
+MODE_PROMPTS = (">", "!", "/")
+MODE_PREFIXES = ("", "!", "/")
+MODE_BY_PREFIX = {"!": InputMode.SHELL, "/": InputMode.COMMAND}
+# Keys that select a mode when typed into an empty input
+MODE_KEYS = frozenset(MODE_BY_PREFIX)
+
+# Keys that only move the cursor and never change the text
+NAVIGATION_KEYS = frozenset(
+    {"up", "down", "left", "right", "home", "end", "pageup", "pagedown", "shift", "ctrl", "alt"}
+)
 
 
 class ChatTextArea(TextArea):
@@ -62,7 +100,7 @@ class ChatTextArea(TextArea):
     ) -> None:
         super().__init__(**kwargs)
         self._placeholder = placeholder
-        self._input_mode: InputMode = ">"
+        self._input_mode = InputMode.NORMAL
         self._completion_manager: Any = None
         self._navigating_history = False
         self._original_text = ""
@@ -70,12 +108,23 @@ class ChatTextArea(TextArea):
         self._last_cursor_col: int = 0
         self._cursor_pos_after_load: tuple[int, int] | None = None
         self._cursor_moved_since_load = False
+        # Text offset of each line start, rebuilt after the text changes
+        self._line_offsets: list[int] | None = None
+        # Bumped on every text change, to detect edits made by a key press
+        self._text_version = 0
+        # (text version, input mode, full text) of the last get_full_text call
+        self._full_text_cache: tuple[int, InputMode, str] | None = None
 
     @property
     def input_mode(self) -> InputMode:
         """Current input mode based on first character."""
         return self._input_mode
 
+    @property
+    def mode_char(self) -> str:
+        """Prompt character of the current input mode."""
+        return self._input_mode.prompt
+
     def set_mode(self, mode: InputMode) -> None:
         """Set input mode."""
         if mode != self._input_mode:
@@ -83,43 +132,75 @@ class ChatTextArea(TextArea):
             self.post_message(self.ModeChanged(mode))
 
     def get_full_text(self) -> str:
-        """Get full input text including mode prefix."""
+        """Get full input text including mode prefix.
+
+        The result is reused until the text or the input mode changes, so a key
+        press that submits or notifies completion joins the buffer once.
+        """
+        cache = self._full_text_cache
+        if cache is not None and cache[0] == self._text_version and cache[1] == self._input_mode:
+            return cache[2]
         text = self.text
-        if self._input_mode == ">":
-            return text
-        return f"{self._input_mode}{text}"
+        if self._input_mode != InputMode.NORMAL:
+            text = self._input_mode.prefix + text
+        self._full_text_cache = (self._text_version, self._input_mode, text)
+        return text
 
     def load_text(self, text: str) -> None:
         """Load text into editor using parent's load_text method."""
         # Call parent's load_text which handles text replacement properly
         # without triggering recursive reactive updates
+        self._text_changed()
         super().load_text(text)
 
     def clear_text(self) -> None:
         """Clear the text area."""
+        self._text_changed()
         super().load_text("")
-        self._input_mode = ">"
+        self._input_mode = InputMode.NORMAL
+
+    def edit(self, edit: Edit) -> EditResult:
+        """Apply an edit, tracking the text change."""
+        self._text_changed()
+        return super().edit(edit)
+
+    def undo(self) -> None:
+        """Undo the last batch of edits, tracking the text change."""
+        self._text_changed()
+        super().undo()
+
+    def redo(self) -> None:
+        """Redo the last undone batch, tracking the text change."""
+        self._text_changed()
+        super().redo()
+
+    def _text_changed(self) -> None:
+        """Invalidate cached line offsets and bump the text version."""
+        self._line_offsets = None
+        self._text_version += 1
+
+    def _get_line_offsets(self) -> list[int]:
+        """Get the text offset of each line start, plus one past the last line."""
+        if self._line_offsets is None:
+            newline_len = len(self.document.newline)
+            self._line_offsets = list(
+                accumulate((len(line) + newline_len for line in self.document.lines), initial=0)
+            )
+        return self._line_offsets
 
     def set_cursor_offset(self, offset: int) -> None:
         """Set cursor position by offset."""
-        lines = self.text.split("\n")
-        pos = 0
-        for row, line in enumerate(lines):
-            if pos + len(line) >= offset:
-                col = offset - pos
-                self.move_cursor((row, col))
-                return
-            pos += len(line) + 1
-        # End of text
-        if lines:
-            self.move_cursor((len(lines) - 1, len(lines[-1])))
+        lines = self.document.lines
+        offsets = self._get_line_offsets()
+        row = min(max(bisect_right(offsets, offset) - 1, 0), len(lines) - 1)
+        # Offsets past the end of the text clamp to the end
+        col = min(offset - offsets[row], len(lines[row]))
+        self.move_cursor((row, col))
 
     def _get_full_cursor_offset(self) -> int:
         """Get cursor offset in full text."""
         row, col = self.cursor_location
-        lines = self.text.split("\n")
-        offset = sum(len(lines[i]) + 1 for i in range(row)) + col
-        return offset
+        return self._get_line_offsets()[row] + col
 
     def set_completion_manager(self, manager: Any) -> None:
         """Set completion manager for auto-completion."""
@@ -158,8 +239,8 @@ class ChatTextArea(TextArea):
             return
 
         # Mode detection on first character
-        if key in ("!", "/") and self.text == "":
-            self.set_mode(key)
+        if key in MODE_KEYS and self._is_empty():
+            self.set_mode(MODE_BY_PREFIX[key])
             return
 
         # Reset history on edit
@@ -167,8 +248,16 @@ class ChatTextArea(TextArea):
             self.post_message(self.HistoryReset())
             self._navigating_history = False
 
+        text_version = self._text_version
+        cursor = self.cursor_location
         await super()._on_key(event)
 
+        # Navigation and no-op keys leave the text and completion state as is
+        if text_version == self._text_version and (
+            cursor == self.cursor_location or key in NAVIGATION_KEYS
+        ):
+            return
+
         # Update mode based on content
         self._update_mode_from_text()
 
@@ -186,16 +275,20 @@ class ChatTextArea(TextArea):
     def _at_last_line(self) -> bool:
         """Check if cursor is on last line."""
         row, _ = self.cursor_location
-        lines = self.text.split("\n")
-        return row >= len(lines) - 1
+        return row >= self.document.line_count - 1
 
     def _get_current_prefix(self) -> str:
         """Get text before cursor as prefix for history search."""
         row, col = self.cursor_location
         if row == 0:
-            return self.text[:col]
+            return self.document.get_line(0)[:col]
         return ""
 
+    def _is_empty(self) -> bool:
+        """Check if the text area is empty without joining its lines."""
+        document = self.document
+        return document.line_count == 1 and not document.get_line(0)
+
     def _update_mode_from_text(self) -> None:
         """Update mode based on current text."""
         # Mode is sticky once set
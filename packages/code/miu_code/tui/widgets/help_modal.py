@@ -1,6 +1,8 @@
 """Help modal widget for displaying commands and keyboard shortcuts."""
 
+from functools import cache
 from typing import Any, ClassVar
+from weakref import WeakKeyDictionary
 
 from textual import events
 from textual.app import ComposeResult
@@ -9,7 +11,72 @@ from textual.containers import Container, VerticalScroll
 from textual.message import Message
 from textual.widgets import Markdown
 
-from miu_core.commands import Command, CommandRegistry
+from miu_core.commands import BuiltinCommand, Command, CommandRegistry
+
+# Help sections that do not depend on the registry, joined once at import
+SHORTCUTS = (
+    ("Ctrl+C", "Quit application"),
+    ("Ctrl+N", "Start new session"),
+    ("Ctrl+L", "Clear chat history"),
+    ("Escape", "Interrupt / Focus input"),
+    ("Shift+Tab", "Cycle agent mode"),
+)
+TUI_SHORTCUTS = (
+    ("Shift+Up/Down", "Scroll chat"),
+    ("Enter", "Send message"),
+)
+AGENT_MODES = (
+    ("Normal", "Execute tools with approval for dangerous ops"),
+    ("Ask", "All tool executions require approval"),
+    ("Plan", "Planning mode - creates implementation plans"),
+)
+HELP_HEADER_TUI = "\n".join(
+    [
+        "# miu help\n",
+        "## Keyboard Shortcuts\n",
+        *(f"- **{key}** - {desc}" for key, desc in SHORTCUTS + TUI_SHORTCUTS),
+        "",
+    ]
+)
+HELP_HEADER_CLI = "\n".join(
+    [
+        "# miu - AI coding agent\n",
+        "## Keyboard Shortcuts (TUI mode)\n",
+        *(f"- **{key}** - {desc}" for key, desc in SHORTCUTS),
+        "",
+    ]
+)
+DEFAULT_BUILTINS_HELP = "\n".join(
+    [
+        "- **/help** - Show this help",
+        "- **/model** - Switch AI model",
+        "- **/clear** - Clear conversation",
+        "- **/exit** - Exit application",
+    ]
+)
+HELP_FOOTER_TUI = "\n".join(
+    [
+        "## Agent Modes\n",
+        *(f"- **{mode}** - {desc}" for mode, desc in AGENT_MODES),
+        "",
+        "## Tips\n",
+        "- Use `!command` to run shell commands directly",
+        "- Type `/` followed by command name to use slash commands",
+        "- Press ESC to close this help\n",
+    ]
+)
+HELP_FOOTER_CLI = "\n".join(
+    [
+        "## Usage\n",
+        "- Type your message and press Enter to chat with the AI",
+        "- Use `!command` to run shell commands directly",
+        "- Use `/command` to run slash commands",
+        "- Run `miu code` for interactive TUI mode\n",
+    ]
+)
+
+# Generated help per registry: (registry version, {is_tui: markdown})
+_help_cache: WeakKeyDictionary[CommandRegistry, tuple[int, dict[bool, str]]] = WeakKeyDictionary()
 
 
 def generate_help_markdown(
@@ -18,6 +85,8 @@ def generate_help_markdown(
 ) -> str:
     """Generate help text as markdown.
 
+    Output for a registry is cached until a command is registered on it.
+
     Args:
         registry: Command registry to get commands from
         is_tui: Whether generating for TUI (includes more shortcuts) or CLI
@@ -25,49 +94,36 @@ def generate_help_markdown(
     Returns:
         Formatted markdown help text
     """
-    sections = []
-
-    # Title
-    title = "# miu help\n" if is_tui else "# miu - AI coding agent\n"
-    sections.append(title)
-
-    # Keyboard shortcuts
-    header = "## Keyboard Shortcuts\n" if is_tui else "## Keyboard Shortcuts (TUI mode)\n"
-    sections.append(header)
-    shortcuts = [
-        ("Ctrl+C", "Quit application"),
-        ("Ctrl+N", "Start new session"),
-        ("Ctrl+L", "Clear chat history"),
-        ("Escape", "Interrupt / Focus input"),
-        ("Shift+Tab", "Cycle agent mode"),
-    ]
-    if is_tui:
-        shortcuts.extend(
-            [
-                ("Shift+Up/Down", "Scroll chat"),
-                ("Enter", "Send message"),
-            ]
-        )
-    for key, desc in shortcuts:
-        sections.append(f"- **{key}** - {desc}")
-    sections.append("")
+    if registry is None:
+        return _default_help_markdown(is_tui)
+
+    entry = _help_cache.get(registry)
+    if entry is None or entry[0] != registry.version:
+        entry = (registry.version, {})
+        _help_cache[registry] = entry
+    help_text = entry[1].get(is_tui)
+    if help_text is None:
+        help_text = entry[1][is_tui] = _build_help_markdown(registry, is_tui)
+    return help_text
+
+
+@cache
+def _default_help_markdown(is_tui: bool) -> str:
+    """Build the registry-independent help once per variant."""
+    return _build_help_markdown(None, is_tui)
+
+
+def _build_help_markdown(registry: CommandRegistry | None, is_tui: bool) -> str:
+    """Build help markdown without caching."""
+    # Title and keyboard shortcuts
+    sections = [HELP_HEADER_TUI if is_tui else HELP_HEADER_CLI]
 
     # Built-in commands
     sections.append("## Built-in Commands\n")
     if registry:
-        builtins = registry.list_builtins()
-        for cmd in builtins:
-            aliases_str = ""
-            if cmd.aliases:
-                clean_aliases = [a.lstrip("/") for a in cmd.aliases if a.lstrip("/") != cmd.name]
-                if clean_aliases:
-                    aliases_str = f" (aliases: {', '.join(clean_aliases)})"
-            sections.append(f"- **/{cmd.name}**{aliases_str} - {cmd.description}")
+        sections.extend(_format_builtin(cmd) for cmd in registry.list_builtins())
     else:
-        sections.append("- **/help** - Show this help")
-        sections.append("- **/model** - Switch AI model")
-        sections.append("- **/clear** - Clear conversation")
-        sections.append("- **/exit** - Exit application")
+        sections.append(DEFAULT_BUILTINS_HELP)
     sections.append("")
 
     # Template commands
@@ -75,39 +131,30 @@ def generate_help_markdown(
         templates: list[Command] = registry.list_commands()
         if templates:
             sections.append("## Slash Commands\n")
-            for template_cmd in templates:
-                hint = f" {template_cmd.argument_hint}" if template_cmd.argument_hint else ""
-                sections.append(f"- **/{template_cmd.name}**{hint} - {template_cmd.description}")
+            sections.extend(_format_template(cmd) for cmd in templates)
             sections.append("")
 
-    if is_tui:
-        # Modes (TUI specific)
-        sections.append("## Agent Modes\n")
-        modes = [
-            ("Normal", "Execute tools with approval for dangerous ops"),
-            ("Ask", "All tool executions require approval"),
-            ("Plan", "Planning mode - creates implementation plans"),
-        ]
-        for mode, desc in modes:
-            sections.append(f"- **{mode}** - {desc}")
-        sections.append("")
-
-        # Tips
-        sections.append("## Tips\n")
-        sections.append("- Use `!command` to run shell commands directly")
-        sections.append("- Type `/` followed by command name to use slash commands")
-        sections.append("- Press ESC to close this help\n")
-    else:
-        # Usage (CLI specific)
-        sections.append("## Usage\n")
-        sections.append("- Type your message and press Enter to chat with the AI")
-        sections.append("- Use `!command` to run shell commands directly")
-        sections.append("- Use `/command` to run slash commands")
-        sections.append("- Run `miu code` for interactive TUI mode\n")
+    # Modes and tips (TUI) or usage (CLI)
+    sections.append(HELP_FOOTER_TUI if is_tui else HELP_FOOTER_CLI)
 
     return "\n".join(sections)
 
 
+def _format_template(cmd: Command) -> str:
+    """Format one template command line with its argument hint."""
+    hint = f" {cmd.argument_hint}" if cmd.argument_hint else ""
+    return f"- **/{cmd.name}**{hint} - {cmd.description}"
+
+
+def _format_builtin(cmd: BuiltinCommand) -> str:
+    """Format one built-in command line, listing aliases other than its name."""
+    aliases = ", ".join(
+        alias for alias in (a.lstrip("/") for a in cmd.aliases) if alias != cmd.name
+    )
+    aliases_str = f" (aliases: {aliases})" if aliases else ""
+    return f"- **/{cmd.name}**{aliases_str} - {cmd.description}"
+
+
 class HelpModal(Container):
     """Modal overlay for displaying help content."""
 
@@ -151,20 +198,40 @@ class HelpModal(Container):
         super().__init__(id="help-modal", **kwargs)
         self._registry = registry
         self._scroll_view: VerticalScroll | None = None
+        self._markdown: Markdown | None = None
+        # Registry version the rendered markdown was built from
+        self._registry_version = registry.version if registry else 0
 
     def compose(self) -> ComposeResult:
         help_text = generate_help_markdown(self._registry, is_tui=True)
         with VerticalScroll(id="help-content"):
-            yield Markdown(help_text)
+            self._markdown = Markdown(help_text)
+            yield self._markdown
 
     async def on_mount(self) -> None:
         self._scroll_view = self.query_one("#help-content", VerticalScroll)
-        self.focus()
+        if self.display:
+            self.focus()
 
     def action_close(self) -> None:
         """Close the help modal."""
         self.post_message(self.Closed())
 
+    def refresh_help(self) -> None:
+        """Re-render the help only if commands were registered since the last render."""
+        registry = self._registry
+        if registry is None or self._markdown is None:
+            return
+        if registry.version == self._registry_version:
+            return
+        self._registry_version = registry.version
+        self._markdown.update(generate_help_markdown(registry, is_tui=True))
+
+    def scroll_to_top(self) -> None:
+        """Reset content to the top, e.g. when the modal is shown again."""
+        if self._scroll_view:
+            self._scroll_view.scroll_home(animate=False)
+
     def action_scroll_up(self) -> None:
         """Scroll content up."""
         if self._scroll_view:
@@ -176,5 +243,10 @@ class HelpModal(Container):
             self._scroll_view.scroll_relative(y=3, animate=False)
 
     def on_blur(self, event: events.Blur) -> None:
-        """Keep focus on help modal."""
-        self.call_after_refresh(self.focus)
+        """Keep focus on help modal while it is shown."""
+        self.call_after_refresh(self._refocus)
+
+    def _refocus(self) -> None:
+        """Take focus back unless the modal has been hidden."""
+        if self.display:
+            self.focus()
@@ -1,7 +1,6 @@
 """Shared fixtures for code package tests."""
 
 import os
-import tempfile
 from pathlib import Path
 from unittest.mock import AsyncMock
 
@@ -14,10 +13,9 @@ from miu_core.usage import UsageTracker
 
 
 @pytest.fixture
-def temp_dir() -> Path:
-    """Create temporary directory for file operations."""
-    with tempfile.TemporaryDirectory() as d:
-        yield Path(d)
+def temp_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create temporary directory for file operations under the session temp root."""
+    return tmp_path_factory.mktemp("miu")
 
 
 @pytest.fixture
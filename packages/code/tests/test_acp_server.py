@@ -0,0 +1,90 @@
+"""Tests for ACP server."""
+
+import asyncio
+from unittest.mock import MagicMock
+
+import orjson
+import pytest
+
+from miu_code.acp.server import ACPServer, _LineReader
+
+
+class TestLineReader:
+    @pytest.mark.asyncio
+    async def test_splits_lines_across_chunks(self) -> None:
+        reader = _LineReader()
+        reader.data_received(b'{"a": 1}\n{"b"')
+        reader.data_received(b": 2}\n")
+
+        assert await reader.readline() == b'{"a": 1}\n'
+        assert await reader.readline() == b'{"b": 2}\n'
+
+    @pytest.mark.asyncio
+    async def test_eof_flushes_partial_line(self) -> None:
+        reader = _LineReader()
+        reader.data_received(b'{"a": 1}')
+        reader.eof_received()
+
+        assert await reader.readline() == b'{"a": 1}'
+        assert await reader.readline() == b""
+
+
+class TestResponseWriter:
+    @pytest.mark.asyncio
+    async def test_responses_coalesced_into_one_write(
+        self, capsysbinary: pytest.CaptureFixture[bytes]
+    ) -> None:
+        server = ACPServer()
+        server._send_response({"ok": True}, 1)
+        server._send_error("boom", 2)
+
+        assert capsysbinary.readouterr().out == b""
+        await asyncio.sleep(0)
+
+        lines = capsysbinary.readouterr().out.splitlines()
+        assert [orjson.loads(line)["id"] for line in lines] == [1, 2]
+        assert orjson.loads(lines[1])["error"]["message"] == "boom"
+
+
+class TestWorkers:
+    @pytest.mark.asyncio
+    async def test_slow_chat_does_not_block_other_requests(
+        self, capsysbinary: pytest.CaptureFixture[bytes]
+    ) -> None:
+        release = asyncio.Event()
+
+        async def slow_run(message: str) -> MagicMock:
+            await release.wait()
+            return MagicMock(get_text=MagicMock(return_value="done"))
+
+        server = ACPServer()
+        server._agent = MagicMock(run=slow_run, get_tools=MagicMock(return_value=[]))
+        workers = [asyncio.create_task(server._worker()) for _ in range(2)]
+
+        await server._inbox.put({"id": 1, "method": "chat", "params": {"message": "hi"}})
+        await server._inbox.put({"id": 2, "method": "tools/list"})
+        await asyncio.sleep(0.01)
+        release.set()
+        await server._inbox.join()
+        await asyncio.sleep(0)
+        for worker in workers:
+            worker.cancel()
+
+        lines = capsysbinary.readouterr().out.splitlines()
+        assert [orjson.loads(line)["id"] for line in lines] == [2, 1]
+
+
+class TestListTools:
+    @pytest.mark.asyncio
+    async def test_tool_schemas_cached(self) -> None:
+        tool = MagicMock()
+        tool.to_schema.return_value = {"name": "Read"}
+        server = ACPServer()
+        server._agent = MagicMock(get_tools=MagicMock(return_value=[tool]))
+
+        first = await server._handle({"method": "tools/list"})
+        second = await server._handle({"method": "tools/list"})
+
+        assert first == {"tools": [{"name": "Read"}]}
+        assert second is first
+        tool.to_schema.assert_called_once()
@@ -0,0 +1,80 @@
+"""Tests for chat input history persistence."""
+
+from pathlib import Path
+
+from miu_code.tui.widgets.chat_input.history import HistoryManager
+
+
+class TestHistoryManager:
+    """Tests for HistoryManager."""
+
+    def test_add_appends_to_file(self, temp_dir: Path) -> None:
+        """Test each add appends one line instead of rewriting the file."""
+        history_file = temp_dir / "history"
+        history = HistoryManager(history_file)
+
+        history.add("first")
+        history.add("second")
+
+        assert history_file.read_text("utf-8") == "first\nsecond\n"
+
+    def test_duplicate_keeps_last_occurrence_on_load(self, temp_dir: Path) -> None:
+        """Test re-entered commands move to the end after reload."""
+        history_file = temp_dir / "history"
+        history = HistoryManager(history_file)
+        for entry in ["a", "b", "a"]:
+            history.add(entry)
+
+        reloaded = HistoryManager(history_file)
+
+        assert list(reloaded._entries) == ["b", "a"]
+        assert reloaded.get_previous() == "a"
+        assert reloaded.get_previous() == "b"
+
+    def test_compacts_when_file_grows(self, temp_dir: Path) -> None:
+        """Test the file is rewritten once it exceeds twice max_entries."""
+        history_file = temp_dir / "history"
+        history = HistoryManager(history_file, max_entries=3)
+
+        for i in range(7):
+            history.add(f"cmd{i}")
+
+        assert history_file.read_text("utf-8") == "cmd4\ncmd5\ncmd6\n"
+        assert list(history._entries) == ["cmd4", "cmd5", "cmd6"]
+
+    def test_missing_trailing_newline_is_repaired(self, temp_dir: Path) -> None:
+        """Test appending never joins onto an unterminated last line."""
+        history_file = temp_dir / "history"
+        history_file.write_text("old", "utf-8")
+        history = HistoryManager(history_file)
+
+        history.add("new")
+
+        assert history_file.read_text("utf-8") == "old\nnew\n"
+
+    def test_prefix_navigation(self, temp_dir: Path) -> None:
+        """Test up/down only visit entries matching the prefix."""
+        history = HistoryManager(temp_dir / "history")
+        for entry in ["git status", "ls", "git diff", "pwd", "git log"]:
+            history.add(entry)
+
+        assert history.get_previous(prefix="git") == "git log"
+        assert history.get_previous(prefix="git") == "git diff"
+        assert history.get_previous(prefix="git") == "git status"
+        assert history.get_previous(prefix="git") is None
+        assert history.get_next(prefix="git") == "git diff"
+        assert history.get_next(prefix="git") == "git log"
+        assert history.get_next(prefix="git") is None
+
+        history.add("git push")
+        history.reset_navigation()
+        assert history.get_previous(prefix="git") == "git push"
+
+    def test_load_handles_crlf(self, temp_dir: Path) -> None:
+        """Test Windows line endings are not kept as part of entries."""
+        history_file = temp_dir / "history"
+        history_file.write_bytes(b"one\r\ntwo\r\n\r\n")
+
+        history = HistoryManager(history_file)
+
+        assert list(history._entries) == ["one", "two"]
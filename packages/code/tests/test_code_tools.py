@@ -1,25 +1,16 @@
 """Tests for coding tools."""
 
-import tempfile
 from pathlib import Path
 
 import pytest
 
 from miu_code.tools import BashTool, EditTool, GlobTool, GrepTool, ReadTool, WriteTool
+from miu_code.tools import bash as bash_module
+from miu_code.tools import edit as edit_module
+from miu_code.tools import grep as grep_module
 from miu_core.tools import ToolContext
 
 
-@pytest.fixture
-def temp_dir() -> Path:
-    with tempfile.TemporaryDirectory() as d:
-        yield Path(d)
-
-
-@pytest.fixture
-def ctx(temp_dir: Path) -> ToolContext:
-    return ToolContext(working_dir=str(temp_dir))
-
-
 class TestReadTool:
     @pytest.mark.asyncio
     async def test_read_file(self, temp_dir: Path, ctx: ToolContext) -> None:
@@ -66,6 +57,16 @@ class TestReadTool:
         assert "line1" not in result.output
         assert "line4" not in result.output
 
+    @pytest.mark.asyncio
+    async def test_read_numbering(self, temp_dir: Path, ctx: ToolContext) -> None:
+        test_file = temp_dir / "test.txt"
+        test_file.write_text("a\r\nb\nc")
+
+        tool = ReadTool()
+        result = await tool.execute(ctx, file_path=str(test_file), offset=2)
+
+        assert result.output == "   2│b\n   3│c"
+
 
 class TestWriteTool:
     @pytest.mark.asyncio
@@ -139,6 +140,90 @@ class TestEditTool:
         assert result.success
         assert test_file.read_text() == "bar bar bar"
 
+    @pytest.mark.asyncio
+    async def test_edit_directory_rejected(self, temp_dir: Path, ctx: ToolContext) -> None:
+        (temp_dir / "subdir").mkdir()
+
+        tool = EditTool()
+        result = await tool.execute(
+            ctx, file_path=str(temp_dir / "subdir"), old_string="a", new_string="b"
+        )
+
+        assert not result.success
+        assert "not a file" in result.output.lower()
+
+    @pytest.mark.asyncio
+    async def test_edit_binary_rejected(self, temp_dir: Path, ctx: ToolContext) -> None:
+        test_file = temp_dir / "data.bin"
+        test_file.write_bytes(b"foo\x00bar")
+
+        tool = EditTool()
+        result = await tool.execute(ctx, file_path=str(test_file), old_string="foo", new_string="x")
+
+        assert not result.success
+        assert "binary" in result.output.lower()
+        assert test_file.read_bytes() == b"foo\x00bar"
+
+    @pytest.mark.asyncio
+    async def test_edit_preserves_crlf(self, temp_dir: Path, ctx: ToolContext) -> None:
+        test_file = temp_dir / "test.txt"
+        test_file.write_bytes(b"one\r\ntwo\r\nthree\r\n")
+
+        tool = EditTool()
+        result = await tool.execute(
+            ctx,
+            file_path=str(test_file),
+            old_string="one\ntwo",
+            new_string="1\n2",
+        )
+
+        assert result.success
+        assert test_file.read_bytes() == b"1\r\n2\r\nthree\r\n"
+
+    @pytest.mark.asyncio
+    async def test_edit_large_file_streamed(
+        self, temp_dir: Path, ctx: ToolContext, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(edit_module, "STREAM_THRESHOLD", 0)
+        monkeypatch.setattr(edit_module, "CHUNK_SIZE", 4)
+        test_file = temp_dir / "test.txt"
+        test_file.write_text("aaaa target bbbb target")
+
+        tool = EditTool()
+        result = await tool.execute(
+            ctx, file_path=str(test_file), old_string="target", new_string="x"
+        )
+        assert not result.success
+        assert "2 occurrences" in result.output
+
+        result = await tool.execute(
+            ctx, file_path=str(test_file), old_string="bbbb", new_string="cc"
+        )
+        assert result.success
+        assert test_file.read_text() == "aaaa target cc target"
+
+    @pytest.mark.asyncio
+    async def test_edit_large_file_in_place(
+        self, temp_dir: Path, ctx: ToolContext, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(edit_module, "STREAM_THRESHOLD", 0)
+        monkeypatch.setattr(edit_module, "CHUNK_SIZE", 4)
+        test_file = temp_dir / "test.txt"
+        test_file.write_text("start " + "body " * 10 + "end")
+        link = temp_dir / "link.txt"
+        link.hardlink_to(test_file)
+        inode = test_file.stat().st_ino
+
+        tool = EditTool()
+        shrink = await tool.execute(
+            ctx, file_path=str(link), old_string="start body", new_string="S"
+        )
+        grow = await tool.execute(ctx, file_path=str(link), old_string="end", new_string="the end")
+
+        assert shrink.success and grow.success
+        assert test_file.stat().st_ino == inode
+        assert test_file.read_text() == "S " + "body " * 9 + "the end"
+
 
 class TestGlobTool:
     @pytest.mark.asyncio
@@ -155,6 +240,23 @@ class TestGlobTool:
         assert "file2.py" in result.output
         assert "file3.txt" not in result.output
 
+    @pytest.mark.asyncio
+    async def test_glob_limits_results(self, temp_dir: Path, ctx: ToolContext) -> None:
+        for i in range(105):
+            (temp_dir / f"file{i:03d}.py").write_text("")
+
+        tool = GlobTool()
+        result = await tool.execute(ctx, pattern="*.py")
+
+        lines = result.output.splitlines()
+        assert result.success
+        assert len(lines) == 101
+        assert "limited to 100 files" in lines[-1]
+        assert "partial, unordered sample" in lines[-1]
+        listed = lines[:-1]
+        assert listed == sorted(set(listed))
+        assert all(Path(line).parent == temp_dir and line.endswith(".py") for line in listed)
+
 
 class TestGrepTool:
     @pytest.mark.asyncio
@@ -177,6 +279,97 @@ class TestGrepTool:
         assert result.success
         assert "no match" in result.output.lower()
 
+    @pytest.mark.asyncio
+    async def test_grep_skips_binary(self, temp_dir: Path, ctx: ToolContext) -> None:
+        (temp_dir / "data.bin").write_bytes(b"needle\x00\x01")
+        (temp_dir / "text.txt").write_text("a\nneedle here\n")
+
+        tool = GrepTool()
+        result = await tool.execute(ctx, pattern="needle")
+
+        assert result.success
+        assert "text.txt:2: needle here" in result.output
+        assert "data.bin" not in result.output
+
+    @pytest.mark.asyncio
+    async def test_grep_matches_stay_within_a_line(self, temp_dir: Path, ctx: ToolContext) -> None:
+        (temp_dir / "a.txt").write_text("foo\nbar\nfoo bar\n")
+
+        tool = GrepTool()
+        for pattern in ("foo\\sbar", "foo[^x]bar"):
+            result = await tool.execute(ctx, pattern=pattern)
+
+            assert result.success
+            assert result.output.splitlines() == [f"{temp_dir / 'a.txt'}:3: foo bar"]
+
+        result = await tool.execute(ctx, pattern="o\\s")
+        assert result.output.splitlines() == [f"{temp_dir / 'a.txt'}:3: foo bar"]
+
+    @pytest.mark.asyncio
+    async def test_grep_crlf_line_endings(self, temp_dir: Path, ctx: ToolContext) -> None:
+        (temp_dir / "crlf.txt").write_bytes(b"a\r\nfoo\r\nb\r\n")
+        (temp_dir / "cr.txt").write_bytes(b"a\rbar\r")
+
+        tool = GrepTool()
+        crlf = await tool.execute(ctx, pattern="foo$")
+        cr = await tool.execute(ctx, pattern="^bar$")
+
+        assert crlf.output.splitlines() == [f"{temp_dir / 'crlf.txt'}:2: foo"]
+        assert cr.output.splitlines() == [f"{temp_dir / 'cr.txt'}:2: bar"]
+
+    @pytest.mark.asyncio
+    async def test_grep_reports_skipped_large_files(
+        self, temp_dir: Path, ctx: ToolContext, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(grep_module, "MAX_FILE_SIZE", 1024 * 1024)
+        (temp_dir / "big.txt").write_text("needle\n" + "x" * (1024 * 1024))
+        (temp_dir / "small.txt").write_text("hay\n")
+
+        tool = GrepTool()
+        result = await tool.execute(ctx, pattern="needle")
+
+        assert result.success
+        assert result.output.splitlines() == [
+            "No matches for pattern: needle",
+            "... (skipped 1 files over 1 MiB)",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_grep_limits_results_across_batches(
+        self, temp_dir: Path, ctx: ToolContext
+    ) -> None:
+        for i in range(150):
+            (temp_dir / f"file{i:03d}.txt").write_text("needle\n")
+
+        tool = GrepTool()
+        result = await tool.execute(ctx, pattern="needle")
+
+        lines = result.output.splitlines()
+        assert result.success
+        assert len(lines) == 101
+        assert "limited to 100 results" in lines[-1]
+
+    @pytest.mark.asyncio
+    async def test_grep_limit_keeps_first_matches_in_file_order(
+        self, temp_dir: Path, ctx: ToolContext
+    ) -> None:
+        # Slow-to-scan early files, then dense ones that must not crowd them out
+        filler = "x" * 100 + "\n"
+        for i in range(200):
+            text = filler * 2000 + "needle\n" if i < 64 else "needle\n" * 50
+            (temp_dir / f"file{i:03d}.txt").write_text(text)
+        expected = [
+            f"{path}:{n}: needle"
+            for path in temp_dir.glob("**/*")
+            for n, line in enumerate(path.read_text().splitlines(), 1)
+            if line == "needle"
+        ][:100]
+
+        tool = GrepTool()
+        result = await tool.execute(ctx, pattern="needle")
+
+        assert result.output.splitlines()[:-1] == expected
+
 
 class TestBashTool:
     @pytest.mark.asyncio
@@ -195,6 +388,26 @@ class TestBashTool:
         assert not result.success
         assert "exit code" in result.output.lower()
 
+    @pytest.mark.asyncio
+    async def test_output_cap_kills_command(
+        self, ctx: ToolContext, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(bash_module, "MAX_OUTPUT_BYTES", 1000)
+        tool = BashTool()
+        result = await tool.execute(ctx, command="yes", timeout=10)
+
+        assert not result.success
+        assert "output exceeded 1000 bytes" in result.output
+        assert len(result.output) < 1100
+
+    @pytest.mark.asyncio
+    async def test_timeout(self, ctx: ToolContext) -> None:
+        tool = BashTool()
+        result = await tool.execute(ctx, command="sleep 5", timeout=1)
+
+        assert not result.success
+        assert "timed out" in result.output
+
 
 class TestMissingArguments:
     """Test that tools handle missing required arguments gracefully."""
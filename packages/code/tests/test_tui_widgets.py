@@ -2,7 +2,14 @@
 
 import os
 
+import pytest
+from textual.app import App, ComposeResult
+from textual.widgets import Static
+
+from miu_code.tui.widgets.approval import ApprovalApp
 from miu_code.tui.widgets.banner import WelcomeBanner
+from miu_code.tui.widgets.chat import ChatLog
+from miu_code.tui.widgets.chat_input import InputMode
 from miu_code.tui.widgets.status import StatusBar
 from miu_core.modes import AgentMode, ModeManager
 from miu_core.usage import UsageTracker
@@ -175,6 +182,15 @@ class TestWelcomeBanner:
         formatted = banner._format_path(test_path)
         assert formatted == "/tmp/test/dir"
 
+    def test_welcomebanner_working_dir_changed_before_render(self) -> None:
+        """Test the banner shows a working_dir set after construction."""
+        banner = WelcomeBanner(working_dir="/tmp/old")
+        banner.working_dir = "/tmp/new"
+
+        text = banner._build_text().plain
+        assert "/tmp/new" in text
+        assert "/tmp/old" not in text
+
     def test_welcomebanner_compact_mode(self) -> None:
         """Test WelcomeBanner compact mode flag is tracked."""
         banner_compact = WelcomeBanner(compact=True)
@@ -333,6 +349,18 @@ class TestWelcomeBannerRender:
         assert banner.model == "claude-opus-4-20250805"
         assert banner.mcp_count == 2
 
+    def test_render_reuses_text_until_metadata_changes(self) -> None:
+        """Test WelcomeBanner caches render output keyed on its metadata."""
+        banner = WelcomeBanner(version="0.2.0", model="test-model")
+
+        first = banner.render()
+        assert banner.render() is first
+
+        banner.model = "other-model"
+        second = banner.render()
+        assert second is not first
+        assert "other-model" in second.plain
+
     def test_animation_progress_boundaries(self) -> None:
         """Test WelcomeBanner animation progress stays within bounds."""
         banner = WelcomeBanner()
@@ -423,3 +451,80 @@ class TestWidgetInitialization:
         assert len(banner._lines) > 1
         # All should be non-empty after parsing
         assert all(len(line) > 0 for line in banner._lines)
+
+
+class TestApprovalApp:
+    """Tests for ApprovalApp widget reuse."""
+
+    def test_set_tool_replaces_request(self) -> None:
+        """Test set_tool swaps in a new tool and resets the selection."""
+        approval = ApprovalApp(workdir="/tmp")
+        approval.selected_option = 2
+
+        approval.set_tool("bash", {"command": "ls"})
+
+        assert approval.tool_name == "bash"
+        assert approval.selected_option == 0
+        assert approval._title_text() == "⚠ bash requires approval"
+        assert approval._tool_info_text() == "  command: ls"
+
+    def test_tool_info_without_args(self) -> None:
+        """Test tool info placeholder when there are no arguments."""
+        approval = ApprovalApp()
+
+        assert approval._tool_info_text() == "  (no arguments)"
+
+    def test_tool_info_truncates_long_values(self) -> None:
+        """Test long string and container arguments are cut to the preview limit."""
+        approval = ApprovalApp(
+            tool_name="write",
+            tool_args={"content": "x" * 500, "lines": list(range(10_000))},
+        )
+
+        content, lines = approval._tool_info_text().split("\n")
+
+        assert content == "  content: " + "x" * 100 + "..."
+        assert len(lines) <= len("  lines: ") + 103
+        assert lines.startswith("  lines: [0, 1, 2")
+
+
+class TestInputMode:
+    """Tests for chat input mode detection."""
+
+    def test_from_text(self) -> None:
+        """Test the leading character selects the mode."""
+        assert InputMode.from_text("!ls") is InputMode.SHELL
+        assert InputMode.from_text("/help") is InputMode.COMMAND
+        assert InputMode.from_text("hello") is InputMode.NORMAL
+        assert InputMode.from_text("") is InputMode.NORMAL
+
+    def test_prompt_and_prefix(self) -> None:
+        """Test normal mode shows a prompt but adds no prefix."""
+        assert InputMode.NORMAL.prompt == ">"
+        assert InputMode.NORMAL.prefix == ""
+        assert InputMode.SHELL.prefix == "!"
+
+
+class TestChatLogToolResults:
+    """Tests for pairing tool results with their calls."""
+
+    @pytest.mark.asyncio
+    async def test_result_placed_below_its_call(self) -> None:
+        """Test results arriving out of order still land under their own call."""
+
+        class ChatApp(App[None]):
+            def compose(self) -> ComposeResult:
+                yield ChatLog()
+
+        async with ChatApp().run_test() as pilot:
+            chat = pilot.app.query_one(ChatLog)
+            chat.add_tool_call("Read", tool_id="slow")
+            chat.add_tool_call("Grep", tool_id="fast")
+            chat.add_tool_result("fast output", tool_id="fast")
+            chat.add_tool_result("slow output", tool_id="slow")
+            await pilot.pause()
+
+            texts = [str(child.render()) for child in chat.query(Static)]
+
+        expected = ["Read", "slow output", "Grep", "fast output"]
+        assert all(want in text for want, text in zip(expected, texts, strict=True))
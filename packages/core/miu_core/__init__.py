@@ -1,5 +1,7 @@
 """miu-core: Core framework library for miu AI agent."""
 
+import importlib
+
 from miu_core.version import get_version
 
 __version__ = get_version()
@@ -26,38 +28,34 @@ __all__ = [
 ]
 
 
-def __getattr__(name: str) -> object:
-    """Lazy import modules."""
-    if name in (
-        "Orchestrator",
-        "OrchestratorConfig",
-        "Pipeline",
-        "PipelineConfig",
-        "Router",
-        "RouterConfig",
-    ):
-        from miu_core import patterns
-
-        return getattr(patterns, name)
-
-    if name in ("UsageStats", "UsageTracker"):
-        from miu_core import usage
-
-        return getattr(usage, name)
-
-    if name in ("AgentMode", "ModeConfig", "ModeManager", "ModeSafety", "next_mode"):
-        from miu_core import modes
+# Module providing each lazily imported name
+_LAZY_IMPORTS: dict[str, str] = {
+    "Orchestrator": "miu_core.patterns",
+    "OrchestratorConfig": "miu_core.patterns",
+    "Pipeline": "miu_core.patterns",
+    "PipelineConfig": "miu_core.patterns",
+    "Router": "miu_core.patterns",
+    "RouterConfig": "miu_core.patterns",
+    "UsageStats": "miu_core.usage",
+    "UsageTracker": "miu_core.usage",
+    "AgentMode": "miu_core.modes",
+    "ModeConfig": "miu_core.modes",
+    "ModeManager": "miu_core.modes",
+    "ModeSafety": "miu_core.modes",
+    "next_mode": "miu_core.modes",
+    "MiuPaths": "miu_core.paths",
+    "MiuConfig": "miu_core.config",
+    "StatusBarConfig": "miu_core.config",
+}
 
-        return getattr(modes, name)
 
-    if name == "MiuPaths":
-        from miu_core.paths import MiuPaths
-
-        return MiuPaths
-
-    if name in ("MiuConfig", "StatusBarConfig"):
-        from miu_core import config
-
-        return getattr(config, name)
-
-    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+def __getattr__(name: str) -> object:
+    """Lazy import modules, caching each name in the module namespace."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name), name)
+    # Later lookups find the name directly and skip __getattr__
+    globals()[name] = value
+    return value
@@ -18,6 +18,7 @@ class AgentConfig(BaseModel):
     system_prompt: str = "You are a helpful AI assistant."
     max_iterations: int = 10
     max_context_tokens: int = 100000  # Auto-truncate at this limit
+    tool_concurrency_limit: int = 0  # Max tool calls running at once, 0 = unlimited
 
 
 class Agent(ABC):
@@ -1,7 +1,9 @@
 """ReAct (Reasoning + Acting) agent implementation."""
 
+import asyncio
 import json
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Callable
+from contextlib import AbstractAsyncContextManager, nullcontext
 from typing import Any
 
 from miu_core.agents.base import Agent, AgentConfig
@@ -21,12 +23,103 @@ from miu_core.models import (
     ToolUseStartEvent,
 )
 from miu_core.providers.base import LLMProvider
-from miu_core.tools.base import ToolContext
+from miu_core.tools.base import ToolContext, ToolResult
 from miu_core.tools.registry import ToolRegistry
 from miu_core.tracing import Tracer, get_tracer
 from miu_core.tracing.types import SpanAttributes
 
 
+def _parse_tool_input(chunks: list[str]) -> dict[str, Any]:
+    """Parse streamed tool input JSON, falling back to no arguments."""
+    if not chunks:
+        return {}
+    try:
+        parsed = json.loads("".join(chunks))
+    except json.JSONDecodeError:
+        return {}
+    return parsed if isinstance(parsed, dict) else {}
+
+
+def _finish_tool_use(start: ToolUseStartEvent, input_chunks: list[str]) -> ToolUseContent:
+    """Build the tool use block for a streamed tool call."""
+    return ToolUseContent(id=start.id, name=start.name, input=_parse_tool_input(input_chunks))
+
+
+# Input keys naming the file or directory a tool call touches
+PATH_KEYS = ("file_path", "path")
+# Input keys whose values name tool_use ids a call depends on
+REF_KEYS = ("$ref", "depends_on")
+
+
+def _referenced_ids(value: Any) -> set[str]:
+    """Collect the ids named by ``$ref``/``depends_on`` keys anywhere in a tool input."""
+    ids: set[str] = set()
+    if isinstance(value, dict):
+        for key, item in value.items():
+            if key in REF_KEYS:
+                if isinstance(item, str):
+                    ids.add(item)
+                elif isinstance(item, list):
+                    ids.update(ref for ref in item if isinstance(ref, str))
+            else:
+                ids |= _referenced_ids(item)
+    elif isinstance(value, list):
+        for item in value:
+            ids |= _referenced_ids(item)
+    return ids
+
+
+def _touched_path(tool_use: ToolUseContent) -> str | None:
+    """Get the path a tool call operates on, if its input names one."""
+    for key in PATH_KEYS:
+        value = tool_use.input.get(key)
+        if isinstance(value, str) and value:
+            return value
+    return None
+
+
+def plan_batch(
+    tool_uses: list[ToolUseContent],
+    read_only: Callable[[str], bool] = lambda name: False,
+) -> list[list[ToolUseContent]]:
+    """Partition tool calls into groups that can each run concurrently.
+
+    A call depends on an earlier call when its input names that call's id in
+    a ``$ref`` or ``depends_on`` value (e.g. ``{"$ref": "<id>"}``).
+    Calls also keep their issue order when either one is not read-only or
+    both touch the same path, so edits, writes and shell commands never race.
+    Each call lands in the first group after all of its dependencies, so
+    independent read-only calls all share the first group.
+
+    Args:
+        tool_uses: Tool calls in the order the model issued them
+        read_only: Whether the tool with the given name has no side effects
+
+    Returns:
+        Groups to run in sequence, each keeping the original call order
+    """
+    groups: list[list[ToolUseContent]] = []
+    placed: list[tuple[ToolUseContent, int, bool, str | None]] = []
+    for tool_use in tool_uses:
+        level = 0
+        is_read_only = read_only(tool_use.name)
+        path = _touched_path(tool_use)
+        if placed:
+            refs = _referenced_ids(tool_use.input)
+            for earlier, earlier_level, earlier_read_only, earlier_path in placed:
+                if (
+                    not (is_read_only and earlier_read_only)
+                    or (path is not None and path == earlier_path)
+                    or earlier.id in refs
+                ):
+                    level = max(level, earlier_level + 1)
+        if level == len(groups):
+            groups.append([])
+        groups[level].append(tool_use)
+        placed.append((tool_use, level, is_read_only, path))
+    return groups
+
+
 class ReActAgent(Agent):
     """Agent implementing ReAct pattern."""
 
@@ -41,6 +134,11 @@ class ReActAgent(Agent):
         super().__init__(provider, tools, config, memory)
         self.working_dir = working_dir
         self._tracer: Tracer = get_tracer("miu.agent")
+        # Created lazily so it binds to the loop that actually runs the tools
+        self._tool_sem: asyncio.Semaphore | None = None
+        self._tool_sem_loop: asyncio.AbstractEventLoop | None = None
+        # (registry, version, schemas) of the last schema build
+        self._schema_cache: tuple[ToolRegistry, int, list[dict[str, Any]] | None] | None = None
 
     async def run(self, query: str) -> Response:
         """Execute ReAct loop for query."""
@@ -57,8 +155,8 @@ class ReActAgent(Agent):
             iteration = 0
             for iteration in range(self.config.max_iterations):
                 response = await self.provider.complete(
-                    messages=self.memory.get_messages(),
-                    tools=self.tools.get_schemas() if len(self.tools) > 0 else None,
+                    messages=self.memory.messages_view(),
+                    tools=self._tool_schemas(),
                     system=self.config.system_prompt,
                 )
                 self.memory.add(Message(role="assistant", content=response.content))
@@ -77,31 +175,75 @@ class ReActAgent(Agent):
                 stop_reason="max_iterations",
             )
 
+    def _tool_schemas(self) -> list[dict[str, Any]] | None:
+        """Get tool schemas for the provider, rebuilt only when the registry changes."""
+        cache = self._schema_cache
+        if cache is None or cache[0] is not self.tools or cache[1] != self.tools.version:
+            schemas = self.tools.get_schemas() if len(self.tools) > 0 else None
+            cache = self._schema_cache = (self.tools, self.tools.version, schemas)
+        return cache[2]
+
     async def _execute_tools(self, response: Response) -> None:
-        """Execute tool calls from response."""
+        """Execute tool calls from response, concurrently within each batch."""
         tool_uses = response.get_tool_uses()
         ctx = ToolContext(working_dir=self.working_dir)
 
-        results: list[ToolResultContent] = []
-        for tool_use in tool_uses:
+        results: dict[str, ToolResultContent] = {}
+        for group in plan_batch(tool_uses, self._is_read_only):
+            outcomes = await asyncio.gather(
+                *(self._run_tool(ctx, tu.name, tu.input) for tu in group),
+                return_exceptions=True,
+            )
+            for tool_use, outcome in zip(group, outcomes, strict=True):
+                results[tool_use.id] = self._to_result_content(tool_use.id, outcome)
+
+        self.memory.add(Message(role="user", content=[results[tu.id] for tu in tool_uses]))
+
+    def _is_read_only(self, name: str) -> bool:
+        """Check whether a registered tool is safe to run alongside others."""
+        tool = self.tools.get(name)
+        return tool is not None and tool.read_only
+
+    def _tool_slot(self) -> AbstractAsyncContextManager[Any]:
+        """Get the context manager that bounds concurrent tool calls."""
+        limit = self.config.tool_concurrency_limit
+        if limit <= 0:
+            return nullcontext()
+        loop = asyncio.get_running_loop()
+        if self._tool_sem is None or self._tool_sem_loop is not loop:
+            self._tool_sem = asyncio.Semaphore(limit)
+            self._tool_sem_loop = loop
+        return self._tool_sem
+
+    async def _run_tool(
+        self, ctx: ToolContext, name: str, tool_input: dict[str, Any]
+    ) -> ToolResult:
+        """Execute a single tool call inside its own tracing span."""
+        async with self._tool_slot():
             with self._tracer.start_as_current_span("tool.execute") as span:
-                span.set_attribute(SpanAttributes.TOOL_NAME, tool_use.name)
+                span.set_attribute(SpanAttributes.TOOL_NAME, name)
 
-                result = await self.tools.execute(tool_use.name, ctx, **tool_use.input)
+                result = await self.tools.execute(name, ctx, **tool_input)
 
                 span.set_attribute(SpanAttributes.TOOL_SUCCESS, result.success)
                 if not result.success and result.error:
                     span.set_attribute(SpanAttributes.TOOL_ERROR, result.error)
-
-                results.append(
-                    ToolResultContent(
-                        tool_use_id=tool_use.id,
-                        content=result.output,
-                        is_error=not result.success,
-                    )
-                )
-
-        self.memory.add(Message(role="user", content=results))
+                return result
+
+    @staticmethod
+    def _to_result_content(
+        tool_use_id: str, outcome: ToolResult | BaseException
+    ) -> ToolResultContent:
+        """Convert a tool outcome (or the exception it raised) to result content."""
+        if isinstance(outcome, BaseException):
+            if not isinstance(outcome, Exception):
+                raise outcome
+            return ToolResultContent(tool_use_id=tool_use_id, content=str(outcome), is_error=True)
+        return ToolResultContent(
+            tool_use_id=tool_use_id,
+            content=outcome.output,
+            is_error=not outcome.success,
+        )
 
     async def run_stream(self, query: str) -> AsyncIterator[StreamEvent]:
         """Execute ReAct loop with streaming responses."""
@@ -110,57 +252,43 @@ class ReActAgent(Agent):
 
         for _ in range(self.config.max_iterations):
             # Collect full response while streaming text
-            collected_text = ""
-            tool_uses: list[dict[str, Any]] = []
-            current_tool: dict[str, Any] | None = None
-            tool_input_buffers: dict[str, str] = {}  # tool_id -> accumulated JSON string
+            text_chunks: list[str] = []
+            tool_use_blocks: list[ToolUseContent] = []
+            current_tool: ToolUseStartEvent | None = None
+            current_input: list[str] = []  # JSON chunks of current_tool's input
             stop_reason = "end_turn"
 
             async for event in self.provider.stream(
-                messages=self.memory.get_messages(),
-                tools=self.tools.get_schemas() if len(self.tools) > 0 else None,
+                messages=self.memory.messages_view(),
+                tools=self._tool_schemas(),
                 system=self.config.system_prompt,
             ):
                 if isinstance(event, TextDeltaEvent):
-                    collected_text += event.text
+                    text_chunks.append(event.text)
                     yield event
                 elif isinstance(event, ToolUseStartEvent):
                     # Finalize previous tool if exists
                     if current_tool:
-                        input_json = tool_input_buffers.get(current_tool["id"], "")
-                        if input_json:
-                            try:
-                                current_tool["input"] = json.loads(input_json)
-                            except json.JSONDecodeError:
-                                current_tool["input"] = {}
-                        tool_uses.append(current_tool)
+                        tool_use_blocks.append(_finish_tool_use(current_tool, current_input))
                     # Start new tool
-                    current_tool = {"id": event.id, "name": event.name, "input": {}}
-                    tool_input_buffers[event.id] = ""
+                    current_tool = event
+                    current_input = []
                     yield event
                 elif isinstance(event, ToolUseInputEvent):
-                    # Accumulate input JSON deltas
-                    tool_input_buffers[event.id] = (
-                        tool_input_buffers.get(event.id, "") + event.input_delta
-                    )
+                    # Providers stream one tool at a time, so deltas belong to current_tool
+                    if current_tool and event.id == current_tool.id:
+                        current_input.append(event.input_delta)
                 elif isinstance(event, MessageStopEvent):
                     stop_reason = event.stop_reason
                     if current_tool:
-                        # Parse accumulated JSON input
-                        input_json = tool_input_buffers.get(current_tool["id"], "")
-                        if input_json:
-                            try:
-                                current_tool["input"] = json.loads(input_json)
-                            except json.JSONDecodeError:
-                                current_tool["input"] = {}
-                        tool_uses.append(current_tool)
+                        tool_use_blocks.append(_finish_tool_use(current_tool, current_input))
 
             # Build response content for memory
+            collected_text = "".join(text_chunks)
             content: list[TextContent | ToolUseContent] = []
             if collected_text:
                 content.append(TextContent(text=collected_text))
-            for tu in tool_uses:
-                content.append(ToolUseContent(id=tu["id"], name=tu["name"], input=tu["input"]))
+            content.extend(tool_use_blocks)
 
             if content:
                 self.memory.add(Message(role="assistant", content=content))
@@ -169,38 +297,52 @@ class ReActAgent(Agent):
                 yield MessageStopEvent(stop_reason="end_turn")
                 return
 
-            if stop_reason == "tool_use" and tool_uses:
+            if stop_reason == "tool_use" and tool_use_blocks:
                 # Execute tools and yield events
-                async for tool_event in self._execute_tools_stream(tool_uses):
+                async for tool_event in self._execute_tools_stream(tool_use_blocks):
                     yield tool_event
 
         yield MessageStopEvent(stop_reason="max_iterations")
 
     async def _execute_tools_stream(
-        self, tool_uses: list[dict[str, Any]]
+        self, tool_uses: list[ToolUseContent]
     ) -> AsyncIterator[StreamEvent]:
-        """Execute tools and yield streaming events."""
-        ctx = ToolContext(working_dir=self.working_dir)
-        results: list[ToolResultContent] = []
-
-        for tool_use in tool_uses:
-            yield ToolExecutingEvent(tool_name=tool_use["name"], tool_id=tool_use["id"])
+        """Execute tools batch by batch, yielding each result as it completes.
 
-            result = await self.tools.execute(tool_use["name"], ctx, **tool_use.get("input", {}))
-
-            yield ToolResultEvent(
-                tool_name=tool_use["name"],
-                tool_id=tool_use["id"],
-                success=result.success,
-                output=result.output[:200] if result.output else "",
-            )
+        Every call in a batch is announced when the batch starts; results then
+        arrive in completion order, so consumers pair them by ``tool_id``.
+        """
+        ctx = ToolContext(working_dir=self.working_dir)
 
-            results.append(
-                ToolResultContent(
-                    tool_use_id=tool_use["id"],
-                    content=result.output,
-                    is_error=not result.success,
-                )
-            )
+        async def run_one(
+            tool_use: ToolUseContent,
+        ) -> tuple[ToolUseContent, ToolResult | BaseException]:
+            try:
+                return tool_use, await self._run_tool(ctx, tool_use.name, tool_use.input)
+            except Exception as e:
+                return tool_use, e
+
+        results: dict[str, ToolResultContent] = {}
+        for group in plan_batch(tool_uses, self._is_read_only):
+            for tool_use in group:
+                yield ToolExecutingEvent(tool_name=tool_use.name, tool_id=tool_use.id)
+
+            tasks = [asyncio.create_task(run_one(tu)) for tu in group]
+            try:
+                for next_done in asyncio.as_completed(tasks):
+                    tool_use, outcome = await next_done
+                    content = self._to_result_content(tool_use.id, outcome)
+                    results[tool_use.id] = content
+
+                    yield ToolResultEvent(
+                        tool_name=tool_use.name,
+                        tool_id=tool_use.id,
+                        success=not content.is_error,
+                        output=content.content[:200] if content.content else "",
+                    )
+            finally:
+                # Consumer stopped early (e.g. user interrupt): don't leave tools running
+                for task in tasks:
+                    task.cancel()
 
-        self.memory.add(Message(role="user", content=results))
+        self.memory.add(Message(role="user", content=[results[tu.id] for tu in tool_uses]))
@@ -19,7 +19,7 @@ class BuiltinCommand:
 
 
 # Default built-in commands
-BUILTIN_COMMANDS: list[BuiltinCommand] = [
+BUILTIN_COMMANDS: tuple[BuiltinCommand, ...] = (
     BuiltinCommand(
         name="help",
         description="Show help message with commands and shortcuts",
@@ -45,7 +45,14 @@ BUILTIN_COMMANDS: list[BuiltinCommand] = [
         aliases=frozenset(["/exit", "/quit", "/q"]),
         exits=True,
     ),
-]
+)
+
+# Default built-ins by name, copied into each new CommandRegistry
+DEFAULT_BUILTINS_BY_NAME: dict[str, BuiltinCommand] = {cmd.name: cmd for cmd in BUILTIN_COMMANDS}
+# Default alias (without leading /) -> built-in name, copied into each new CommandRegistry
+DEFAULT_ALIAS_MAP: dict[str, str] = {
+    alias.lstrip("/"): cmd.name for cmd in BUILTIN_COMMANDS for alias in cmd.aliases
+}
 
 
 def get_default_builtins() -> list[BuiltinCommand]:
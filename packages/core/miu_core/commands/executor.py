@@ -50,13 +50,13 @@ class CommandExecutor:
         if not input_str.startswith("/"):
             return None
 
-        stripped = input_str[1:].strip()
-        if not stripped:
+        # split() already skips surrounding whitespace; only the args tail needs trimming
+        parts = input_str[1:].split(maxsplit=1)
+        if not parts:
             return None
 
-        parts = stripped.split(maxsplit=1)
         command_name = parts[0]
-        args = parts[1] if len(parts) > 1 else ""
+        args = parts[1].rstrip() if len(parts) > 1 else ""
 
         return (command_name, args)
 
@@ -153,7 +153,8 @@ class CommandExecutor:
         Returns:
             True if input starts with /
         """
-        return input_str.strip().startswith("/")
+        # lstrip() returns the same string when there is nothing to strip
+        return input_str.lstrip().startswith("/")
 
     def is_builtin(self, input_str: str) -> bool:
         """Check if input is a built-in command.
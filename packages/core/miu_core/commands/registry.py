@@ -3,7 +3,11 @@
 from collections.abc import Iterator
 from pathlib import Path
 
-from miu_core.commands.builtins import BuiltinCommand, get_default_builtins
+from miu_core.commands.builtins import (
+    DEFAULT_ALIAS_MAP,
+    DEFAULT_BUILTINS_BY_NAME,
+    BuiltinCommand,
+)
 from miu_core.commands.schema import Command, parse_command_file
 
 
@@ -19,10 +23,14 @@ class CommandRegistry:
         self._commands: dict[str, Command] = {}
         self._builtins: dict[str, BuiltinCommand] = {}
         self._alias_map: dict[str, str] = {}  # Maps alias -> command name
+        self._version = 0  # Bumped on every registration
+        # Flat name/alias lookups, rebuilt lazily after registration
+        self._index: dict[str, Command | BuiltinCommand] | None = None
+        self._builtin_index: dict[str, BuiltinCommand] | None = None
 
         if load_builtins:
-            for builtin in get_default_builtins():
-                self.register_builtin(builtin)
+            self._builtins.update(DEFAULT_BUILTINS_BY_NAME)
+            self._alias_map.update(DEFAULT_ALIAS_MAP)
 
     def register(self, command: Command) -> None:
         """Register a template command.
@@ -31,6 +39,8 @@ class CommandRegistry:
             command: Command to register
         """
         self._commands[command.name] = command
+        self._version += 1
+        self._index = None
 
     def register_builtin(self, command: BuiltinCommand) -> None:
         """Register a built-in command.
@@ -39,12 +49,34 @@ class CommandRegistry:
             command: BuiltinCommand to register
         """
         self._builtins[command.name] = command
+        self._version += 1
+        self._index = self._builtin_index = None
         # Map all aliases to this command
         for alias in command.aliases:
             # Strip leading / if present
             clean_alias = alias.lstrip("/")
             self._alias_map[clean_alias] = command.name
 
+    @property
+    def version(self) -> int:
+        """Counter that changes whenever a command is registered.
+
+        Lets callers cache output derived from the registry.
+        """
+        return self._version
+
+    def _build_indexes(
+        self,
+    ) -> tuple[dict[str, Command | BuiltinCommand], dict[str, BuiltinCommand]]:
+        """Build single-probe lookups; aliases beat built-in names beat templates."""
+        builtin_index = dict(self._builtins)
+        builtin_index.update(
+            (alias, self._builtins[name]) for alias, name in self._alias_map.items()
+        )
+        index: dict[str, Command | BuiltinCommand] = {**self._commands, **builtin_index}
+        self._index, self._builtin_index = index, builtin_index
+        return index, builtin_index
+
     def get(self, name: str) -> Command | BuiltinCommand | None:
         """Get a command by name (template or built-in).
 
@@ -54,17 +86,10 @@ class CommandRegistry:
         Returns:
             Command or BuiltinCommand if found, None otherwise
         """
-        # Check alias map first for built-ins
-        if name in self._alias_map:
-            builtin_name = self._alias_map[name]
-            return self._builtins.get(builtin_name)
-
-        # Check built-ins by name
-        if name in self._builtins:
-            return self._builtins[name]
-
-        # Fall back to template commands
-        return self._commands.get(name)
+        index = self._index
+        if index is None:
+            index = self._build_indexes()[0]
+        return index.get(name)
 
     def get_builtin(self, name: str) -> BuiltinCommand | None:
         """Get a built-in command by name or alias.
@@ -75,9 +100,10 @@ class CommandRegistry:
         Returns:
             BuiltinCommand if found, None otherwise
         """
-        if name in self._alias_map:
-            return self._builtins.get(self._alias_map[name])
-        return self._builtins.get(name)
+        index = self._builtin_index
+        if index is None:
+            index = self._build_indexes()[1]
+        return index.get(name)
 
     def get_template(self, name: str) -> Command | None:
         """Get a template command by name.
@@ -99,7 +125,7 @@ class CommandRegistry:
         Returns:
             True if built-in command
         """
-        return name in self._builtins or name in self._alias_map
+        return self.get_builtin(name) is not None
 
     def load_from_file(self, path: Path) -> Command | None:
         """Load a command from a markdown file.
@@ -144,6 +170,18 @@ class CommandRegistry:
                 count += 1
         return count
 
+    def copy(self) -> "CommandRegistry":
+        """Create an independent registry with the same commands.
+
+        Returns:
+            New registry; registering on it does not affect this one
+        """
+        registry = CommandRegistry(load_builtins=False)
+        registry._commands = dict(self._commands)
+        registry._builtins = dict(self._builtins)
+        registry._alias_map = dict(self._alias_map)
+        return registry
+
     def list_commands(self) -> list[Command]:
         """Get all registered template commands.
 
@@ -176,4 +214,4 @@ class CommandRegistry:
         yield from self._commands.values()
 
     def __contains__(self, name: str) -> bool:
-        return name in self._commands or name in self._builtins or name in self._alias_map
+        return self.get(name) is not None
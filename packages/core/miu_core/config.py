@@ -4,7 +4,7 @@ Provides dataclasses and loaders for user configuration from ~/.miu/config.toml.
 """
 
 import tomllib
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from pathlib import Path
 from typing import Any
 
@@ -40,15 +40,15 @@ class StatusBarConfig:
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "StatusBarConfig":
-        """Create from dictionary (parsed TOML section)."""
-        return cls(
-            elements=data.get("elements", ["path", "model", "tokens"]),
-            show_path=data.get("show_path", True),
-            show_model=data.get("show_model", True),
-            show_tokens=data.get("show_tokens", True),
-            separator=data.get("separator", " │ "),
-            model_format=data.get("model_format", "short"),
-        )
+        """Create from dictionary (parsed TOML section).
+
+        Unknown keys are ignored; missing keys keep their defaults.
+        """
+        return cls(**{key: value for key, value in data.items() if key in _STATUSBAR_FIELDS})
+
+
+# Field names accepted by StatusBarConfig.from_dict
+_STATUSBAR_FIELDS = frozenset(f.name for f in fields(StatusBarConfig))
 
 
 @dataclass
@@ -72,20 +72,30 @@ class MiuConfig:
 
             config_path = MiuPaths.get().config
 
-        if not config_path.exists():
+        try:
+            st = config_path.stat()
+        except OSError:
             return cls()
 
+        key = str(config_path)
+        stamp = (st.st_mtime_ns, st.st_size)
+        cached = _CONFIG_CACHE.get(key)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+
         try:
             with open(config_path, "rb") as f:
                 data = tomllib.load(f)
 
             statusbar_data = data.get("statusbar", {})
-            return cls(
+            config = cls(
                 statusbar=StatusBarConfig.from_dict(statusbar_data),
             )
         except Exception:
             # Return defaults on any parse error
-            return cls()
+            config = cls()
+        _CONFIG_CACHE[key] = (stamp, config)
+        return config
 
     @classmethod
     def get_default_config_content(cls) -> str:
@@ -108,3 +118,7 @@ separator = " │ "
 # Model name format: "short" (glm-4.7) or "full" (zai:glm-4.7)
 model_format = "short"
 """
+
+
+# Config path -> ((mtime_ns, size), config); reparsed only when the file changes
+_CONFIG_CACHE: dict[str, tuple[tuple[int, int], MiuConfig]] = {}
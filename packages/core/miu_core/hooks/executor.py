@@ -1,38 +1,96 @@
 """Hook script executor."""
 
 import asyncio
+import contextlib
+import os
+import signal
 import sys
 from pathlib import Path
+from typing import Any
 
 from miu_core.hooks.events import HookInput, HookResult
 
+# Default cap on hook processes running at once
+DEFAULT_MAX_WORKERS = 4
+# Hook stdout/stderr beyond this many bytes kills the hook
+MAX_OUTPUT_BYTES = 4 * 1024 * 1024
+READ_SIZE = 65536
+# Seconds to wait for a killed hook to be reaped before giving up on it
+KILL_WAIT_TIMEOUT = 2.0
+
+
+def _kill_hook(proc: asyncio.subprocess.Process) -> None:
+    """Kill a hook along with any processes it spawned."""
+    if sys.platform == "win32":
+        with contextlib.suppress(ProcessLookupError):
+            proc.kill()
+        return
+    with contextlib.suppress(ProcessLookupError):
+        os.killpg(proc.pid, signal.SIGKILL)
+
+
+async def _reap(proc: asyncio.subprocess.Process) -> None:
+    """Wait briefly for a killed hook; the child watcher reaps it if this runs out."""
+    with contextlib.suppress(TimeoutError):
+        await asyncio.wait_for(proc.wait(), timeout=KILL_WAIT_TIMEOUT)
+
+
+async def _feed_input(proc: asyncio.subprocess.Process, data: bytes) -> None:
+    """Write hook input and close stdin so the hook sees EOF."""
+    assert proc.stdin is not None
+    proc.stdin.write(data)
+    with contextlib.suppress(BrokenPipeError, ConnectionResetError):
+        # The hook may exit without reading its input
+        await proc.stdin.drain()
+    proc.stdin.close()
+
+
+async def _read_capped(proc: asyncio.subprocess.Process, stream: asyncio.StreamReader) -> bytes:
+    """Read a hook output stream to EOF, killing the hook past MAX_OUTPUT_BYTES.
+
+    Raises:
+        OverflowError: If the stream exceeded MAX_OUTPUT_BYTES
+    """
+    buf = bytearray()
+    while chunk := await stream.read(READ_SIZE):
+        buf += chunk
+        if len(buf) > MAX_OUTPUT_BYTES:
+            _kill_hook(proc)
+            raise OverflowError(f"Hook output exceeded {MAX_OUTPUT_BYTES} bytes")
+    return bytes(buf)
+
 
 class HookExecutor:
     """Execute hook scripts in various languages."""
 
-    def _validate_script_path(self, script: Path) -> bool:
-        """Validate script is within allowed directories to prevent path traversal."""
-        try:
-            script = script.resolve()
-            allowed_bases = [Path.cwd(), Path.home() / ".miu"]
-            return any(script.is_relative_to(base) for base in allowed_bases)
-        except (ValueError, OSError):
-            return False
+    def __init__(self, max_workers: int = DEFAULT_MAX_WORKERS) -> None:
+        self._spawn_slots = asyncio.Semaphore(max_workers)
+        # Resolved script path -> command line, for scripts that already passed validation
+        self._commands: dict[str, list[str]] = {}
+        # Resolved allowed directories with a trailing separator for prefix checks
+        self._allowed_prefixes = tuple(
+            os.path.join(os.path.realpath(base), "") for base in (Path.cwd(), Path.home() / ".miu")
+        )
 
-    async def execute(self, script: Path, input_data: HookInput, timeout: int = 30) -> HookResult:
-        """Execute a hook script with input data.
+    def _validate_script_path(self, resolved: str) -> bool:
+        """Validate a resolved script path is within allowed directories."""
+        return resolved.startswith(self._allowed_prefixes)
 
-        Supports:
-        - Python (.py)
-        - Node.js (.js, .mjs)
-        - Shell (.sh)
+    def _resolve_command(self, script: Path, resolved: str) -> list[str] | HookResult:
+        """Validate a script and build the command that runs it.
+
+        The command runs the resolved path, so the file that was validated is
+        the one that executes.
+
+        Returns:
+            Command line, or a failed HookResult explaining why it can't run
         """
-        if not script.exists():
+        if not os.path.exists(resolved):
             return HookResult(
                 success=False, output=f"Script not found: {script}", should_block=False
             )
 
-        if not self._validate_script_path(script):
+        if not self._validate_script_path(resolved):
             return HookResult(
                 success=False,
                 output=f"Script path not allowed: {script}",
@@ -41,28 +99,71 @@ class HookExecutor:
 
         suffix = script.suffix.lower()
         if suffix == ".py":
-            cmd = [sys.executable, str(script)]
-        elif suffix in (".js", ".mjs"):
-            cmd = ["node", str(script)]
-        elif suffix == ".sh":
-            cmd = ["bash", str(script)]
-        else:
+            return [sys.executable, resolved]
+        if suffix in (".js", ".mjs"):
+            return ["node", resolved]
+        if suffix == ".sh":
+            return ["bash", resolved]
+        return HookResult(
+            success=False,
+            output=f"Unsupported script type: {suffix}",
+            should_block=False,
+        )
+
+    async def execute(self, script: Path, input_data: HookInput, timeout: int = 30) -> HookResult:
+        """Execute a hook script with input data.
+
+        Supports:
+        - Python (.py)
+        - Node.js (.js, .mjs)
+        - Shell (.sh)
+        """
+        # Key on the resolved path so a swapped symlink is validated again
+        try:
+            resolved = os.path.realpath(script)
+        except (ValueError, OSError):
             return HookResult(
-                success=False,
-                output=f"Unsupported script type: {suffix}",
-                should_block=False,
+                success=False, output=f"Script path not allowed: {script}", should_block=False
             )
+        cmd = self._commands.get(resolved)
+        if cmd is None:
+            command = self._resolve_command(script, resolved)
+            if isinstance(command, HookResult):
+                return command
+            cmd = self._commands[resolved] = command
 
+        async with self._spawn_slots:
+            return await self._run(cmd, input_data, timeout)
+
+    async def _run(self, cmd: list[str], input_data: HookInput, timeout: int) -> HookResult:
+        """Run a validated hook command and parse its output."""
+        proc: asyncio.subprocess.Process | None = None
         try:
             proc = await asyncio.create_subprocess_exec(
                 *cmd,
                 stdin=asyncio.subprocess.PIPE,
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE,
+                # Own process group so anything the hook spawns is killed with it
+                start_new_session=sys.platform != "win32",
             )
 
             input_json = input_data.model_dump_json().encode()
-            stdout, stderr = await asyncio.wait_for(proc.communicate(input_json), timeout=timeout)
+            assert proc.stdout is not None and proc.stderr is not None
+            # Read both pipes while feeding stdin so a chatty hook can't deadlock on a full pipe
+            feed = asyncio.ensure_future(_feed_input(proc, input_json))
+            read_out = asyncio.ensure_future(_read_capped(proc, proc.stdout))
+            read_err = asyncio.ensure_future(_read_capped(proc, proc.stderr))
+            wait = asyncio.ensure_future(proc.wait())
+            tasks: list[asyncio.Future[Any]] = [feed, read_out, read_err, wait]
+            try:
+                await asyncio.wait_for(asyncio.gather(*tasks), timeout=timeout)
+                stdout, stderr = read_out.result(), read_err.result()
+            finally:
+                # One task failing leaves its siblings running; stop and collect them
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
 
             if proc.returncode != 0:
                 return HookResult(
@@ -71,19 +172,24 @@ class HookExecutor:
                     should_block=False,
                 )
 
-            # Try to parse JSON output
-            output_text = stdout.decode("utf-8", errors="replace").strip()
+            # Try to parse JSON output; the parser takes bytes and skips surrounding whitespace
             try:
-                return HookResult.model_validate_json(output_text)
+                return HookResult.model_validate_json(stdout)
             except Exception:
                 # If not JSON, treat as plain text output
+                output_text = stdout.decode("utf-8", errors="replace").strip()
                 return HookResult(success=True, output=output_text)
 
         except TimeoutError:
             if proc:
-                proc.kill()
+                _kill_hook(proc)
+                await _reap(proc)
             return HookResult(
                 success=False, output=f"Hook timed out after {timeout}s", should_block=False
             )
+        except OverflowError as e:
+            if proc:
+                await _reap(proc)
+            return HookResult(success=False, output=str(e), should_block=False)
         except Exception as e:
             return HookResult(success=False, output=str(e), should_block=False)
@@ -1,6 +1,7 @@
 """Base memory interface."""
 
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 
 from miu_core.models import Message
 
@@ -24,6 +25,14 @@ class Memory(ABC):
         """Get messages for LLM context."""
         ...
 
+    def messages_view(self) -> Sequence[Message]:
+        """Get messages for LLM context as a read-only sequence.
+
+        Unlike get_messages(), implementations may return the same object
+        until memory changes, so callers must not mutate it.
+        """
+        return self.get_messages()
+
     @abstractmethod
     def truncate(self, max_tokens: int) -> int:
         """Truncate memory to fit within token limit. Returns tokens removed."""
@@ -1,5 +1,7 @@
 """Short-term memory implementation."""
 
+from collections.abc import Sequence
+
 from miu_core.memory.base import Memory
 from miu_core.memory.truncation import TruncationStrategy, truncate_fifo, truncate_sliding
 from miu_core.models import Message
@@ -14,6 +16,8 @@ class ShortTermMemory(Memory):
         max_messages: int = 100,
     ) -> None:
         self._messages: list[Message] = []
+        self._view: tuple[Message, ...] | None = None  # Dropped whenever messages change
+        self._fits_tokens: int | None = None  # Limit the messages were last checked against
         self.strategy = strategy
         self.max_messages = max_messages
 
@@ -25,6 +29,8 @@ class ShortTermMemory(Memory):
     def add(self, message: Message) -> None:
         """Add a message to memory."""
         self._messages.append(message)
+        self._view = None
+        self._fits_tokens = None
 
         # Auto-truncate if too many messages
         if len(self._messages) > self.max_messages:
@@ -34,16 +40,31 @@ class ShortTermMemory(Memory):
         """Get messages for LLM context."""
         return self._messages.copy()
 
+    def messages_view(self) -> Sequence[Message]:
+        """Get messages for LLM context without copying on every call."""
+        if self._view is None:
+            self._view = tuple(self._messages)
+        return self._view
+
     def truncate(self, max_tokens: int) -> int:
         """Truncate memory to fit within token limit."""
+        # Nothing added since the last check against this limit
+        if self._fits_tokens == max_tokens:
+            return 0
+        before = self._messages
         if self.strategy == TruncationStrategy.FIFO:
             self._messages, removed = truncate_fifo(self._messages, max_tokens)
         elif self.strategy == TruncationStrategy.SLIDING:
             self._messages, removed = truncate_sliding(self._messages, max_tokens)
         else:
             removed = 0
+        if self._messages is not before:
+            self._view = None
+        self._fits_tokens = max_tokens
         return removed
 
     def clear(self) -> None:
         """Clear all messages."""
         self._messages.clear()
+        self._view = None
+        self._fits_tokens = None
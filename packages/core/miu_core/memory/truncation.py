@@ -1,6 +1,8 @@
 """Truncation strategies for memory management."""
 
+from bisect import bisect_right
 from enum import Enum
+from itertools import accumulate
 
 from miu_core.models import Message
 
@@ -74,22 +76,17 @@ def truncate_fifo(messages: list[Message], max_tokens: int) -> tuple[list[Messag
     if not messages:
         return messages, 0
 
-    total_tokens = sum(estimate_tokens(m) for m in messages)
+    tokens = [estimate_tokens(m) for m in messages]
+    total_tokens = sum(tokens)
     if total_tokens <= max_tokens:
         return messages, 0
 
-    # Keep first message (usually important context)
-    result = [messages[0]]
-    tokens_kept = estimate_tokens(messages[0])
-
-    # Add messages from end until we hit limit
-    for msg in reversed(messages[1:]):
-        msg_tokens = estimate_tokens(msg)
-        if tokens_kept + msg_tokens <= max_tokens:
-            result.insert(1, msg)
-            tokens_kept += msg_tokens
-        else:
-            break
+    # Keep first message (usually important context) plus the longest suffix that
+    # fits; suffix totals only grow going back, so the cut is a binary search
+    suffix_totals = list(accumulate(reversed(tokens[1:])))
+    keep = bisect_right(suffix_totals, max_tokens - tokens[0])
+    result = [messages[0], *messages[len(messages) - keep :]]
+    tokens_kept = tokens[0] + (suffix_totals[keep - 1] if keep else 0)
 
     tokens_removed = total_tokens - tokens_kept
     return result, tokens_removed
@@ -1,6 +1,6 @@
 """Anthropic Claude provider."""
 
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Sequence
 from typing import Any
 
 from miu_core.models import (
@@ -15,7 +15,7 @@ from miu_core.models import (
     ToolUseStartEvent,
 )
 from miu_core.providers.base import LLMProvider, ToolSchema
-from miu_core.providers.converters import build_response, convert_messages_to_anthropic
+from miu_core.providers.converters import build_response, convert_message_to_anthropic
 from miu_core.tracing import Tracer, get_tracer
 from miu_core.tracing.types import SpanAttributes
 
@@ -34,10 +34,12 @@ class AnthropicProvider(LLMProvider):
         self.model = model
         self._client = AsyncAnthropic()
         self._tracer: Tracer = get_tracer("miu.provider")
+        # id(message) -> (message, wire dict) for the messages of the last request
+        self._wire_cache: dict[int, tuple[Message, dict[str, Any] | None]] = {}
 
     async def complete(
         self,
-        messages: list[Message],
+        messages: Sequence[Message],
         tools: list[ToolSchema] | list[dict[str, Any]] | None = None,
         system: str | None = None,
         max_tokens: int = 4096,
@@ -47,7 +49,7 @@ class AnthropicProvider(LLMProvider):
             span.set_attribute(SpanAttributes.PROVIDER_NAME, self.name)
             span.set_attribute(SpanAttributes.PROVIDER_MODEL, self.model)
 
-            api_messages = convert_messages_to_anthropic(messages)
+            api_messages = self._convert_messages(messages)
 
             kwargs: dict[str, Any] = {
                 "model": self.model,
@@ -72,6 +74,25 @@ class AnthropicProvider(LLMProvider):
 
             return result
 
+    def _convert_messages(self, messages: Sequence[Message]) -> list[dict[str, Any]]:
+        """Convert messages to API format, reusing conversions from the last request.
+
+        Each ReAct iteration resends the whole history plus a few new messages,
+        so only the new ones need converting.
+        """
+        previous = self._wire_cache
+        cache: dict[int, tuple[Message, dict[str, Any] | None]] = {}
+        api_messages = []
+        for msg in messages:
+            entry = previous.get(id(msg))
+            if entry is None or entry[0] is not msg:
+                entry = (msg, convert_message_to_anthropic(msg))
+            cache[id(msg)] = entry
+            if entry[1] is not None:
+                api_messages.append(entry[1])
+        self._wire_cache = cache
+        return api_messages
+
     def _convert_response(self, response: Any) -> Response:
         """Convert Anthropic response to internal format."""
         content: list[TextContent | ToolUseContent] = []
@@ -98,13 +119,13 @@ class AnthropicProvider(LLMProvider):
 
     async def stream(
         self,
-        messages: list[Message],
+        messages: Sequence[Message],
         tools: list[ToolSchema] | list[dict[str, Any]] | None = None,
         system: str | None = None,
         max_tokens: int = 4096,
     ) -> AsyncIterator[StreamEvent]:
         """Stream messages from Claude."""
-        api_messages = convert_messages_to_anthropic(messages)
+        api_messages = self._convert_messages(messages)
 
         kwargs: dict[str, Any] = {
             "model": self.model,
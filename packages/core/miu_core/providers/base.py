@@ -1,7 +1,7 @@
 """Base LLM provider interface."""
 
 from abc import ABC, abstractmethod
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Sequence
 from typing import Any, TypedDict
 
 
@@ -22,7 +22,7 @@ class LLMProvider(ABC):
     @abstractmethod
     async def complete(
         self,
-        messages: list["Message"],
+        messages: Sequence["Message"],
         tools: list[ToolSchema] | list[dict[str, Any]] | None = None,
         system: str | None = None,
         max_tokens: int = 4096,
@@ -32,7 +32,7 @@ class LLMProvider(ABC):
 
     async def stream(
         self,
-        messages: list["Message"],
+        messages: Sequence["Message"],
         tools: list[ToolSchema] | list[dict[str, Any]] | None = None,
         system: str | None = None,
         max_tokens: int = 4096,
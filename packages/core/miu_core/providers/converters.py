@@ -3,6 +3,7 @@
 Provides common conversion patterns to reduce duplication across provider implementations.
 """
 
+from collections.abc import Sequence
 from typing import Any
 
 from miu_core.models import (
@@ -52,7 +53,7 @@ def convert_message_to_anthropic(msg: Message) -> dict[str, Any] | None:
     return {"role": msg.role, "content": content_blocks}
 
 
-def convert_messages_to_anthropic(messages: list[Message]) -> list[dict[str, Any]]:
+def convert_messages_to_anthropic(messages: Sequence[Message]) -> list[dict[str, Any]]:
     """Convert internal messages to Anthropic API format."""
     result = []
     for msg in messages:
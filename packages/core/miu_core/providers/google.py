@@ -1,6 +1,7 @@
 """Google Gemini provider."""
 
 import json
+from collections.abc import Sequence
 from typing import Any
 
 from miu_core.models import (
@@ -31,7 +32,7 @@ class GoogleProvider(LLMProvider):
 
     async def complete(
         self,
-        messages: list[Message],
+        messages: Sequence[Message],
         tools: list[ToolSchema] | list[dict[str, Any]] | None = None,
         system: str | None = None,
         max_tokens: int = 4096,
@@ -54,7 +55,7 @@ class GoogleProvider(LLMProvider):
         )
         return self._convert_response(response)
 
-    def _convert_messages(self, messages: list[Message]) -> list[types.Content]:
+    def _convert_messages(self, messages: Sequence[Message]) -> list[types.Content]:
         """Convert internal messages to Gemini format."""
         result: list[types.Content] = []
 
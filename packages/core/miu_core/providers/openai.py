@@ -1,6 +1,7 @@
 """OpenAI GPT provider."""
 
 import json
+from collections.abc import Sequence
 from typing import Any
 
 from miu_core.models import (
@@ -33,7 +34,7 @@ class OpenAIProvider(LLMProvider):
 
     async def complete(
         self,
-        messages: list[Message],
+        messages: Sequence[Message],
         tools: list[ToolSchema] | list[dict[str, Any]] | None = None,
         system: str | None = None,
         max_tokens: int = 4096,
@@ -53,7 +54,7 @@ class OpenAIProvider(LLMProvider):
         return self._convert_response(response)
 
     def _convert_messages(
-        self, messages: list[Message], system: str | None
+        self, messages: Sequence[Message], system: str | None
     ) -> list[dict[str, Any]]:
         """Convert internal messages to OpenAI format."""
         result: list[dict[str, Any]] = []
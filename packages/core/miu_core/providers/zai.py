@@ -10,7 +10,7 @@ Set ZAI_BASE_URL env var to switch endpoints.
 import asyncio
 import json
 import os
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Sequence
 from typing import Any
 
 from miu_core.models import (
@@ -57,7 +57,7 @@ class ZaiProvider(LLMProvider):
 
     async def complete(
         self,
-        messages: list[Message],
+        messages: Sequence[Message],
         tools: list[ToolSchema] | list[dict[str, Any]] | None = None,
         system: str | None = None,
         max_tokens: int = 4096,
@@ -78,7 +78,7 @@ class ZaiProvider(LLMProvider):
         return self._convert_response(response)
 
     def _convert_messages(
-        self, messages: list[Message], system: str | None
+        self, messages: Sequence[Message], system: str | None
     ) -> list[dict[str, Any]]:
         """Convert internal messages to OpenAI-compatible format."""
         result: list[dict[str, Any]] = []
@@ -158,7 +158,7 @@ class ZaiProvider(LLMProvider):
 
     async def stream(
         self,
-        messages: list[Message],
+        messages: Sequence[Message],
         tools: list[ToolSchema] | list[dict[str, Any]] | None = None,
         system: str | None = None,
         max_tokens: int = 4096,
@@ -1,6 +1,7 @@
 """Base tool interface."""
 
 from abc import ABC, abstractmethod
+from functools import cache
 from typing import Any
 
 from pydantic import BaseModel
@@ -21,11 +22,19 @@ class ToolContext(BaseModel):
     session_id: str = "default"
 
 
+@cache
+def _json_schema(model: type[BaseModel]) -> dict[str, Any]:
+    """Generate JSON schema for an input model once per model class."""
+    return model.model_json_schema()
+
+
 class Tool(ABC):
     """Abstract base class for tools."""
 
     name: str
     description: str
+    # Tools without side effects may run concurrently with each other
+    read_only: bool = False
 
     @abstractmethod
     def get_input_schema(self) -> type[BaseModel]:
@@ -42,5 +51,5 @@ class Tool(ABC):
         return {
             "name": self.name,
             "description": self.description,
-            "input_schema": self.get_input_schema().model_json_schema(),
+            "input_schema": _json_schema(self.get_input_schema()),
         }
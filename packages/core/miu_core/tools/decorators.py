@@ -195,8 +195,7 @@ def sync_tool(
             raise TypeError(f"Tool '{func.__name__}' is async, use @tool instead")
 
         async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
-            loop = asyncio.get_event_loop()
-            return await loop.run_in_executor(None, lambda: func(*args, **kwargs))
+            return await asyncio.to_thread(func, *args, **kwargs)
 
         async_wrapper.__name__ = func.__name__
         async_wrapper.__doc__ = func.__doc__
@@ -1,5 +1,8 @@
 """Tool registry for managing tools."""
 
+import asyncio
+import inspect
+from collections.abc import Callable
 from typing import Any
 
 from miu_core.tools.base import Tool, ToolContext, ToolResult
@@ -10,10 +13,20 @@ class ToolRegistry:
 
     def __init__(self) -> None:
         self._tools: dict[str, Tool] = {}
+        self._version = 0  # Bumped on every registration
 
     def register(self, tool: Tool) -> None:
         """Register a tool."""
         self._tools[tool.name] = tool
+        self._version += 1
+
+    @property
+    def version(self) -> int:
+        """Counter that changes whenever a tool is registered.
+
+        Lets callers cache output derived from the registry.
+        """
+        return self._version
 
     def get(self, name: str) -> Tool | None:
         """Get tool by name."""
@@ -33,7 +46,12 @@ class ToolRegistry:
                 error=f"Unknown tool: {name}",
             )
         try:
-            return await tool.execute(ctx, **kwargs)
+            execute: Callable[..., Any] = tool.execute
+            if inspect.iscoroutinefunction(execute):
+                return await tool.execute(ctx, **kwargs)
+            # Blocking implementations run in a worker thread to keep the loop free
+            result: ToolResult = await asyncio.to_thread(execute, ctx, **kwargs)
+            return result
         except Exception as e:
             return ToolResult(
                 output=str(e),
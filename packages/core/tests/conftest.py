@@ -1,6 +1,5 @@
 """Shared fixtures for core tests."""
 
-import tempfile
 from collections.abc import AsyncIterator
 from pathlib import Path
 from typing import Any
@@ -153,10 +152,9 @@ def tool_context() -> ToolContext:
 
 
 @pytest.fixture
-def temp_dir() -> Path:
-    """Create temporary directory for tests."""
-    with tempfile.TemporaryDirectory() as d:
-        yield Path(d)
+def temp_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create temporary directory for tests under the session temp root."""
+    return tmp_path_factory.mktemp("miu")
 
 
 @pytest.fixture
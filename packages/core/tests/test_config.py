@@ -82,6 +82,24 @@ model_format = "full"
         # Should return defaults, not crash
         assert config.statusbar.show_model is True
 
+    def test_load_is_cached_until_file_changes(self, temp_dir: Path) -> None:
+        """Repeated loads should reuse the parsed config until the file changes."""
+        config_path = temp_dir / "config.toml"
+        config_path.write_text('[statusbar]\nseparator = " - "\n')
+
+        first = MiuConfig.load(config_path)
+        assert MiuConfig.load(config_path) is first
+
+        config_path.write_text('[statusbar]\nseparator = " // "\n')
+        reloaded = MiuConfig.load(config_path)
+        assert reloaded is not first
+        assert reloaded.statusbar.separator == " // "
+
+    def test_from_dict_ignores_unknown_keys(self) -> None:
+        """Unknown statusbar keys should not break loading."""
+        config = StatusBarConfig.from_dict({"show_path": False, "unknown": 1})
+        assert config.show_path is False
+
     def test_get_default_config_content(self) -> None:
         """get_default_config_content should return valid TOML template."""
         content = MiuConfig.get_default_config_content()
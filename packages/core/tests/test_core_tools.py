@@ -1,5 +1,7 @@
 """Tests for tool framework."""
 
+import threading
+
 import pytest
 from pydantic import BaseModel
 
@@ -32,6 +34,17 @@ class FailingTool(Tool):
         raise ValueError("Intentional failure")
 
 
+class BlockingTool(Tool):
+    name = "blocking"
+    description = "Synchronous tool reporting the thread it ran on"
+
+    def get_input_schema(self) -> type[BaseModel]:
+        return EchoInput
+
+    def execute(self, ctx: ToolContext, **kwargs: object) -> ToolResult:  # type: ignore[override]
+        return ToolResult(output=threading.current_thread().name)
+
+
 class TestToolResult:
     def test_success_result(self) -> None:
         result = ToolResult(output="Success!")
@@ -64,6 +77,11 @@ class TestTool:
         assert schema["description"] == "Echoes the input message"
         assert "message" in schema["input_schema"]["properties"]
 
+    def test_to_schema_reuses_input_schema(self) -> None:
+        first = EchoTool().to_schema()
+        second = FailingTool().to_schema()
+        assert first["input_schema"] is second["input_schema"]
+
     @pytest.mark.asyncio
     async def test_execute(self) -> None:
         tool = EchoTool()
@@ -116,6 +134,21 @@ class TestToolRegistry:
         assert result.success is False
         assert "Intentional failure" in result.error or ""
 
+    @pytest.mark.asyncio
+    async def test_execute_sync_tool_in_thread(self) -> None:
+        registry = ToolRegistry()
+        registry.register(BlockingTool())
+        ctx = ToolContext()
+        result = await registry.execute("blocking", ctx, message="test")
+        assert result.success is True
+        assert result.output != threading.current_thread().name
+
+    def test_version_bumps_on_register(self) -> None:
+        registry = ToolRegistry()
+        before = registry.version
+        registry.register(EchoTool())
+        assert registry.version > before
+
     def test_len(self) -> None:
         registry = ToolRegistry()
         assert len(registry) == 0
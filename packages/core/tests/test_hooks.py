@@ -0,0 +1,83 @@
+"""Tests for hook script execution."""
+
+import time
+from pathlib import Path
+
+import pytest
+
+from miu_core.hooks.events import HookEvent, HookInput
+from miu_core.hooks.executor import HookExecutor
+
+
+@pytest.fixture
+def hook_dir(temp_dir: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Run from temp_dir so scripts there pass the allow-list."""
+    monkeypatch.chdir(temp_dir)
+    return temp_dir
+
+
+def _input() -> HookInput:
+    return HookInput(event=HookEvent.PRE_TOOL_USE)
+
+
+class TestHookExecutor:
+    """Tests for HookExecutor."""
+
+    @pytest.mark.asyncio
+    async def test_json_result(self, hook_dir: Path) -> None:
+        """Test JSON printed by a hook is parsed into a HookResult."""
+        script = hook_dir / "hook.sh"
+        script.write_text('echo \'{"success": true, "output": "ok"}\'\n')
+
+        result = await HookExecutor().execute(script, _input())
+
+        assert result.success is True
+        assert result.output == "ok"
+
+    @pytest.mark.asyncio
+    async def test_timeout_kills_spawned_processes(self, hook_dir: Path) -> None:
+        """Test a timed-out hook returns promptly even if a child holds the pipes."""
+        script = hook_dir / "slow.sh"
+        script.write_text("sleep 5\n")
+
+        start = time.monotonic()
+        result = await HookExecutor().execute(script, _input(), timeout=1)
+
+        assert result.success is False
+        assert "timed out" in result.output
+        assert time.monotonic() - start < 4
+
+    @pytest.mark.asyncio
+    async def test_runaway_output_is_killed(self, hook_dir: Path) -> None:
+        """Test a hook flooding stdout is stopped well before its timeout."""
+        script = hook_dir / "flood.sh"
+        script.write_text("yes\n")
+
+        start = time.monotonic()
+        result = await HookExecutor().execute(script, _input(), timeout=10)
+
+        assert result.success is False
+        assert "exceeded" in result.output
+        assert time.monotonic() - start < 5
+
+    @pytest.mark.asyncio
+    async def test_symlink_swap_is_revalidated(self, hook_dir: Path, temp_dir: Path) -> None:
+        """Test a cached script is validated again once its symlink points elsewhere."""
+        allowed = hook_dir / "allowed.sh"
+        allowed.write_text("echo allowed\n")
+        outside_dir = temp_dir.parent / f"{temp_dir.name}-outside"
+        outside_dir.mkdir()
+        outside = outside_dir / "outside.sh"
+        outside.write_text("echo outside\n")
+        link = hook_dir / "hook.sh"
+        link.symlink_to(allowed)
+        executor = HookExecutor()
+
+        assert (await executor.execute(link, _input())).output == "allowed"
+
+        link.unlink()
+        link.symlink_to(outside)
+        result = await executor.execute(link, _input())
+
+        assert result.success is False
+        assert "not allowed" in result.output
@@ -0,0 +1,81 @@
+"""Tests for conversation memory."""
+
+from miu_core.memory import ShortTermMemory
+from miu_core.memory.truncation import estimate_tokens, truncate_fifo
+from miu_core.models import Message
+
+
+class TestTruncateFifo:
+    """Tests for FIFO truncation."""
+
+    def test_keeps_first_and_newest_that_fit(self) -> None:
+        """Test the first message stays and the longest fitting suffix is kept."""
+        messages = [Message(role="user", content=f"message {i} " * 10) for i in range(6)]
+        per_message = estimate_tokens(messages[0])
+
+        result, removed = truncate_fifo(messages, max_tokens=per_message * 3)
+
+        assert result == [messages[0], messages[4], messages[5]]
+        assert removed == per_message * 3
+
+    def test_first_message_over_budget(self) -> None:
+        """Test only the first message survives when nothing else fits."""
+        messages = [Message(role="user", content="x" * 400), Message(role="user", content="y")]
+
+        result, _ = truncate_fifo(messages, max_tokens=10)
+
+        assert result == [messages[0]]
+
+
+class TestShortTermMemory:
+    """Tests for ShortTermMemory."""
+
+    def test_messages_view_reused_until_change(self) -> None:
+        """Test the view is shared between calls and rebuilt after add."""
+        memory = ShortTermMemory()
+        memory.add(Message(role="user", content="Hello"))
+
+        view = memory.messages_view()
+        assert memory.messages_view() is view
+
+        memory.add(Message(role="assistant", content="Hi"))
+        updated = memory.messages_view()
+        assert updated is not view
+        assert [m.content for m in updated] == ["Hello", "Hi"]
+
+    def test_messages_view_tracks_truncate_and_clear(self) -> None:
+        """Test truncation and clearing invalidate the view."""
+        memory = ShortTermMemory()
+        for i in range(5):
+            memory.add(Message(role="user", content=f"message {i} " * 20))
+
+        view = memory.messages_view()
+        memory.truncate(max_tokens=1_000_000)
+        assert memory.messages_view() is view
+
+        memory.truncate(max_tokens=50)
+        assert len(memory.messages_view()) < len(view)
+
+        memory.clear()
+        assert memory.messages_view() == ()
+
+    def test_truncate_skips_recheck_until_add(self) -> None:
+        """Test repeated truncation to the same limit is a no-op until memory grows."""
+        memory = ShortTermMemory()
+        for i in range(5):
+            memory.add(Message(role="user", content=f"message {i} " * 20))
+
+        assert memory.truncate(max_tokens=50) > 0
+        assert memory.truncate(max_tokens=50) == 0
+
+        memory.add(Message(role="user", content="more " * 100))
+        assert memory.truncate(max_tokens=50) > 0
+
+    def test_get_messages_returns_copy(self) -> None:
+        """Test get_messages still hands out an independent list."""
+        memory = ShortTermMemory()
+        memory.add(Message(role="user", content="Hello"))
+
+        memory.get_messages().clear()
+
+        assert len(memory.messages_view()) == 1
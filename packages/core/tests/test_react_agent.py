@@ -1,10 +1,12 @@
 """Tests for ReAct agent implementation."""
 
+import asyncio
+
 import pytest
 from pydantic import BaseModel
 
 from miu_core.agents.base import AgentConfig
-from miu_core.agents.react import ReActAgent
+from miu_core.agents.react import ReActAgent, plan_batch
 from miu_core.memory import ShortTermMemory
 from miu_core.models import (
     Message,
@@ -13,7 +15,10 @@ from miu_core.models import (
     TextContent,
     TextDeltaEvent,
     ToolResultContent,
+    ToolResultEvent,
     ToolUseContent,
+    ToolUseInputEvent,
+    ToolUseStartEvent,
 )
 from miu_core.providers.base import LLMProvider
 from miu_core.tools import Tool, ToolContext, ToolRegistry, ToolResult
@@ -41,6 +46,7 @@ class FailingTool(Tool):
 
     name = "failing"
     description = "Always fails"
+    read_only = True
 
     def get_input_schema(self) -> type[BaseModel]:
         return EchoInput
@@ -49,6 +55,61 @@ class FailingTool(Tool):
         raise ValueError("Intentional failure")
 
 
+class SleepInput(BaseModel):
+    seconds: float
+
+
+class SleepTool(Tool):
+    """Tool that sleeps, tracking how many calls overlap."""
+
+    name = "sleep"
+    description = "Sleeps for the given seconds"
+    read_only = True
+
+    def __init__(self) -> None:
+        self.running = 0
+        self.max_running = 0
+
+    def get_input_schema(self) -> type[BaseModel]:
+        return SleepInput
+
+    async def execute(self, ctx: ToolContext, seconds: float, **kwargs: object) -> ToolResult:
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        try:
+            await asyncio.sleep(seconds)
+        finally:
+            self.running -= 1
+        return ToolResult(output=f"Slept {seconds}")
+
+
+class EditInput(BaseModel):
+    file_path: str
+    old_string: str
+    new_string: str
+
+
+class InMemoryEditTool(Tool):
+    """Edit tool over in-memory files that yields between its read and write."""
+
+    name = "edit"
+    description = "Replaces text in a file"
+
+    def __init__(self, files: dict[str, str]) -> None:
+        self.files = files
+
+    def get_input_schema(self) -> type[BaseModel]:
+        return EditInput
+
+    async def execute(
+        self, ctx: ToolContext, file_path: str, old_string: str, new_string: str, **kwargs: object
+    ) -> ToolResult:
+        content = self.files[file_path]
+        await asyncio.sleep(0.01)
+        self.files[file_path] = content.replace(old_string, new_string, 1)
+        return ToolResult(output="ok")
+
+
 class TestReActAgentBasic:
     """Basic ReAct agent tests."""
 
@@ -234,6 +295,159 @@ class TestReActAgentWithTools:
         # Agent should continue after tool failure
         assert response.get_text() == "Handled error"
 
+    @pytest.mark.asyncio
+    async def test_tools_run_concurrently_in_order(self, mock_provider: LLMProvider) -> None:
+        """Test tool calls from one response overlap and keep their order."""
+        sleep_tool = SleepTool()
+        registry = ToolRegistry()
+        registry.register(sleep_tool)
+        registry.register(FailingTool())
+        memory = ShortTermMemory()
+        agent = ReActAgent(provider=mock_provider, tools=registry, memory=memory)
+
+        response = Response(
+            id="resp-1",
+            content=[
+                ToolUseContent(id="t1", name="sleep", input={"seconds": 0.05}),
+                ToolUseContent(id="t2", name="failing", input={"message": "x"}),
+                ToolUseContent(id="t3", name="sleep", input={"seconds": 0.01}),
+            ],
+            stop_reason="tool_use",
+        )
+        await agent._execute_tools(response)
+
+        assert sleep_tool.max_running == 2
+        results = memory.get_messages()[-1].content
+        assert isinstance(results, list)
+        assert [r.tool_use_id for r in results] == ["t1", "t2", "t3"]
+        assert [r.is_error for r in results] == [False, True, False]
+
+    def test_tool_schemas_cached_until_registry_changes(self, mock_provider: LLMProvider) -> None:
+        """Test schemas are reused across iterations and rebuilt after register."""
+        registry = ToolRegistry()
+        registry.register(EchoTool())
+        agent = ReActAgent(provider=mock_provider, tools=registry)
+
+        schemas = agent._tool_schemas()
+        assert agent._tool_schemas() is schemas
+
+        registry.register(FailingTool())
+        rebuilt = agent._tool_schemas()
+        assert rebuilt is not schemas
+        assert rebuilt is not None and len(rebuilt) == 2
+
+    @pytest.mark.asyncio
+    async def test_edits_to_one_file_do_not_race(self, mock_provider: LLMProvider) -> None:
+        """Test two edits to the same file in one turn run in issue order."""
+        files = {"a.py": "alpha beta"}
+        registry = ToolRegistry()
+        registry.register(InMemoryEditTool(files))
+        agent = ReActAgent(provider=mock_provider, tools=registry)
+
+        response = Response(
+            id="resp-1",
+            content=[
+                ToolUseContent(
+                    id="t1",
+                    name="edit",
+                    input={"file_path": "a.py", "old_string": "alpha", "new_string": "ALPHA"},
+                ),
+                ToolUseContent(
+                    id="t2",
+                    name="edit",
+                    input={"file_path": "a.py", "old_string": "beta", "new_string": "BETA"},
+                ),
+            ],
+            stop_reason="tool_use",
+        )
+        await agent._execute_tools(response)
+
+        assert files["a.py"] == "ALPHA BETA"
+
+    @pytest.mark.asyncio
+    async def test_tool_concurrency_limit(self, mock_provider: LLMProvider) -> None:
+        """Test tool_concurrency_limit caps overlapping tool calls."""
+        sleep_tool = SleepTool()
+        registry = ToolRegistry()
+        registry.register(sleep_tool)
+        config = AgentConfig(tool_concurrency_limit=2)
+        agent = ReActAgent(provider=mock_provider, tools=registry, config=config)
+
+        response = Response(
+            id="resp-1",
+            content=[
+                ToolUseContent(id=f"t{i}", name="sleep", input={"seconds": 0.01}) for i in range(5)
+            ],
+            stop_reason="tool_use",
+        )
+        await agent._execute_tools(response)
+
+        assert sleep_tool.max_running == 2
+
+
+class TestPlanBatch:
+    """Tests for dependency-grouped tool batches."""
+
+    def test_independent_calls_share_one_group(self) -> None:
+        """Test calls without dependencies all run in the first group."""
+        tool_uses = [
+            ToolUseContent(id="t1", name="echo", input={"message": "a"}),
+            ToolUseContent(id="t2", name="echo", input={"message": "b"}),
+        ]
+
+        assert plan_batch(tool_uses, read_only=lambda name: True) == [tool_uses]
+
+    def test_dependent_calls_run_after_their_dependencies(self) -> None:
+        """Test references to earlier ids push calls into later groups."""
+        read = ToolUseContent(id="toolu_read", name="echo", input={"message": "a"})
+        other = ToolUseContent(id="toolu_other", name="echo", input={"message": "b"})
+        grep = ToolUseContent(id="toolu_grep", name="echo", input={"$ref": "toolu_read"})
+        write = ToolUseContent(id="toolu_write", name="echo", input={"depends_on": ["toolu_grep"]})
+
+        groups = plan_batch([read, grep, other, write], read_only=lambda name: True)
+
+        assert groups == [[read, other], [grep], [write]]
+
+    def test_ids_in_other_values_are_not_dependencies(self) -> None:
+        """Test an id merely appearing in input text does not order calls."""
+        first = ToolUseContent(id="t1", name="echo", input={"message": "a"})
+        second = ToolUseContent(id="t2", name="echo", input={"message": "mentions t1"})
+
+        assert plan_batch([first, second], read_only=lambda name: True) == [[first, second]]
+
+    def test_mutating_calls_keep_issue_order(self) -> None:
+        """Test a call that is not read-only is ordered against every other call."""
+        read = ToolUseContent(id="t1", name="read", input={"file_path": "a.py"})
+        edit = ToolUseContent(id="t2", name="edit", input={"file_path": "a.py"})
+        other = ToolUseContent(id="t3", name="read", input={"file_path": "b.py"})
+
+        groups = plan_batch([read, edit, other], read_only=lambda name: name == "read")
+
+        assert groups == [[read], [edit], [other]]
+
+    def test_same_path_calls_keep_issue_order(self) -> None:
+        """Test read-only calls on one path run in sequence, other paths in parallel."""
+        first = ToolUseContent(id="t1", name="read", input={"file_path": "a.py"})
+        second = ToolUseContent(id="t2", name="read", input={"file_path": "a.py"})
+        other = ToolUseContent(id="t3", name="read", input={"path": "src"})
+
+        groups = plan_batch([first, second, other], read_only=lambda name: True)
+
+        assert groups == [[first, other], [second]]
+
+    def test_unknown_tools_are_not_read_only(self) -> None:
+        """Test calls default to running one at a time."""
+        tool_uses = [
+            ToolUseContent(id="t1", name="echo", input={"message": "a"}),
+            ToolUseContent(id="t2", name="echo", input={"message": "b"}),
+        ]
+
+        assert plan_batch(tool_uses) == [[tool_uses[0]], [tool_uses[1]]]
+
+    def test_empty(self) -> None:
+        """Test no calls produce no groups."""
+        assert plan_batch([]) == []
+
 
 class TestReActAgentStreaming:
     """Tests for ReAct agent streaming."""
@@ -265,6 +479,67 @@ class TestReActAgentStreaming:
         # Should have collected all text
         assert len(collected) > 0
 
+    @pytest.mark.asyncio
+    async def test_stream_assembles_chunked_tool_input(self) -> None:
+        """Test tool input JSON split across deltas is parsed per tool."""
+
+        class ChunkedToolProvider(LLMProvider):
+            name = "chunked"
+            model = "test"
+            call_count = 0
+
+            async def complete(self, messages, tools=None, system=None, max_tokens=4096):
+                raise NotImplementedError
+
+            async def stream(self, messages, tools=None, system=None, max_tokens=4096):
+                self.call_count += 1
+                if self.call_count == 1:
+                    yield ToolUseStartEvent(id="t1", name="echo")
+                    for delta in ['{"mess', 'age": "o', 'ne"}']:
+                        yield ToolUseInputEvent(id="t1", input_delta=delta)
+                    yield ToolUseStartEvent(id="t2", name="echo")
+                    yield ToolUseInputEvent(id="t2", input_delta='{"message": "two"}')
+                    yield MessageStopEvent(stop_reason="tool_use")
+                else:
+                    yield TextDeltaEvent(text="Done")
+                    yield MessageStopEvent(stop_reason="end_turn")
+
+        registry = ToolRegistry()
+        registry.register(EchoTool())
+        agent = ReActAgent(provider=ChunkedToolProvider(), tools=registry)
+
+        events = [event async for event in agent.run_stream("Echo twice")]
+
+        outputs = [e.output for e in events if isinstance(e, ToolResultEvent)]
+        assert sorted(outputs) == ["Echo: one", "Echo: two"]
+
+    @pytest.mark.asyncio
+    async def test_stream_tool_results_yield_as_completed(self, mock_provider: LLMProvider) -> None:
+        """Test results stream in completion order but are stored in call order."""
+        registry = ToolRegistry()
+        registry.register(SleepTool())
+        memory = ShortTermMemory()
+        agent = ReActAgent(provider=mock_provider, tools=registry, memory=memory)
+
+        tool_uses = [
+            ToolUseContent(id="slow", name="sleep", input={"seconds": 0.05}),
+            ToolUseContent(id="fast", name="sleep", input={"seconds": 0.01}),
+        ]
+        events = [event async for event in agent._execute_tools_stream(tool_uses)]
+
+        result_ids = [e.tool_id for e in events if isinstance(e, ToolResultEvent)]
+        assert result_ids == ["fast", "slow"]
+        # Both calls are announced before either finishes
+        assert [(type(e).__name__, e.tool_id) for e in events] == [
+            ("ToolExecutingEvent", "slow"),
+            ("ToolExecutingEvent", "fast"),
+            ("ToolResultEvent", "fast"),
+            ("ToolResultEvent", "slow"),
+        ]
+        results = memory.get_messages()[-1].content
+        assert isinstance(results, list)
+        assert [r.tool_use_id for r in results] == ["slow", "fast"]
+
 
 class TestReActAgentConfig:
     """Tests for ReAct agent configuration."""
@@ -1,6 +1,5 @@
 """Shared fixtures for integration tests."""
 
-import tempfile
 from pathlib import Path
 from typing import Any
 
@@ -64,10 +63,9 @@ class MockProvider(LLMProvider):
 
 
 @pytest.fixture
-def temp_dir() -> Path:
-    """Create temporary directory for tests."""
-    with tempfile.TemporaryDirectory() as d:
-        yield Path(d)
+def temp_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create temporary directory for tests under the session temp root."""
+    return tmp_path_factory.mktemp("miu")
 
 
 @pytest.fixture
@@ -186,3 +186,47 @@ class TestCoreCodeAgentIntegration:
         response = await agent.run("Read the test file")
         assert response.get_text() == "File content received"
         assert call_count[0] == 2
+
+    @pytest.mark.asyncio
+    async def test_agent_applies_edits_to_one_file_in_order(self, temp_dir: Path) -> None:
+        """Test two edits to the same file in one turn both land."""
+        test_file = temp_dir / "test.txt"
+        test_file.write_text("alpha\nbeta\n")
+        registry = ToolRegistry()
+        registry.register(EditTool())
+
+        class TwoEditProvider(LLMProvider):
+            name = "two-edits"
+            model = "test"
+            call_count = 0
+
+            async def complete(self, messages, tools=None, system=None, max_tokens=4096):
+                self.call_count += 1
+                if self.call_count == 1:
+                    return Response(
+                        id="resp-1",
+                        content=[
+                            ToolUseContent(
+                                id=f"t{i}",
+                                name="Edit",
+                                input={
+                                    "file_path": str(test_file),
+                                    "old_string": old,
+                                    "new_string": new,
+                                },
+                            )
+                            for i, (old, new) in enumerate([("alpha", "ALPHA"), ("beta", "BETA")])
+                        ],
+                        stop_reason="tool_use",
+                    )
+                return Response(
+                    id="resp-2",
+                    content=[TextContent(text="Done")],
+                    stop_reason="end_turn",
+                )
+
+        agent = ReActAgent(provider=TwoEditProvider(), tools=registry, working_dir=str(temp_dir))
+
+        await agent.run("Edit the file twice")
+
+        assert test_file.read_text() == "ALPHA\nBETA\n"
@@ -124,6 +124,36 @@ class TestCommandRegistry:
         all_cmds = list(registry)
         assert len(all_cmds) == 5
 
+    def test_lookup_precedence(self):
+        """Test aliases win over built-in names, which win over templates."""
+        registry = CommandRegistry()
+        registry.register(Command(name="help", content="Template help"))
+        registry.register(Command(name="q", content="Template q"))
+
+        assert registry.get("help") == registry.get_builtin("help")
+        assert registry.get("q") == registry.get_builtin("exit")
+        assert registry.get_template("q") is not None
+
+        registry.register_builtin(
+            BuiltinCommand(
+                name="quick", description="Quick", handler="_quick", aliases=frozenset(["/qk"])
+            )
+        )
+        assert registry.get("qk") == registry.get_builtin("quick")
+        assert "qk" in registry
+
+    def test_copy_is_independent(self):
+        """Test copy() shares commands but not registrations."""
+        registry = CommandRegistry()
+        registry.register(Command(name="test", content="Test"))
+        copied = registry.copy()
+        copied.register(Command(name="other", content="Other"))
+
+        assert copied.get("test") is registry.get("test")
+        assert copied.get_builtin("quit") is registry.get_builtin("quit")
+        assert "other" in copied
+        assert "other" not in registry
+
 
 class TestCommandExecutor:
     """Tests for CommandExecutor."""
@@ -146,6 +176,11 @@ class TestCommandExecutor:
         result = executor.parse("/help")
         assert result == ("help", "")
 
+    def test_parse_trims_whitespace(self, executor):
+        """Test parsing ignores whitespace around the name and args."""
+        assert executor.parse("/  cook   some args  \n") == ("cook", "some args")
+        assert executor.parse("/   ") is None
+
     def test_parse_not_command(self, executor):
         """Test parsing non-command returns None."""
         assert executor.parse("not a command") is None
@@ -1,7 +1,7 @@
 """Unit tests for help modal widget."""
 
 from miu_code.tui.widgets.help_modal import HelpModal, generate_help_markdown
-from miu_core.commands import CommandRegistry
+from miu_core.commands import Command, CommandRegistry
 
 
 class TestGenerateHelpMarkdown:
@@ -53,6 +53,17 @@ class TestGenerateHelpMarkdown:
         assert "Shift+Up/Down" in help_text
         assert "Enter" in help_text
 
+    def test_cached_until_registry_changes(self):
+        """Test output is reused until a command is registered."""
+        registry = CommandRegistry()
+        first = generate_help_markdown(registry)
+        assert generate_help_markdown(registry) is first
+
+        registry.register(Command(name="cook", content="Cook", description="Cook it"))
+        updated = generate_help_markdown(registry)
+        assert "/cook" in updated
+        assert updated is not first
+
 
 class TestHelpModal:
     """Tests for HelpModal widget."""